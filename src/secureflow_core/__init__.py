@@ -15,7 +15,7 @@ from .scanner import Scanner, ScanResult, Vulnerability
 from .azure import AzureDevOpsIntegration
 from .compliance import ComplianceChecker, ComplianceReport
 from .plugins import BasePlugin, PluginManager
-from .utils import Logger, SecurityMetrics
+from .utils import Logger, ScanCache, SecurityMetrics
 
 __all__ = [
     "SecureFlow",
@@ -32,5 +32,6 @@ __all__ = [
     "BasePlugin",
     "PluginManager",
     "Logger",
+    "ScanCache",
     "SecurityMetrics",
 ]
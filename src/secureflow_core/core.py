@@ -11,7 +11,7 @@ from .scanner import Scanner
 from .azure import AzureDevOpsIntegration
 from .compliance import ComplianceChecker
 from .plugins import PluginManager
-from .utils import Logger, SecurityMetrics
+from .utils import Logger, ScanCache, SecurityMetrics
 from .report import ReportGenerator
 
 
@@ -34,12 +34,27 @@ class SecureFlow:
         self.logger = Logger(__name__)
 
         # Initialize core components
-        self.scanner = Scanner(self.config.scanning)
+        scan_cache = ScanCache() if self.config.cache_enabled else None
+        self.scanner = Scanner(
+            self.config.scanning,
+            max_jobs=self.config.max_concurrent_scans,
+            scan_cache=scan_cache,
+            timeout=self.config.scan_timeout,
+        )
         self.azure = (
             AzureDevOpsIntegration(self.config.azure) if self.config.azure else None
         )
         self.compliance = ComplianceChecker(self.config.compliance)
-        self.plugins = PluginManager()
+        self.plugins = PluginManager(
+            max_workers=self.config.max_concurrent_scans,
+            plugin_timeout=self.config.scan_timeout,
+            # Plugin discovery is cached next to the scan cache, if enabled
+            manifest_cache_path=(
+                str(scan_cache.cache_dir / "plugin_manifest.json")
+                if scan_cache is not None
+                else None
+            ),
+        )
         self.metrics = SecurityMetrics()
         self.report = ReportGenerator(self.config)
 
@@ -55,42 +70,48 @@ class SecureFlow:
         Returns:
             Dictionary containing all scan results
         """
-        self.logger.info(f"Starting repository scan: {repo_path}")
-
-        results = {}
-
-        # Source code analysis (SAST)
-        if self.config.scanning.enable_sast:
-            self.logger.info("Running SAST scan...")
-            results["sast"] = await self.scanner.scan_source_code(repo_path)
-
-        # Dependency scanning (SCA)
-        if self.config.scanning.enable_sca:
-            self.logger.info("Running dependency scan...")
-            results["sca"] = await self.scanner.scan_dependencies(repo_path)
-
-        # Secret scanning
-        if self.config.scanning.enable_secrets:
-            self.logger.info("Running secret scan...")
-            results["secrets"] = await self.scanner.scan_secrets(repo_path)
-
-        # Infrastructure as Code scanning
-        if self.config.scanning.enable_iac:
-            self.logger.info("Running IaC scan...")
-            results["iac"] = await self.scanner.scan_infrastructure(repo_path)
+        self.logger.info("Starting repository scan: %s", repo_path)
+
+        scanning = self.config.scanning
+        scan_types = [
+            scan_type
+            for scan_type, enabled in (
+                ("sast", scanning.enable_sast),  # Source code analysis
+                ("sca", scanning.enable_sca),  # Dependency scanning
+                ("secrets", scanning.enable_secrets),  # Secret scanning
+                ("iac", scanning.enable_iac),  # Infrastructure as Code scanning
+            )
+            if enabled
+        ]
 
         # Container scanning (if Dockerfile present)
-        dockerfile_path = Path(repo_path) / "Dockerfile"
-        if dockerfile_path.exists() and self.config.scanning.enable_container:
-            self.logger.info("Running container scan...")
-            results["container"] = await self.scanner.scan_container(
-                str(dockerfile_path)
-            )
+        dockerfile_path = None
+        if scanning.enable_container:
+            candidate = Path(repo_path) / "Dockerfile"
+            # Keep the stat call off the event loop
+            if await asyncio.get_running_loop().run_in_executor(None, candidate.exists):
+                dockerfile_path = str(candidate)
+
+        # The scans are independent, so run them all at once; batch_scan also
+        # shares one Semgrep run between scan types configured to use it
+        scans = [self.scanner.batch_scan(repo_path, scan_types)]
+        if dockerfile_path is not None:
+            scans.append(self.scanner.scan_container(dockerfile_path))
+        batch_results, *container_results = await asyncio.gather(*scans)
+
+        results = dict(batch_results)
+        if container_results:
+            results["container"] = container_results[0]
 
         # Update metrics
         self.metrics.record_scan_completion(results)
 
-        self.logger.info("Repository scan completed")
+        # The scanner logs each individual scan; emit one summary record here
+        self.logger.info(
+            "Repository scan completed: %s (%s)",
+            repo_path,
+            ", ".join(results) or "no scans enabled",
+        )
         return results
 
     async def generate_security_report(
@@ -171,8 +192,8 @@ class SecureFlow:
         remediation_results = {}
 
         for scan_type, results in scan_results.items():
-            if hasattr(self.scanner, f"remediate_{scan_type}"):
-                remediate_func = getattr(self.scanner, f"remediate_{scan_type}")
+            remediate_func = self.scanner.get_remediator(scan_type)
+            if remediate_func:
                 remediation_results[scan_type] = await remediate_func(
                     results, auto_apply
                 )
@@ -2,18 +2,36 @@
 Plugin system for SecureFlow
 """
 
+import ast
 import asyncio
 import importlib
 import inspect
+import json
+import os
+import sys
 import importlib.util
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 from pathlib import Path
 from datetime import datetime
 
 from .utils import Logger
 from .scanner import ScanResult
 
+# Maximum number of plugin initializations/cleanups awaited at once
+INIT_CONCURRENCY = 16
+CLEANUP_CONCURRENCY = 32
+
 
 class BasePlugin(ABC):
     """Base class for all SecureFlow plugins"""
@@ -152,8 +170,28 @@ class IntegrationPlugin(BasePlugin):
 class PluginManager:
     """Manages plugin loading, registration, and execution"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        plugin_timeout: Optional[float] = None,
+        manifest_cache_path: Optional[str] = None,
+    ):
+        """
+        Initialize the plugin manager.
+
+        Args:
+            max_workers: Maximum number of scanner plugins run concurrently.
+                Defaults to min(32, cpu_count * 4).
+            plugin_timeout: Per-plugin scan timeout in seconds (None for no limit)
+            manifest_cache_path: Plugin discovery cache file
+                (discovery isn't cached if None)
+        """
         self.logger = Logger(__name__)
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.plugin_timeout = plugin_timeout
+        self.manifest_cache_path = (
+            Path(manifest_cache_path) if manifest_cache_path else None
+        )
         self.plugins: Dict[str, BasePlugin] = {}
         self.plugin_types: Dict[str, List[BasePlugin]] = {
             "scanner": [],
@@ -178,6 +216,7 @@ class PluginManager:
                 self.logger.warning(
                     f"Plugin {plugin_name} already registered, replacing"
                 )
+                self._remove_from_type_lists(self.plugins[plugin_name])
 
             self.plugins[plugin_name] = plugin
 
@@ -213,9 +252,7 @@ class PluginManager:
         plugin = self.plugins[plugin_name]
 
         # Remove from type categories
-        for plugin_list in self.plugin_types.values():
-            if plugin in plugin_list:
-                plugin_list.remove(plugin)
+        self._remove_from_type_lists(plugin)
 
         # Clean up plugin
         asyncio.create_task(plugin.cleanup())
@@ -224,6 +261,12 @@ class PluginManager:
         self.logger.info(f"Unregistered plugin: {plugin_name}")
         return True
 
+    def _remove_from_type_lists(self, plugin: BasePlugin):
+        """Remove a plugin instance from the type categories."""
+        for plugin_list in self.plugin_types.values():
+            if plugin in plugin_list:
+                plugin_list.remove(plugin)
+
     def get_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
         """Get plugin by name."""
         return self.plugins.get(plugin_name)
@@ -234,6 +277,7 @@ class PluginManager:
 
     def list_plugins(self) -> Dict[str, Dict[str, Any]]:
         """List all registered plugins."""
+        # Built on each call so changes to a plugin's info are never stale
         return {name: plugin.get_info() for name, plugin in self.plugins.items()}
 
     async def load_plugins_from_directory(self, directory: str) -> int:
@@ -252,49 +296,192 @@ class PluginManager:
             return 0
 
         loaded_count = 0
+        manifest = self._load_manifest_cache()
 
         for plugin_file in plugins_dir.glob("*.py"):
             if plugin_file.name.startswith("__"):
                 continue
 
+            cache_key = str(plugin_file.resolve())
             try:
-                loaded_count += await self._load_plugin_file(plugin_file)
+                mtime = plugin_file.stat().st_mtime
+
+                # Unchanged files reuse the plugin class names found last time
+                cached = manifest.get(cache_key)
+                class_names = (
+                    cached["classes"]
+                    if cached and cached.get("mtime") == mtime
+                    else None
+                )
+
+                try:
+                    count, class_names = await self._load_plugin_file(
+                        plugin_file, class_names
+                    )
+                except Exception as e:
+                    if class_names is None:
+                        raise
+                    # Don't let a stale cache entry keep failing; rediscover
+                    # the file's plugins without it
+                    self.logger.warning(
+                        "Cached load of %s failed, retrying: %s", plugin_file, e
+                    )
+                    manifest.pop(cache_key, None)
+                    count, class_names = await self._load_plugin_file(
+                        plugin_file, lazy=False
+                    )
+                loaded_count += count
+                manifest[cache_key] = {"mtime": mtime, "classes": class_names}
             except Exception as e:
-                self.logger.error(f"Failed to load plugin file {plugin_file}: {str(e)}")
+                manifest.pop(cache_key, None)
+                self.logger.error("Failed to load plugin file %s: %s", plugin_file, e)
+
+        self._save_manifest_cache(manifest)
 
-        self.logger.info(f"Loaded {loaded_count} plugins from {directory}")
+        self.logger.info("Loaded %d plugins from %s", loaded_count, directory)
         return loaded_count
 
-    async def _load_plugin_file(self, plugin_file: Path) -> int:
-        """Load plugins from a Python file."""
-        module_name = plugin_file.stem
+    async def _load_plugin_file(
+        self,
+        plugin_file: Path,
+        class_names: Optional[List[str]] = None,
+        lazy: bool = True,
+    ) -> Tuple[int, List[str]]:
+        """
+        Load plugins from a Python file.
+
+        Args:
+            plugin_file: Plugin source file
+            class_names: Known plugin class names (skips discovery if given)
+            lazy: Load lazily when the plugin class names are known; if False,
+                run the module and discover its plugins eagerly
+
+        Returns:
+            Tuple of (number of plugins loaded, plugin class names found)
+        """
+        # A name of its own, so a plugin file named like an imported module
+        # (json.py, say) doesn't collide with it in sys.modules
+        module_name = f"secureflow_plugins.{plugin_file.stem}"
         spec = importlib.util.spec_from_file_location(module_name, plugin_file)
 
         if spec is None or spec.loader is None:
-            self.logger.error(f"Could not load spec for {plugin_file}")
-            return 0
-
+            self.logger.error("Could not load spec for %s", plugin_file)
+            return 0, []
+
+        if not lazy:
+            plugin_names = None
+        elif class_names is not None:
+            plugin_names = class_names
+        else:
+            plugin_names = self._read_plugin_manifest(plugin_file)
+
+        if plugin_names is not None:
+            # Files with known plugin names are loaded lazily; the module body
+            # only runs once one of the listed classes is looked up.
+            spec.loader = importlib.util.LazyLoader(spec.loader)
+
+        # Registered before it runs, as the import system does; the lazy
+        # loader checks the module it finishes loading is still this one
         module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+            if plugin_names is not None:
+                candidates = [
+                    (name, getattr(module, name, None)) for name in plugin_names
+                ]
+            else:
+                candidates = inspect.getmembers(module)
+        except Exception:
+            sys.modules.pop(module_name, None)
+            raise
 
         loaded_count = 0
+        found_names = []
 
         # Look for plugin classes in the module
-        for name, obj in inspect.getmembers(module):
+        for name, obj in candidates:
             if (
                 inspect.isclass(obj)
                 and issubclass(obj, BasePlugin)
                 and obj != BasePlugin
             ):
+                found_names.append(name)
 
                 try:
                     plugin_instance = obj()
                     if self.register_plugin(plugin_instance):
                         loaded_count += 1
                 except Exception as e:
-                    self.logger.error(f"Failed to instantiate plugin {name}: {str(e)}")
+                    self.logger.error("Failed to instantiate plugin %s: %s", name, e)
+            elif plugin_names is not None:
+                self.logger.warning(
+                    "Plugin class %s listed in %s not found", name, plugin_file
+                )
 
-        return loaded_count
+        return loaded_count, found_names
+
+    def _load_manifest_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the plugin discovery cache, ignoring missing or corrupt files."""
+        if self.manifest_cache_path is None:
+            return {}
+
+        try:
+            with open(self.manifest_cache_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _save_manifest_cache(self, manifest: Dict[str, Dict[str, Any]]):
+        """Atomically write the plugin discovery cache."""
+        if self.manifest_cache_path is None:
+            return
+
+        try:
+            self.manifest_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, self.manifest_cache_path)
+        except OSError as e:
+            self.logger.warning(f"Failed to save plugin manifest cache: {str(e)}")
+
+    @staticmethod
+    def _read_plugin_manifest(plugin_file: Path) -> Optional[List[str]]:
+        """
+        Read the __plugins__ manifest from a plugin file without executing it.
+
+        Args:
+            plugin_file: Plugin source file
+
+        Returns:
+            List of plugin class names, or None if the file has no manifest
+        """
+        try:
+            tree = ast.parse(plugin_file.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, ValueError):
+            return None
+
+        for node in tree.body:
+            if (
+                isinstance(node, ast.Assign)
+                and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id == "__plugins__"
+            ):
+                try:
+                    names = ast.literal_eval(node.value)
+                except ValueError:
+                    return None
+                if isinstance(names, (list, tuple)) and all(
+                    isinstance(name, str) for name in names
+                ):
+                    return list(names)
+                return None
+
+        return None
 
     async def initialize_all_plugins(self, config: Dict[str, Any]) -> int:
         """
@@ -306,20 +493,30 @@ class PluginManager:
         Returns:
             Number of successfully initialized plugins
         """
-        initialized_count = 0
-
-        for plugin_name, plugin in self.plugins.items():
-            try:
-                plugin_config = config.get("plugins", {}).get(plugin_name, {})
+        plugin_configs = config.get("plugins", {})
+        plugin_items = list(self.plugins.items())
+
+        # Plugins set up independent resources, so initialize them concurrently
+        results = await _gather_bounded(
+            (
+                plugin.initialize(plugin_configs.get(plugin_name, {}))
+                for plugin_name, plugin in plugin_items
+            ),
+            INIT_CONCURRENCY,
+        )
 
-                if await plugin.initialize(plugin_config):
-                    initialized_count += 1
-                    self.logger.info(f"Initialized plugin: {plugin_name}")
-                else:
-                    self.logger.warning(f"Failed to initialize plugin: {plugin_name}")
+        initialized_count = 0
 
-            except Exception as e:
-                self.logger.error(f"Error initializing plugin {plugin_name}: {str(e)}")
+        for (plugin_name, _), result in zip(plugin_items, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    f"Error initializing plugin {plugin_name}: {str(result)}"
+                )
+            elif result:
+                initialized_count += 1
+                self.logger.info(f"Initialized plugin: {plugin_name}")
+            else:
+                self.logger.warning(f"Failed to initialize plugin: {plugin_name}")
 
         self.logger.info(f"Initialized {initialized_count}/{len(self.plugins)} plugins")
         return initialized_count
@@ -337,6 +534,23 @@ class PluginManager:
         Returns:
             List of scan results
         """
+        return [
+            result async for result in self.iter_scanner_plugins(target, plugin_names)
+        ]
+
+    async def iter_scanner_plugins(
+        self, target: str, plugin_names: Optional[List[str]] = None
+    ) -> AsyncIterator[ScanResult]:
+        """
+        Execute scanner plugins on target, yielding results as they complete.
+
+        Args:
+            target: Target to scan
+            plugin_names: Specific plugins to run (None for all)
+
+        Yields:
+            Scan results in completion order
+        """
         scanner_plugins = self.get_plugins_by_type("scanner")
 
         if plugin_names:
@@ -347,34 +561,47 @@ class PluginManager:
 
         self.logger.info(f"Running {len(suitable_plugins)} scanner plugins on {target}")
 
-        results = []
-        tasks = []
+        if not suitable_plugins:
+            return
 
+        queue: asyncio.Queue = asyncio.Queue()
         for plugin in suitable_plugins:
-            task = asyncio.create_task(self._execute_scanner_plugin(plugin, target))
-            tasks.append(task)
+            queue.put_nowait(plugin)
 
-        # Wait for all scanner plugins to complete
-        scanner_results = await asyncio.gather(*tasks, return_exceptions=True)
+        completed: asyncio.Queue = asyncio.Queue()
 
-        for i, result in enumerate(scanner_results):
-            if isinstance(result, Exception):
-                self.logger.error(
-                    f"Scanner plugin {suitable_plugins[i].name} failed: {str(result)}"
-                )
-            elif result:
-                results.append(result)
+        async def worker():
+            while not queue.empty():
+                plugin = queue.get_nowait()
+                completed.put_nowait(await self._execute_scanner_plugin(plugin, target))
+
+        # A fixed pool of workers bounds the number of plugins in flight
+        worker_count = min(len(suitable_plugins), self.max_workers)
+        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
 
-        return results
+        try:
+            for _ in range(len(suitable_plugins)):
+                result = await completed.get()
+                if result:
+                    yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
     async def _execute_scanner_plugin(
         self, plugin: ScannerPlugin, target: str
     ) -> Optional[ScanResult]:
         """Execute a single scanner plugin."""
         try:
-            self.logger.debug(f"Executing scanner plugin: {plugin.name}")
-            result = await plugin.scan(target)
+            self.logger.debug("Executing scanner plugin: %s", plugin.name)
+            result = await asyncio.wait_for(plugin.scan(target), self.plugin_timeout)
             return result
+        except asyncio.TimeoutError:
+            self.logger.error(
+                f"Scanner plugin {plugin.name} timed out after {self.plugin_timeout}s"
+            )
+            return None
         except Exception as e:
             self.logger.error(
                 f"Scanner plugin {plugin.name} execution failed: {str(e)}"
@@ -383,16 +610,34 @@ class PluginManager:
 
     async def cleanup_all_plugins(self):
         """Clean up all plugins."""
-        cleanup_tasks = []
+        await _gather_bounded(
+            (plugin.cleanup() for plugin in self.plugins.values()),
+            CLEANUP_CONCURRENCY,
+        )
 
-        for plugin in self.plugins.values():
-            task = asyncio.create_task(plugin.cleanup())
-            cleanup_tasks.append(task)
+        self.logger.info("Cleaned up all plugins")
 
-        if cleanup_tasks:
-            await asyncio.gather(*cleanup_tasks, return_exceptions=True)
 
-        self.logger.info("Cleaned up all plugins")
+async def _gather_bounded(coros: Iterable[Awaitable], limit: int) -> List[Any]:
+    """
+    Await coroutines concurrently with at most ``limit`` running at once.
+
+    Args:
+        coros: Coroutines to run
+        limit: Maximum number of coroutines in flight
+
+    Returns:
+        Results in input order; exceptions are returned, not raised
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def guarded(coro: Awaitable) -> Any:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(
+        *(guarded(coro) for coro in coros), return_exceptions=True
+    )
 
 
 # Example Plugin Implementations
@@ -4,141 +4,62 @@ Report generation module for SecureFlow
 
 import asyncio
 import json
-from typing import Dict, Any, Optional
+import threading
+from collections import Counter
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence
 from pathlib import Path
 from datetime import datetime
 import jinja2
-from jinja2 import Environment, FileSystemLoader, BaseLoader
+from jinja2 import (
+    Environment,
+    FileSystemLoader,
+    BaseLoader,
+    FileSystemBytecodeCache,
+    select_autoescape,
+)
+from jinja2.environment import TemplateStream
 
 from .utils import Logger
 
-
-class ReportGenerator:
-    """Main report generator for security scan results"""
-
-    def __init__(self, config):
-        self.config = config
-        self.logger = Logger(__name__)
-        self.template_env = self._setup_template_environment()
-
-    def _setup_template_environment(self) -> Environment:
-        """Set up Jinja2 template environment"""
-        # Use a DictLoader with built-in templates
-        templates = {
-            "security_report.html": self._get_html_template(),
-            "security_report.md": self._get_markdown_template(),
-            "compliance_report.html": self._get_compliance_html_template(),
-        }
-
-        loader = jinja2.DictLoader(templates)
-        env = Environment(loader=loader, autoescape=True)
-
-        # Add custom filters
-        env.filters["severity_color"] = self._severity_color_filter
-        env.filters["format_datetime"] = self._format_datetime_filter
-
-        return env
-
-    async def generate_comprehensive_report(
-        self, scan_results: Dict[str, Any], output_path: Optional[str] = None
-    ) -> str:
-        """
-        Generate comprehensive security report from scan results.
-
-        Args:
-            scan_results: Security scan results
-            output_path: Optional output path
-
-        Returns:
-            Path to generated report
-        """
-        self.logger.info("Generating comprehensive security report")
-
-        # Prepare report data
-        report_data = self._prepare_report_data(scan_results)
-
-        # Determine output format and path
-        if not output_path:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = f"security_report_{timestamp}.html"
-
-        output_format = Path(output_path).suffix.lower()
-
-        if output_format == ".html":
-            content = await self._generate_html_report(report_data)
-        elif output_format == ".md":
-            content = await self._generate_markdown_report(report_data)
-        elif output_format == ".json":
-            content = json.dumps(report_data, indent=2)
-        else:
-            raise ValueError(f"Unsupported report format: {output_format}")
-
-        # Write report to file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        self.logger.info(f"Generated security report: {output_path}")
-        return output_path
-
-    def _prepare_report_data(self, scan_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare data for report generation"""
-        total_vulnerabilities = 0
-        severity_counts = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0, "INFO": 0}
-        scan_summary = {}
-
-        for scan_type, result in scan_results.items():
-            if isinstance(result, dict):
-                vulnerabilities = result.get("vulnerabilities", [])
-                total_vulnerabilities += len(vulnerabilities)
-
-                scan_severity_counts = {
-                    "CRITICAL": 0,
-                    "HIGH": 0,
-                    "MEDIUM": 0,
-                    "LOW": 0,
-                    "INFO": 0,
-                }
-
-                for vuln in vulnerabilities:
-                    severity = vuln.get("severity", "INFO")
-                    if severity in severity_counts:
-                        severity_counts[severity] += 1
-                        scan_severity_counts[severity] += 1
-
-                scan_summary[scan_type] = {
-                    "tool": result.get("tool", scan_type),
-                    "total_vulnerabilities": len(vulnerabilities),
-                    "severity_counts": scan_severity_counts,
-                    "scan_duration": result.get("scan_duration", 0),
-                    "target": result.get("target", "Unknown"),
-                }
-
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "summary": {
-                "total_vulnerabilities": total_vulnerabilities,
-                "severity_counts": severity_counts,
-                "scan_types": list(scan_results.keys()),
-                "scans_completed": len(scan_results),
-            },
-            "scan_results": scan_results,
-            "scan_summary": scan_summary,
-            "metadata": {"generator": "SecureFlow", "version": "1.0.0"},
-        }
-
-    async def _generate_html_report(self, report_data: Dict[str, Any]) -> str:
-        """Generate HTML report"""
-        template = self.template_env.get_template("security_report.html")
-        return template.render(**report_data)
-
-    async def _generate_markdown_report(self, report_data: Dict[str, Any]) -> str:
-        """Generate Markdown report"""
-        template = self.template_env.get_template("security_report.md")
-        return template.render(**report_data)
-
-    def _get_html_template(self) -> str:
-        """Get HTML report template"""
-        return """
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional, only needed for .msgpack reports
+    msgpack = None
+
+REPORT_FORMATS = (".html", ".md", ".json", ".msgpack")
+SEVERITY_LEVELS = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO")
+SEVERITY_CSS_CLASSES = {severity: severity.lower() for severity in SEVERITY_LEVELS}
+SEVERITY_COLORS = {
+    "CRITICAL": "#e74c3c",
+    "HIGH": "#f39c12",
+    "MEDIUM": "#f1c40f",
+    "LOW": "#3498db",
+    "INFO": "#95a5a6",
+}
+
+# Canonical severity for the values external scanners report
+_SEVERITY_MAP = {
+    **{severity: severity for severity in SEVERITY_LEVELS},
+    "WARNING": "MEDIUM",
+    "ERROR": "HIGH",
+}
+
+# Number of rendered template chunks grouped into each file write
+STREAM_BUFFER_SIZE = 64
+
+# Bytecode cache entries are keyed on template source only; bump this when
+# environment options that change the compiled code (e.g. autoescape) change
+_TEMPLATE_CACHE_VERSION = 2
+
+# HTML report template
+_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -191,7 +112,7 @@ class ReportGenerator:
     <div class="container">
         <div class="header">
             <h1>🔍 Security Report</h1>
-            <div class="subtitle">Generated by SecureFlow on {{ timestamp | format_datetime }}</div>
+            <div class="subtitle">Generated by SecureFlow on {{ timestamp_display }}</div>
         </div>
         
         <div class="summary-cards">
@@ -238,17 +159,17 @@ class ReportGenerator:
         <div class="scan-results">
             <h2>Detailed Scan Results</h2>
             
-            {% for scan_type, result in scan_results.items() %}
+            {% for scan_type, scan, vulnerabilities in scans %}
             <div class="scan-type">
                 <div class="scan-type-header">
                     <h3>{{ scan_type.upper() }} Scan Results</h3>
-                    <div>Tool: {{ result.tool }} | Target: {{ result.target }} | Duration: {{ "%.2f"|format(result.scan_duration) }}s</div>
+                    <div>Tool: {{ scan.tool }} | Target: {{ scan.target }} | Duration: {{ scan.duration_display }}s</div>
                 </div>
                 
                 <div class="vulnerabilities">
-                    {% if result.vulnerabilities %}
-                        {% for vuln in result.vulnerabilities %}
-                        <div class="vulnerability {{ vuln.severity.lower() }}">
+                    {% if vulnerabilities %}
+                        {% for vuln in vulnerabilities %}
+                        <div class="vulnerability {{ vuln.severity|severity_class }}">
                             <h4>{{ vuln.title }}</h4>
                             <div class="meta">
                                 <strong>Severity:</strong> {{ vuln.severity }}
@@ -282,12 +203,11 @@ class ReportGenerator:
 </html>
         """
 
-    def _get_markdown_template(self) -> str:
-        """Get Markdown report template"""
-        return """
+# Markdown report template
+_MD_TEMPLATE = """
 # 🔍 SecureFlow Security Report
 
-**Generated:** {{ timestamp | format_datetime }}  
+**Generated:** {{ timestamp_display }}  
 **Generator:** SecureFlow v{{ metadata.version }}
 
 ## Executive Summary
@@ -310,16 +230,16 @@ class ReportGenerator:
 
 ## Detailed Results
 
-{% for scan_type, result in scan_results.items() %}
+{% for scan_type, scan, vulnerabilities in scans %}
 ### {{ scan_type.upper() }} Scan
 
-**Tool:** {{ result.tool }}  
-**Target:** {{ result.target }}  
-**Duration:** {{ "%.2f"|format(result.scan_duration) }} seconds  
-**Vulnerabilities Found:** {{ result.vulnerabilities | length }}
+**Tool:** {{ scan.tool }}  
+**Target:** {{ scan.target }}  
+**Duration:** {{ scan.duration_display }} seconds  
+**Vulnerabilities Found:** {{ scan.total_vulnerabilities }}
 
-{% if result.vulnerabilities %}
-{% for vuln in result.vulnerabilities %}
+{% if vulnerabilities %}
+{% for vuln in vulnerabilities %}
 #### {{ vuln.severity }} - {{ vuln.title }}
 
 - **Description:** {{ vuln.description }}
@@ -355,9 +275,8 @@ class ReportGenerator:
 *This report was automatically generated by SecureFlow. For questions or support, please contact your security team.*
         """
 
-    def _get_compliance_html_template(self) -> str:
-        """Get compliance report HTML template"""
-        return """
+# Compliance report HTML template
+_COMPLIANCE_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -387,24 +306,347 @@ class ReportGenerator:
 </html>
         """
 
-    def _severity_color_filter(self, severity: str) -> str:
-        """Jinja2 filter for severity colors"""
-        colors = {
-            "CRITICAL": "#e74c3c",
-            "HIGH": "#f39c12",
-            "MEDIUM": "#f1c40f",
-            "LOW": "#3498db",
-            "INFO": "#95a5a6",
+
+@dataclass
+class ScanSummary:
+    """Per-scan figures shown in the detailed results section"""
+
+    __slots__ = (
+        "tool",
+        "total_vulnerabilities",
+        "severity_counts",
+        "scan_duration",
+        "duration_display",
+        "target",
+    )
+
+    tool: str
+    total_vulnerabilities: int
+    severity_counts: Dict[str, int]
+    scan_duration: float
+    duration_display: str
+    target: str
+
+
+def _encode_default(obj: Any) -> Dict[str, Any]:
+    """Encode report records that the JSON and MessagePack encoders don't know"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+_template_env: Optional[Environment] = None
+_template_env_lock = threading.Lock()
+
+
+def _get_template_environment() -> Environment:
+    """Get the Jinja2 environment shared by all report generators"""
+    global _template_env
+
+    if _template_env is None:
+        with _template_env_lock:
+            if _template_env is None:
+                _template_env = _setup_template_environment()
+
+    return _template_env
+
+
+def _setup_template_environment() -> Environment:
+    """Set up Jinja2 template environment"""
+    # Use a DictLoader with built-in templates
+    templates = {
+        "security_report.html": _HTML_TEMPLATE,
+        "security_report.md": _MD_TEMPLATE,
+        "compliance_report.html": _COMPLIANCE_HTML_TEMPLATE,
+    }
+
+    loader = jinja2.DictLoader(templates)
+    env = Environment(
+        loader=loader,
+        # Only HTML output needs escaping; Markdown is rendered verbatim
+        autoescape=select_autoescape(
+            enabled_extensions=("html",), default_for_string=True
+        ),
+        bytecode_cache=_create_bytecode_cache(),
+    )
+
+    # Add custom filters
+    env.filters["format_datetime"] = ReportGenerator._format_datetime_filter
+    env.filters["severity_class"] = _severity_css_class
+    env.filters["severity_color"] = _severity_color
+
+    return env
+
+
+def _create_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Create an on-disk cache of compiled templates shared across runs"""
+    try:
+        # The default directory is a per-user temp dir that Jinja checks
+        # for safe ownership and permissions before loading code from it
+        return FileSystemBytecodeCache(
+            pattern=f"secureflow_v{_TEMPLATE_CACHE_VERSION}_%s.cache"
+        )
+    except (OSError, RuntimeError) as e:
+        Logger(__name__).debug("Template bytecode cache disabled: %s", e)
+        return None
+
+
+def _normalize_severity(severity: Any) -> str:
+    """Map a scanner-reported severity onto SEVERITY_LEVELS (INFO if unknown)"""
+    if not isinstance(severity, str):
+        return "INFO"
+    return _SEVERITY_MAP.get(severity) or _SEVERITY_MAP.get(severity.upper(), "INFO")
+
+
+def _severity_css_class(severity: Any) -> str:
+    """CSS class for a scanner-reported severity, styled as INFO if unknown"""
+    return SEVERITY_CSS_CLASSES[_normalize_severity(severity)]
+
+
+def _severity_color(severity: Any) -> str:
+    """Color for a scanner-reported severity, INFO's gray if unknown"""
+    return SEVERITY_COLORS[_normalize_severity(severity)]
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(timestamp: str) -> str:
+    """Format an ISO timestamp for display; reports reuse few distinct values"""
+    if "T" in timestamp:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    else:
+        dt = datetime.fromisoformat(timestamp)
+    return dt.strftime("%B %d, %Y at %I:%M %p")
+
+
+class ReportGenerator:
+    """Main report generator for security scan results"""
+
+    def __init__(self, config):
+        self.config = config
+        self.logger = Logger(__name__)
+        self.template_env = _get_template_environment()
+
+        # Templates are compiled once per process and cached by the environment
+        self._html_template = self.template_env.get_template("security_report.html")
+        self._md_template = self.template_env.get_template("security_report.md")
+        self._compliance_template = self.template_env.get_template(
+            "compliance_report.html"
+        )
+
+    async def generate_comprehensive_report(
+        self, scan_results: Dict[str, Any], output_path: Optional[str] = None
+    ) -> str:
+        """
+        Generate comprehensive security report from scan results.
+
+        Args:
+            scan_results: Security scan results
+            output_path: Optional output path
+
+        Returns:
+            Path to generated report
+        """
+        self.logger.info("Generating comprehensive security report")
+
+        # One timestamp per report, shared by the file name and the contents
+        now = datetime.now()
+        report_data = self._prepare_report_data(scan_results, now=now)
+
+        # Determine output format and path
+        if not output_path:
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            output_path = f"security_report_{timestamp}.html"
+
+        await self._write_report(report_data, output_path)
+
+        self.logger.info(f"Generated security report: {output_path}")
+        return output_path
+
+    async def generate_all(
+        self,
+        scan_results: Dict[str, Any],
+        formats: Sequence[str] = ("html", "md", "json"),
+        output_base: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Generate the same security report in several formats at once.
+
+        Args:
+            scan_results: Security scan results
+            formats: Report formats to write (file extensions without the dot)
+            output_base: Output path without extension
+
+        Returns:
+            Paths to generated reports, in the order of formats
+        """
+        self.logger.info(f"Generating security reports: {', '.join(formats)}")
+
+        unsupported = [fmt for fmt in formats if f".{fmt}" not in REPORT_FORMATS]
+        if unsupported:
+            raise ValueError(f"Unsupported report format: {', '.join(unsupported)}")
+
+        # Prepare report data once and share it across all formats
+        now = datetime.now()
+        report_data = self._prepare_report_data(scan_results, now=now)
+
+        if not output_base:
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            output_base = f"security_report_{timestamp}"
+
+        output_paths = [f"{output_base}.{fmt}" for fmt in formats]
+        await asyncio.gather(
+            *(self._write_report(report_data, path) for path in output_paths)
+        )
+
+        self.logger.info(f"Generated security reports: {', '.join(output_paths)}")
+        return output_paths
+
+    async def _write_report(self, report_data: Dict[str, Any], output_path: str):
+        """Render report data in the format given by the output path suffix"""
+        output_format = Path(output_path).suffix.lower()
+
+        # Template streams are lazy, so rendering happens alongside the file
+        # write in the default executor and never blocks the event loop
+        loop = asyncio.get_running_loop()
+
+        if output_format == ".html":
+            render_context = self._prepare_render_context(report_data)
+            stream = await self._generate_html_report(render_context)
+            await loop.run_in_executor(None, self._write_stream, output_path, stream)
+        elif output_format == ".md":
+            render_context = self._prepare_render_context(report_data)
+            stream = await self._generate_markdown_report(render_context)
+            await loop.run_in_executor(None, self._write_stream, output_path, stream)
+        elif output_format == ".json":
+            await loop.run_in_executor(None, self._write_json, output_path, report_data)
+        elif output_format == ".msgpack":
+            await loop.run_in_executor(
+                None, self._write_msgpack, output_path, report_data
+            )
+        else:
+            raise ValueError(f"Unsupported report format: {output_format}")
+
+    def _prepare_report_data(
+        self, scan_results: Dict[str, Any], now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Prepare data for report generation"""
+        if now is None:
+            now = datetime.now()
+
+        total_vulnerabilities = 0
+        severity_totals = Counter()
+        scan_summary = {}
+
+        for scan_type, result in scan_results.items():
+            if isinstance(result, dict):
+                vulnerabilities = result.get("vulnerabilities", [])
+                total_vulnerabilities += len(vulnerabilities)
+
+                scan_counter = Counter(
+                    _normalize_severity(vuln.get("severity", "INFO"))
+                    for vuln in vulnerabilities
+                )
+                severity_totals.update(scan_counter)
+                scan_duration = result.get("scan_duration", 0)
+
+                scan_summary[scan_type] = ScanSummary(
+                    tool=result.get("tool", scan_type),
+                    total_vulnerabilities=len(vulnerabilities),
+                    severity_counts={
+                        severity: scan_counter[severity] for severity in SEVERITY_LEVELS
+                    },
+                    scan_duration=scan_duration,
+                    duration_display=f"{scan_duration:.2f}",
+                    target=result.get("target", "Unknown"),
+                )
+
+        severity_counts = {
+            severity: severity_totals[severity] for severity in SEVERITY_LEVELS
+        }
+
+        return {
+            "timestamp": now.isoformat(),
+            "timestamp_display": now.strftime("%B %d, %Y at %I:%M %p"),
+            "summary": {
+                "total_vulnerabilities": total_vulnerabilities,
+                "severity_counts": severity_counts,
+                "scan_types": list(scan_results.keys()),
+                "scans_completed": len(scan_results),
+            },
+            "scan_results": scan_results,
+            "scan_summary": scan_summary,
+            "metadata": {"generator": "SecureFlow", "version": "1.0.0"},
         }
-        return colors.get(severity.upper(), "#95a5a6")
 
-    def _format_datetime_filter(self, timestamp: str) -> str:
+    def _prepare_render_context(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Select what the HTML and Markdown templates need from report data"""
+        scan_results = report_data["scan_results"]
+
+        # One (scan_type, summary, vulnerabilities) entry per scan, so the
+        # templates don't walk the raw results and the summaries side by side
+        scans = [
+            (scan_type, summary, scan_results[scan_type].get("vulnerabilities", []))
+            for scan_type, summary in report_data["scan_summary"].items()
+        ]
+
+        return {
+            "timestamp_display": report_data["timestamp_display"],
+            "summary": report_data["summary"],
+            "scans": scans,
+            "metadata": report_data["metadata"],
+        }
+
+    def _write_stream(self, output_path: str, stream: TemplateStream):
+        """Render a template stream to file chunk by chunk"""
+        stream.enable_buffering(STREAM_BUFFER_SIZE)
+        stream.dump(output_path, encoding="utf-8")
+
+    def _write_json(self, output_path: str, report_data: Dict[str, Any]):
+        """Write report data as indented JSON, using orjson when available"""
+        if orjson is not None:
+            with open(output_path, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        report_data,
+                        default=_encode_default,
+                        option=orjson.OPT_INDENT_2,
+                    )
+                )
+        else:
+            # json.dump encodes chunk by chunk instead of building one string
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(report_data, f, indent=2, default=_encode_default)
+
+    def _write_msgpack(self, output_path: str, report_data: Dict[str, Any]):
+        """Write report data as MessagePack for machine consumers"""
+        if msgpack is None:
+            raise ValueError("MessagePack reports require the msgpack package")
+
+        with open(output_path, "wb") as f:
+            f.write(
+                msgpack.packb(report_data, use_bin_type=True, default=_encode_default)
+            )
+
+    async def _generate_html_report(
+        self, report_data: Dict[str, Any]
+    ) -> TemplateStream:
+        """Generate HTML report as a lazily rendered stream"""
+        return self._html_template.stream(**report_data)
+
+    async def _generate_markdown_report(
+        self, report_data: Dict[str, Any]
+    ) -> TemplateStream:
+        """Generate Markdown report as a lazily rendered stream"""
+        return self._md_template.stream(**report_data)
+
+    @staticmethod
+    def _format_datetime_filter(timestamp: str) -> str:
         """Jinja2 filter for datetime formatting"""
+        # Placeholders and non-string values can never parse as a timestamp
+        if not isinstance(timestamp, str) or len(timestamp) < 8:
+            return timestamp
+
         try:
-            if "T" in timestamp:
-                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            else:
-                dt = datetime.fromisoformat(timestamp)
-            return dt.strftime("%B %d, %Y at %I:%M %p")
-        except:
+            return _format_timestamp(timestamp)
+        except ValueError:
             return timestamp
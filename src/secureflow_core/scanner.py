@@ -3,17 +3,205 @@ Security scanning engine for SecureFlow
 """
 
 import asyncio
+import atexit
+import fnmatch
+import inspect
 import json
+import multiprocessing
+import os
+import shutil
+import signal
 import subprocess
+import sys
 import tempfile
-from typing import Dict, Any, List, Optional, Union
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 from pathlib import Path
+from types import MappingProxyType
 from dataclasses import dataclass
 from enum import Enum
+from importlib.metadata import PackageNotFoundError, version as package_version
 import semver
 
 from .config import ScanningConfig
-from .utils import Logger
+from .utils import Logger, ScanCache
+
+try:
+    from bandit.core import config as bandit_config
+    from bandit.core import manager as bandit_manager
+except ImportError:  # Optional, fall back to the bandit CLI
+    bandit_manager = None
+
+try:
+    import ijson
+except ImportError:  # Optional, scanner output is parsed in one piece instead
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib decoder
+    orjson = None
+
+try:
+    from detect_secrets import SecretsCollection
+    from detect_secrets.settings import default_settings
+except ImportError:  # Optional, fall back to the detect-secrets CLI
+    SecretsCollection = None
+
+
+# Public Scanner method that runs each scan type
+SCAN_METHODS = {
+    "sast": "scan_source_code",
+    "sca": "scan_dependencies",
+    "secrets": "scan_secrets",
+    "iac": "scan_infrastructure",
+    "container": "scan_container",
+}
+
+
+# Scanner method that runs each supported tool, by scan type; method names
+# rather than bound methods so no per-instance table has to be built
+_SCAN_DISPATCH = MappingProxyType(
+    {
+        scan_type: MappingProxyType(tools)
+        for scan_type, tools in {
+            "sast": {
+                "semgrep": "_run_semgrep",
+                "bandit": "_run_bandit",
+                "sonarqube": "_run_sonarqube",
+            },
+            "sca": {
+                "safety": "_run_safety",
+                "pip-audit": "_run_pip_audit",
+                "npm-audit": "_run_npm_audit",
+            },
+            "secrets": {
+                "trufflehog": "_run_truffhog",
+                "gitleaks": "_run_gitleaks",
+                "detect-secrets": "_run_detect_secrets",
+                "semgrep": "_run_semgrep",
+            },
+            "iac": {
+                "checkov": "_run_checkov",
+                "tfsec": "_run_tfsec",
+                "terrascan": "_run_terrascan",
+                "semgrep": "_run_semgrep",
+            },
+            "container": {
+                "trivy": "_run_trivy",
+                "clair": "_run_clair",
+                "anchore": "_run_anchore",
+            },
+        }.items()
+    }
+)
+
+# Semgrep ruleset used for each scan type Semgrep can serve
+SEMGREP_RULESETS = {
+    "sast": "auto",
+    "secrets": "p/secrets",
+    "iac": "p/terraform",
+}
+
+# Semgrep check_id prefixes of infrastructure-as-code rules
+SEMGREP_IAC_RULE_PREFIXES = ("terraform.", "hcl.", "kubernetes.", "dockerfile.")
+
+# Fewest files per shard worth an extra scanner process
+SHARD_MIN_FILES = 50
+
+# Size of tool output past which it is parsed off the event loop
+PARSE_OFFLOAD_MIN_CHARS = 1024 * 1024
+
+# Seconds a timed-out tool gets to exit after SIGTERM before it is killed
+TERMINATE_GRACE_SECONDS = 5
+
+
+# File inventories by target, shared by the scans of one scan_all/batch_scan
+# call so the tree is walked once however many scanners need its files
+_file_inventories = ContextVar("secureflow_file_inventories", default=None)
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_last_timestamp = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO 8601, formatted at most once per second"""
+    global _last_timestamp
+
+    now = int(time.time())
+    if _last_timestamp[0] != now:
+        _last_timestamp = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _last_timestamp[1]
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Get the process pool shared by in-process Python scanners"""
+    global _process_pool
+
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                # By the time the pool is needed the event loop's and the
+                # executors' threads are running, and forking a threaded
+                # process can deadlock the child; start workers clean instead
+                if "forkserver" in multiprocessing.get_all_start_methods():
+                    context = multiprocessing.get_context("forkserver")
+                else:
+                    context = multiprocessing.get_context("spawn")
+                _process_pool = ProcessPoolExecutor(mp_context=context)
+
+    return _process_pool
+
+
+@atexit.register
+def shutdown_process_pool():
+    """Shut down the in-process scanners' workers; the pool restarts on next use"""
+    global _process_pool
+
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _bandit_scan_files(paths: List[str], excluded_paths: str = "") -> List[Dict]:
+    """Run Bandit's test suite over paths and return its issues as dicts"""
+    mgr = bandit_manager.BanditManager(bandit_config.BanditConfig(), "file")
+    mgr.discover_files(paths, recursive=True, excluded_paths=excluded_paths)
+    mgr.run_tests()
+    return [issue.as_dict() for issue in mgr.get_issue_list()]
+
+
+def _detect_secrets_scan_files(paths: List[str]) -> Dict[str, List[Dict]]:
+    """Run detect-secrets over paths and return its findings keyed by file"""
+    secrets = SecretsCollection()
+    with default_settings():
+        secrets.scan_files(*paths)
+    return secrets.json()
+
+
+class ScanTimeoutError(Exception):
+    """Raised when a scanner process runs longer than the scan timeout"""
 
 
 class Severity(Enum):
@@ -26,7 +214,28 @@ class Severity(Enum):
     INFO = "INFO"
 
 
-@dataclass
+_HIGH_SEVERITIES = frozenset((Severity.HIGH, Severity.CRITICAL))
+
+_SEVERITY_MAP = {
+    variant: severity
+    for name, severity in (
+        ("CRITICAL", Severity.CRITICAL),
+        ("HIGH", Severity.HIGH),
+        ("MEDIUM", Severity.MEDIUM),
+        ("LOW", Severity.LOW),
+        ("INFO", Severity.INFO),
+        ("WARNING", Severity.MEDIUM),
+        ("ERROR", Severity.HIGH),
+    )
+    for variant in (name, name.lower(), name.title())
+}
+
+# Scans can produce many thousands of findings; drop the per-instance
+# __dict__ where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Vulnerability:
     """Represents a security vulnerability"""
 
@@ -64,8 +273,13 @@ class Vulnerability:
             "references": self.references,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Vulnerability":
+        """Create from the dictionary representation produced by to_dict"""
+        return cls(**{**data, "severity": Severity(data["severity"])})
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ScanResult:
     """Represents the result of a security scan"""
 
@@ -83,20 +297,24 @@ class ScanResult:
 
     def get_vulnerability_count_by_severity(self) -> Dict[str, int]:
         """Get count of vulnerabilities by severity"""
-        counts = {severity.value: 0 for severity in Severity}
-        for vuln in self.vulnerabilities:
-            counts[vuln.severity.value] += 1
-        return counts
+        return ScanResult.combined_severity_counts((self,))
+
+    @staticmethod
+    def combined_severity_counts(results: Iterable["ScanResult"]) -> Dict[str, int]:
+        """Count vulnerabilities by severity across several results in one pass"""
+        counts = Counter(
+            vuln.severity for result in results for vuln in result.vulnerabilities
+        )
+        return {severity.value: counts[severity] for severity in Severity}
 
     def has_high_severity_issues(self) -> bool:
         """Check if scan has high or critical severity issues"""
-        return any(
-            vuln.severity in [Severity.HIGH, Severity.CRITICAL]
-            for vuln in self.vulnerabilities
-        )
+        return any(vuln.severity in _HIGH_SEVERITIES for vuln in self.vulnerabilities)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation"""
+        # Vulnerabilities are mutable, so counts are taken fresh but only once
+        by_severity = self.get_vulnerability_count_by_severity()
         return {
             "tool": self.tool,
             "target": self.target,
@@ -107,54 +325,238 @@ class ScanResult:
             "metadata": self.metadata,
             "summary": {
                 "total_vulnerabilities": len(self.vulnerabilities),
-                "by_severity": self.get_vulnerability_count_by_severity(),
-                "has_high_severity": self.has_high_severity_issues(),
+                "by_severity": by_severity,
+                "has_high_severity": bool(
+                    by_severity[Severity.HIGH.value]
+                    or by_severity[Severity.CRITICAL.value]
+                ),
             },
         }
 
 
+def _dedupe_vulnerabilities(
+    vulnerabilities: Iterable[Vulnerability],
+) -> List[Vulnerability]:
+    """Drop repeated findings of the same rule at the same location, keeping order"""
+    seen = set()
+    unique = []
+    for vuln in vulnerabilities:
+        fingerprint = _vulnerability_fingerprint(vuln)
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            unique.append(vuln)
+    return unique
+
+
+def _vulnerability_fingerprint(vuln: Vulnerability) -> tuple:
+    """Identify a finding by tool, rule and location"""
+    # Findings without a rule (e.g. Safety advisories) are told apart by id
+    return (vuln.tool, vuln.rule_id or vuln.id, vuln.file_path, vuln.line_number)
+
+
 class Scanner:
     """
     Main security scanner class that orchestrates different security scanning tools.
     """
 
-    def __init__(self, config: ScanningConfig):
+    def __init__(
+        self,
+        config: ScanningConfig,
+        max_jobs: Optional[int] = None,
+        scan_cache: Optional[ScanCache] = None,
+        cache_dir: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
         """
         Initialize scanner with configuration.
 
         Args:
             config: Scanning configuration
+            max_jobs: Maximum scanner subprocesses running at once (unbounded if None)
+            scan_cache: Cache of per-file findings so unchanged files are skipped
+            cache_dir: Directory where tools keep their databases between runs
+                (defaults to the scan cache's directory, if any)
+            timeout: Seconds each scanner process may run before it is stopped
+                (unlimited if None)
         """
         self.config = config
         self.logger = Logger(__name__)
-        self._scan_tools = {
-            "sast": {
-                "semgrep": self._run_semgrep,
-                "bandit": self._run_bandit,
-                "sonarqube": self._run_sonarqube,
-            },
-            "sca": {
-                "safety": self._run_safety,
-                "pip-audit": self._run_pip_audit,
-                "npm-audit": self._run_npm_audit,
-            },
-            "secrets": {
-                "trufflehog": self._run_truffhog,
-                "gitleaks": self._run_gitleaks,
-                "detect-secrets": self._run_detect_secrets,
-            },
-            "iac": {
-                "checkov": self._run_checkov,
-                "tfsec": self._run_tfsec,
-                "terrascan": self._run_terrascan,
-            },
-            "container": {
-                "trivy": self._run_trivy,
-                "clair": self._run_clair,
-                "anchore": self._run_anchore,
-            },
+        self.max_jobs = max_jobs
+        self.timeout = timeout
+        self.scan_cache = scan_cache
+        if cache_dir is not None:
+            self.cache_dir = Path(cache_dir).expanduser()
+        else:
+            self.cache_dir = scan_cache.cache_dir if scan_cache is not None else None
+        self._tool_paths: Dict[str, Optional[str]] = {}
+        # Semgrep takes one path per --exclude flag
+        self._semgrep_exclude_args = [
+            arg for path in config.exclude_paths for arg in ("--exclude", path)
+        ]
+        self._command_semaphore: Optional[asyncio.Semaphore] = None
+        self._command_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Map scan type -> remediate_<scan_type> coroutine, resolved once
+        self._remediators = {
+            name[len("remediate_") :]: method
+            for name, method in inspect.getmembers(self, inspect.iscoroutinefunction)
+            if name.startswith("remediate_")
         }
 
+    def get_remediator(self, scan_type: str) -> Optional[Callable[..., Awaitable]]:
+        """
+        Get the remediation coroutine for a scan type.
+
+        Args:
+            scan_type: Type of scan whose findings are to be remediated
+
+        Returns:
+            The remediate_<scan_type> method, or None if there isn't one
+        """
+        return self._remediators.get(scan_type)
+
+    async def scan_all(
+        self, target_path: str, scan_types: Optional[Iterable[str]] = None
+    ) -> List[ScanResult]:
+        """
+        Run several scan types concurrently against the same target.
+
+        Args:
+            target_path: Path to scan
+            scan_types: Scan types to run (all supported types if None)
+
+        Returns:
+            Scan results in the order of scan_types; failed scans are
+            returned as error results instead of raising
+        """
+        scan_types = list(SCAN_METHODS if scan_types is None else scan_types)
+        start_time = time.time()
+
+        token = None
+        if _file_inventories.get() is None:
+            token = _file_inventories.set({})
+
+        try:
+            # Each scan is an external subprocess, so wall time is the
+            # slowest scan rather than the sum
+            results = await asyncio.gather(
+                *(
+                    getattr(self, SCAN_METHODS[scan_type])(target_path)
+                    for scan_type in scan_types
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            if token is not None:
+                _file_inventories.reset(token)
+
+        scan_results = []
+        for scan_type, result in zip(scan_types, results):
+            if isinstance(result, Exception):
+                self.logger.error("%s scan failed: %s", scan_type.upper(), result)
+                result = self._create_error_result(
+                    getattr(self.config, f"{scan_type}_tool", "unknown"),
+                    target_path,
+                    scan_type,
+                    result,
+                    start_time,
+                )
+            scan_results.append(result)
+
+        return scan_results
+
+    async def batch_scan(
+        self, target_path: str, scan_types: Iterable[str]
+    ) -> Dict[str, ScanResult]:
+        """
+        Run several scan types, sharing one Semgrep process between them.
+
+        Scan types configured to use Semgrep are run as a single Semgrep
+        invocation with one --config per ruleset, so rules are loaded and
+        the target is walked once; findings are routed back to their scan
+        type by rule id. The remaining scan types run concurrently.
+
+        Args:
+            target_path: Path to scan
+            scan_types: Scan types to run
+
+        Returns:
+            Scan results keyed by scan type, in the order of scan_types
+        """
+        scan_types = list(scan_types)
+        semgrep_types = [
+            scan_type
+            for scan_type in scan_types
+            if scan_type in SEMGREP_RULESETS
+            and getattr(self.config, f"{scan_type}_tool", None) == "semgrep"
+        ]
+        if len(semgrep_types) < 2:
+            semgrep_types = []
+        other_types = [t for t in scan_types if t not in semgrep_types]
+
+        token = None
+        if _file_inventories.get() is None:
+            token = _file_inventories.set({})
+
+        try:
+            batches = [self.scan_all(target_path, other_types)]
+            if semgrep_types:
+                batches.append(self._run_semgrep_batch(target_path, semgrep_types))
+            results = await asyncio.gather(*batches)
+        finally:
+            if token is not None:
+                _file_inventories.reset(token)
+
+        by_type = dict(zip(other_types, results[0]))
+        if semgrep_types:
+            by_type.update(results[1])
+        return {scan_type: by_type[scan_type] for scan_type in scan_types}
+
+    async def stream_vulnerabilities(
+        self, target_path: str, scan_type: str = "sast"
+    ) -> AsyncIterator[Vulnerability]:
+        """
+        Yield the findings of one scan type as the scanner reports them.
+
+        Semgrep output is parsed off its stdout as it is written, so the
+        first findings arrive while the scan is still running. Other tools,
+        or any tool when ijson isn't installed, yield once their scan ends.
+
+        Args:
+            target_path: Path to scan
+            scan_type: Type of scan (sast, sca, secrets, iac, container)
+
+        Yields:
+            Vulnerabilities, without duplicates
+        """
+        tool = getattr(self.config, f"{scan_type}_tool")
+        if tool != "semgrep" or ijson is None:
+            result = await getattr(self, SCAN_METHODS[scan_type])(target_path)
+            for vuln in result.vulnerabilities:
+                yield vuln
+            return
+
+        cmd = self._semgrep_command(
+            [SEMGREP_RULESETS.get(scan_type, "auto")], target_path
+        )
+        seen = set()
+        semaphore = self._get_command_semaphore()
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            async for vuln in self._stream_command_items(
+                self._resolve_command(cmd),
+                None,
+                "results.item",
+                self._semgrep_result_to_vulnerability,
+            ):
+                fingerprint = _vulnerability_fingerprint(vuln)
+                if fingerprint not in seen:
+                    seen.add(fingerprint)
+                    yield vuln
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
     async def scan_source_code(self, target_path: str) -> ScanResult:
         """
         Perform Static Application Security Testing (SAST).
@@ -168,10 +570,10 @@ class Scanner:
         self.logger.info(f"Running SAST scan on {target_path}")
         tool = self.config.sast_tool
 
-        if tool not in self._scan_tools["sast"]:
+        if tool not in _SCAN_DISPATCH["sast"]:
             raise ValueError(f"Unsupported SAST tool: {tool}")
 
-        scan_func = self._scan_tools["sast"][tool]
+        scan_func = getattr(self, _SCAN_DISPATCH["sast"][tool])
         return await scan_func(target_path, "sast")
 
     async def scan_dependencies(self, target_path: str) -> ScanResult:
@@ -187,10 +589,10 @@ class Scanner:
         self.logger.info(f"Running SCA scan on {target_path}")
         tool = self.config.sca_tool
 
-        if tool not in self._scan_tools["sca"]:
+        if tool not in _SCAN_DISPATCH["sca"]:
             raise ValueError(f"Unsupported SCA tool: {tool}")
 
-        scan_func = self._scan_tools["sca"][tool]
+        scan_func = getattr(self, _SCAN_DISPATCH["sca"][tool])
         return await scan_func(target_path, "sca")
 
     async def scan_secrets(self, target_path: str) -> ScanResult:
@@ -206,10 +608,10 @@ class Scanner:
         self.logger.info(f"Running secret scan on {target_path}")
         tool = self.config.secrets_tool
 
-        if tool not in self._scan_tools["secrets"]:
+        if tool not in _SCAN_DISPATCH["secrets"]:
             raise ValueError(f"Unsupported secrets tool: {tool}")
 
-        scan_func = self._scan_tools["secrets"][tool]
+        scan_func = getattr(self, _SCAN_DISPATCH["secrets"][tool])
         return await scan_func(target_path, "secrets")
 
     async def scan_infrastructure(self, target_path: str) -> ScanResult:
@@ -225,10 +627,10 @@ class Scanner:
         self.logger.info(f"Running IaC scan on {target_path}")
         tool = self.config.iac_tool
 
-        if tool not in self._scan_tools["iac"]:
+        if tool not in _SCAN_DISPATCH["iac"]:
             raise ValueError(f"Unsupported IaC tool: {tool}")
 
-        scan_func = self._scan_tools["iac"][tool]
+        scan_func = getattr(self, _SCAN_DISPATCH["iac"][tool])
         return await scan_func(target_path, "iac")
 
     async def scan_container(self, image_or_dockerfile: str) -> ScanResult:
@@ -244,31 +646,30 @@ class Scanner:
         self.logger.info(f"Running container scan on {image_or_dockerfile}")
         tool = self.config.container_tool
 
-        if tool not in self._scan_tools["container"]:
+        if tool not in _SCAN_DISPATCH["container"]:
             raise ValueError(f"Unsupported container tool: {tool}")
 
-        scan_func = self._scan_tools["container"][tool]
+        scan_func = getattr(self, _SCAN_DISPATCH["container"][tool])
         return await scan_func(image_or_dockerfile, "container")
 
     # SAST Tool Implementations
     async def _run_semgrep(self, target_path: str, scan_type: str) -> ScanResult:
         """Run Semgrep SAST scan"""
-        import time
-
         start_time = time.time()
 
         try:
-            cmd = [
-                "semgrep",
-                "--config=auto",
-                "--json",
-                "--exclude",
-                " ".join(self.config.exclude_paths),
-                target_path,
-            ]
+            cmd = self._semgrep_command(
+                [SEMGREP_RULESETS.get(scan_type, "auto")], target_path
+            )
 
-            result = await self._run_command(cmd)
-            vulnerabilities = self._parse_semgrep_output(result.get("stdout", ""))
+            result = await self._run_command(
+                cmd,
+                item_prefix="results.item",
+                item_parser=self._semgrep_result_to_vulnerability,
+            )
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_semgrep_output
+            )
 
             return ScanResult(
                 tool="semgrep",
@@ -276,35 +677,121 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
                 metadata={"command": " ".join(cmd)},
             )
 
         except Exception as e:
             self.logger.error(f"Semgrep scan failed: {str(e)}")
             return self._create_error_result(
-                "semgrep", target_path, scan_type, str(e), start_time
+                "semgrep", target_path, scan_type, e, start_time
             )
 
+    async def _run_semgrep_batch(
+        self, target_path: str, scan_types: List[str]
+    ) -> Dict[str, ScanResult]:
+        """Run one Semgrep process for several scan types and split its findings"""
+        start_time = time.time()
+
+        try:
+            cmd = self._semgrep_command(
+                [SEMGREP_RULESETS[scan_type] for scan_type in scan_types], target_path
+            )
+
+            result = await self._run_command(
+                cmd,
+                item_prefix="results.item",
+                item_parser=self._semgrep_result_to_vulnerability,
+            )
+
+            findings = {scan_type: [] for scan_type in scan_types}
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_semgrep_output
+            )
+            for vuln in vulnerabilities:
+                findings[self._semgrep_scan_type(vuln.rule_id, scan_types)].append(vuln)
+
+            scan_duration = time.time() - start_time
+            timestamp = _utc_timestamp()
+            return {
+                scan_type: ScanResult(
+                    tool="semgrep",
+                    target=target_path,
+                    scan_type=scan_type,
+                    vulnerabilities=findings[scan_type],
+                    scan_duration=scan_duration,
+                    timestamp=timestamp,
+                    metadata={"command": " ".join(cmd), "batched": scan_types},
+                )
+                for scan_type in scan_types
+            }
+
+        except Exception as e:
+            self.logger.error(f"Semgrep scan failed: {str(e)}")
+            return {
+                scan_type: self._create_error_result(
+                    "semgrep", target_path, scan_type, e, start_time
+                )
+                for scan_type in scan_types
+            }
+
+    def _semgrep_command(self, configs: List[str], target_path: str) -> List[str]:
+        """Build a Semgrep command line for one or more rulesets"""
+        cmd = ["semgrep"]
+        for config in configs:
+            cmd.append(f"--config={config}")
+        cmd.extend(["--json", *self._semgrep_exclude_args, target_path])
+        return cmd
+
+    @staticmethod
+    def _semgrep_scan_type(rule_id: Optional[str], scan_types: List[str]) -> str:
+        """Pick the scan type a batched Semgrep finding belongs to"""
+        rule_id = rule_id or ""
+        if "secrets" in scan_types and ".secrets." in f".{rule_id}":
+            return "secrets"
+        if "iac" in scan_types and rule_id.startswith(SEMGREP_IAC_RULE_PREFIXES):
+            return "iac"
+        return "sast" if "sast" in scan_types else scan_types[0]
+
     async def _run_bandit(self, target_path: str, scan_type: str) -> ScanResult:
         """Run Bandit Python security scanner"""
-        import time
-
         start_time = time.time()
 
         try:
+            if self.scan_cache is not None and os.path.isdir(target_path):
+                return await self._run_bandit_cached(target_path, scan_type, start_time)
+
+            if bandit_manager is not None:
+                return await self._run_bandit_in_process(
+                    target_path, scan_type, start_time
+                )
+
+            # Bandit is single-threaded, so large trees are split across
+            # one process per shard of files
+            shards = await self._shard_paths(target_path, os.cpu_count() or 1, "*.py")
+            if len(shards) > 1:
+                return await self._run_bandit_shards(
+                    target_path, scan_type, shards, start_time
+                )
+
             cmd = [
                 "bandit",
                 "-r",
                 target_path,
                 "-f",
                 "json",
-                "--skip",
+                "--exclude",
                 ",".join(self.config.exclude_paths),
             ]
 
-            result = await self._run_command(cmd)
-            vulnerabilities = self._parse_bandit_output(result.get("stdout", ""))
+            result = await self._run_command(
+                cmd,
+                item_prefix="results.item",
+                item_parser=self._bandit_result_to_vulnerability,
+            )
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_bandit_output
+            )
 
             return ScanResult(
                 tool="bandit",
@@ -312,21 +799,171 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
                 metadata={"command": " ".join(cmd)},
             )
 
         except Exception as e:
             self.logger.error(f"Bandit scan failed: {str(e)}")
             return self._create_error_result(
-                "bandit", target_path, scan_type, str(e), start_time
+                "bandit", target_path, scan_type, e, start_time
             )
 
+    async def _run_bandit_shards(
+        self,
+        target_path: str,
+        scan_type: str,
+        shards: List[List[str]],
+        start_time: float,
+    ) -> ScanResult:
+        """Run one Bandit process per shard of files and merge the findings"""
+        vulnerabilities = await self._scan_bandit_shards(shards)
+
+        return ScanResult(
+            tool="bandit",
+            target=target_path,
+            scan_type=scan_type,
+            vulnerabilities=vulnerabilities,
+            scan_duration=time.time() - start_time,
+            timestamp=_utc_timestamp(),
+            metadata={
+                "command": "bandit -f json <files>",
+                "shards": len(shards),
+                "files": sum(len(shard) for shard in shards),
+            },
+        )
+
+    async def _run_bandit_in_process(
+        self, target_path: str, scan_type: str, start_time: float
+    ) -> ScanResult:
+        """Run Bandit through its Python API in the shared process pool"""
+        shards = await self._shard_paths(target_path, os.cpu_count() or 1, "*.py")
+        shards = shards or [[target_path]]
+        vulnerabilities = await self._scan_bandit_shards(
+            shards, excluded_paths=",".join(self.config.exclude_paths)
+        )
+
+        return ScanResult(
+            tool="bandit",
+            target=target_path,
+            scan_type=scan_type,
+            vulnerabilities=vulnerabilities,
+            scan_duration=time.time() - start_time,
+            timestamp=_utc_timestamp(),
+            metadata={"mode": "in-process", "shards": len(shards)},
+        )
+
+    async def _run_bandit_cached(
+        self, target_path: str, scan_type: str, start_time: float
+    ) -> ScanResult:
+        """Run Bandit only on files whose contents aren't in the scan cache"""
+        loop = asyncio.get_running_loop()
+        files = await self._find_files(target_path, "*.py")
+        rule_version = f"bandit-{self._package_version('bandit')}"
+
+        # Hashing and cache reads are file I/O, keep them off the event loop
+        hits, misses = await loop.run_in_executor(
+            None, self.scan_cache.lookup, "bandit", rule_version, files
+        )
+
+        vulnerabilities = [
+            Vulnerability.from_dict(finding)
+            for findings in hits.values()
+            for finding in findings
+        ]
+
+        if misses:
+            shards = self._split_shards(list(misses), os.cpu_count() or 1)
+            fresh = await self._scan_bandit_shards(shards)
+            vulnerabilities.extend(fresh)
+
+            findings_by_file = {file_path: [] for file_path in misses}
+            for vuln in fresh:
+                findings_by_file.setdefault(vuln.file_path, []).append(vuln.to_dict())
+
+            def store_findings():
+                for file_path, digest in misses.items():
+                    self.scan_cache.store(
+                        "bandit", rule_version, digest, findings_by_file[file_path]
+                    )
+
+            await loop.run_in_executor(None, store_findings)
+
+        return ScanResult(
+            tool="bandit",
+            target=target_path,
+            scan_type=scan_type,
+            vulnerabilities=vulnerabilities,
+            scan_duration=time.time() - start_time,
+            timestamp=_utc_timestamp(),
+            metadata={"cached_files": len(hits), "scanned_files": len(misses)},
+        )
+
+    async def _scan_bandit_shards(
+        self, shards: List[List[str]], excluded_paths: str = ""
+    ) -> List[Vulnerability]:
+        """Scan each shard of paths with Bandit concurrently and merge findings"""
+        if bandit_manager is not None:
+            loop = asyncio.get_running_loop()
+            pool = _get_process_pool()
+            try:
+                # A shard already running in the pool can't be interrupted,
+                # but the scan stops waiting and queued shards are dropped
+                results = await asyncio.wait_for(
+                    asyncio.gather(
+                        *(
+                            loop.run_in_executor(
+                                pool, _bandit_scan_files, shard, excluded_paths
+                            )
+                            for shard in shards
+                        )
+                    ),
+                    self.timeout,
+                )
+            except asyncio.TimeoutError:
+                raise self._timeout_error(["bandit"]) from None
+            # Shards never share files, but a file can repeat an issue
+            return _dedupe_vulnerabilities(
+                self._bandit_result_to_vulnerability(issue)
+                for issues in results
+                for issue in issues
+            )
+
+        # Every shard is left to finish or hit its own timeout, so none is
+        # still running when the first failure is raised
+        results = await asyncio.gather(
+            *(
+                self._run_command(
+                    ["bandit", "-f", "json", *shard],
+                    item_prefix="results.item",
+                    item_parser=self._bandit_result_to_vulnerability,
+                )
+                for shard in shards
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        vulnerabilities = []
+        for result in results:
+            vulnerabilities.extend(
+                await self._collect_vulnerabilities(result, self._parse_bandit_output)
+            )
+        return _dedupe_vulnerabilities(vulnerabilities)
+
+    @staticmethod
+    def _package_version(package: str) -> str:
+        """Get an installed package's version, or 'unknown'"""
+        try:
+            return package_version(package)
+        except PackageNotFoundError:
+            return "unknown"
+
     async def _run_sonarqube(self, target_path: str, scan_type: str) -> ScanResult:
         """Run SonarQube scanner"""
         # Placeholder implementation
-        import time
-
         start_time = time.time()
 
         self.logger.info("SonarQube scan would be implemented with sonar-scanner CLI")
@@ -337,22 +974,20 @@ class Scanner:
             scan_type=scan_type,
             vulnerabilities=[],
             scan_duration=time.time() - start_time,
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            timestamp=_utc_timestamp(),
             metadata={"status": "placeholder", "note": "SonarQube integration pending"},
         )
 
     # SCA Tool Implementations
     async def _run_safety(self, target_path: str, scan_type: str) -> ScanResult:
         """Run Safety dependency scanner"""
-        import time
-
         start_time = time.time()
 
         try:
             # Look for requirements files
-            req_files = list(Path(target_path).rglob("requirements*.txt"))
+            req_files = await self._find_files(target_path, "requirements*.txt")
             if not req_files:
-                req_files = list(Path(target_path).rglob("Pipfile"))
+                req_files = await self._find_files(target_path, "Pipfile")
 
             if not req_files:
                 self.logger.warning("No dependency files found for Safety scan")
@@ -362,7 +997,9 @@ class Scanner:
 
             cmd = ["safety", "check", "--json", "--file", str(req_files[0])]
             result = await self._run_command(cmd)
-            vulnerabilities = self._parse_safety_output(result.get("stdout", ""))
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_safety_output
+            )
 
             return ScanResult(
                 tool="safety",
@@ -370,26 +1007,26 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
                 metadata={"requirements_file": str(req_files[0])},
             )
 
         except Exception as e:
             self.logger.error(f"Safety scan failed: {str(e)}")
             return self._create_error_result(
-                "safety", target_path, scan_type, str(e), start_time
+                "safety", target_path, scan_type, e, start_time
             )
 
     async def _run_pip_audit(self, target_path: str, scan_type: str) -> ScanResult:
         """Run pip-audit dependency scanner"""
-        import time
-
         start_time = time.time()
 
         try:
             cmd = ["pip-audit", "--format=json", "--desc"]
             result = await self._run_command(cmd, cwd=target_path)
-            vulnerabilities = self._parse_pip_audit_output(result.get("stdout", ""))
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_pip_audit_output
+            )
 
             return ScanResult(
                 tool="pip-audit",
@@ -397,19 +1034,17 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
         except Exception as e:
             self.logger.error(f"pip-audit scan failed: {str(e)}")
             return self._create_error_result(
-                "pip-audit", target_path, scan_type, str(e), start_time
+                "pip-audit", target_path, scan_type, e, start_time
             )
 
     async def _run_npm_audit(self, target_path: str, scan_type: str) -> ScanResult:
         """Run npm audit for Node.js dependencies"""
-        import time
-
         start_time = time.time()
 
         try:
@@ -422,7 +1057,9 @@ class Scanner:
 
             cmd = ["npm", "audit", "--json"]
             result = await self._run_command(cmd, cwd=target_path)
-            vulnerabilities = self._parse_npm_audit_output(result.get("stdout", ""))
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_npm_audit_output
+            )
 
             return ScanResult(
                 tool="npm-audit",
@@ -430,26 +1067,26 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
         except Exception as e:
             self.logger.error(f"npm audit failed: {str(e)}")
             return self._create_error_result(
-                "npm-audit", target_path, scan_type, str(e), start_time
+                "npm-audit", target_path, scan_type, e, start_time
             )
 
     # Secret Scanning Tool Implementations
     async def _run_truffhog(self, target_path: str, scan_type: str) -> ScanResult:
         """Run TruffleHog secret scanner"""
-        import time
-
         start_time = time.time()
 
         try:
             cmd = ["trufflehog", "--json", "filesystem", target_path]
             result = await self._run_command(cmd)
-            vulnerabilities = self._parse_truffhog_output(result.get("stdout", ""))
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_truffhog_output
+            )
 
             return ScanResult(
                 tool="trufflehog",
@@ -457,19 +1094,17 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
         except Exception as e:
             self.logger.error(f"TruffleHog scan failed: {str(e)}")
             return self._create_error_result(
-                "trufflehog", target_path, scan_type, str(e), start_time
+                "trufflehog", target_path, scan_type, e, start_time
             )
 
     async def _run_gitleaks(self, target_path: str, scan_type: str) -> ScanResult:
         """Run Gitleaks secret scanner"""
-        import time
-
         start_time = time.time()
 
         try:
@@ -482,7 +1117,9 @@ class Scanner:
                 "json",
             ]
             result = await self._run_command(cmd)
-            vulnerabilities = self._parse_gitleaks_output(result.get("stdout", ""))
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_gitleaks_output
+            )
 
             return ScanResult(
                 tool="gitleaks",
@@ -490,26 +1127,29 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
         except Exception as e:
             self.logger.error(f"Gitleaks scan failed: {str(e)}")
             return self._create_error_result(
-                "gitleaks", target_path, scan_type, str(e), start_time
+                "gitleaks", target_path, scan_type, e, start_time
             )
 
     async def _run_detect_secrets(self, target_path: str, scan_type: str) -> ScanResult:
         """Run detect-secrets scanner"""
-        import time
-
         start_time = time.time()
 
         try:
+            if SecretsCollection is not None:
+                return await self._run_detect_secrets_in_process(
+                    target_path, scan_type, start_time
+                )
+
             cmd = ["detect-secrets", "scan", "--force-use-all-plugins", target_path]
             result = await self._run_command(cmd)
-            vulnerabilities = self._parse_detect_secrets_output(
-                result.get("stdout", "")
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_detect_secrets_output
             )
 
             return ScanResult(
@@ -518,26 +1158,58 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
         except Exception as e:
             self.logger.error(f"detect-secrets scan failed: {str(e)}")
             return self._create_error_result(
-                "detect-secrets", target_path, scan_type, str(e), start_time
+                "detect-secrets", target_path, scan_type, e, start_time
             )
 
+    async def _run_detect_secrets_in_process(
+        self, target_path: str, scan_type: str, start_time: float
+    ) -> ScanResult:
+        """Run detect-secrets through its Python API"""
+        if os.path.isdir(target_path):
+            paths = await self._find_files(target_path)
+        else:
+            paths = [target_path]
+
+        # detect-secrets spreads files over its own worker processes, so
+        # the default thread executor only keeps the event loop free. The
+        # thread can't be interrupted; on a timeout the scan stops waiting.
+        try:
+            results = await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(
+                    None, _detect_secrets_scan_files, paths
+                ),
+                self.timeout,
+            )
+        except asyncio.TimeoutError:
+            raise self._timeout_error(["detect-secrets"]) from None
+
+        return ScanResult(
+            tool="detect-secrets",
+            target=target_path,
+            scan_type=scan_type,
+            vulnerabilities=self._detect_secrets_results_to_vulnerabilities(results),
+            scan_duration=time.time() - start_time,
+            timestamp=_utc_timestamp(),
+            metadata={"mode": "in-process", "files": len(paths)},
+        )
+
     # IaC Tool Implementations
     async def _run_checkov(self, target_path: str, scan_type: str) -> ScanResult:
         """Run Checkov IaC scanner"""
-        import time
-
         start_time = time.time()
 
         try:
             cmd = ["checkov", "-d", target_path, "--output", "json", "--quiet"]
             result = await self._run_command(cmd)
-            vulnerabilities = self._parse_checkov_output(result.get("stdout", ""))
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_checkov_output
+            )
 
             return ScanResult(
                 tool="checkov",
@@ -545,25 +1217,25 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
         except Exception as e:
             self.logger.error(f"Checkov scan failed: {str(e)}")
             return self._create_error_result(
-                "checkov", target_path, scan_type, str(e), start_time
+                "checkov", target_path, scan_type, e, start_time
             )
 
     async def _run_tfsec(self, target_path: str, scan_type: str) -> ScanResult:
         """Run tfsec Terraform scanner"""
-        import time
-
         start_time = time.time()
 
         try:
             cmd = ["tfsec", target_path, "--format", "json"]
             result = await self._run_command(cmd)
-            vulnerabilities = self._parse_tfsec_output(result.get("stdout", ""))
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_tfsec_output
+            )
 
             return ScanResult(
                 tool="tfsec",
@@ -571,25 +1243,25 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
         except Exception as e:
             self.logger.error(f"tfsec scan failed: {str(e)}")
             return self._create_error_result(
-                "tfsec", target_path, scan_type, str(e), start_time
+                "tfsec", target_path, scan_type, e, start_time
             )
 
     async def _run_terrascan(self, target_path: str, scan_type: str) -> ScanResult:
         """Run Terrascan IaC scanner"""
-        import time
-
         start_time = time.time()
 
         try:
             cmd = ["terrascan", "scan", "-d", target_path, "-o", "json"]
             result = await self._run_command(cmd)
-            vulnerabilities = self._parse_terrascan_output(result.get("stdout", ""))
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_terrascan_output
+            )
 
             return ScanResult(
                 tool="terrascan",
@@ -597,31 +1269,37 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
         except Exception as e:
             self.logger.error(f"Terrascan scan failed: {str(e)}")
             return self._create_error_result(
-                "terrascan", target_path, scan_type, str(e), start_time
+                "terrascan", target_path, scan_type, e, start_time
             )
 
     # Container Tool Implementations
     async def _run_trivy(self, target: str, scan_type: str) -> ScanResult:
         """Run Trivy container scanner"""
-        import time
-
         start_time = time.time()
 
         try:
             # Determine if target is image or filesystem
             if Path(target).exists():
-                cmd = ["trivy", "fs", "--format", "json", target]
+                cmd = ["trivy", "fs", "--format", "json"]
             else:
-                cmd = ["trivy", "image", "--format", "json", target]
+                cmd = ["trivy", "image", "--format", "json"]
+
+            # Keep the vulnerability DB between runs instead of downloading
+            # it again into a fresh default cache
+            if self.cache_dir is not None:
+                cmd.extend(["--cache-dir", str(self.cache_dir / "tools" / "trivy")])
+            cmd.append(target)
 
             result = await self._run_command(cmd)
-            vulnerabilities = self._parse_trivy_output(result.get("stdout", ""))
+            vulnerabilities = await self._collect_vulnerabilities(
+                result, self._parse_trivy_output
+            )
 
             return ScanResult(
                 tool="trivy",
@@ -629,20 +1307,16 @@ class Scanner:
                 scan_type=scan_type,
                 vulnerabilities=vulnerabilities,
                 scan_duration=time.time() - start_time,
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
         except Exception as e:
             self.logger.error(f"Trivy scan failed: {str(e)}")
-            return self._create_error_result(
-                "trivy", target, scan_type, str(e), start_time
-            )
+            return self._create_error_result("trivy", target, scan_type, e, start_time)
 
     async def _run_clair(self, target: str, scan_type: str) -> ScanResult:
         """Run Clair container scanner"""
         # Placeholder implementation
-        import time
-
         start_time = time.time()
 
         self.logger.info("Clair scanner would require Clair server setup")
@@ -653,15 +1327,13 @@ class Scanner:
             scan_type=scan_type,
             vulnerabilities=[],
             scan_duration=time.time() - start_time,
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            timestamp=_utc_timestamp(),
             metadata={"status": "placeholder", "note": "Clair integration pending"},
         )
 
     async def _run_anchore(self, target: str, scan_type: str) -> ScanResult:
         """Run Anchore container scanner"""
         # Placeholder implementation
-        import time
-
         start_time = time.time()
 
         self.logger.info("Anchore scanner would require Anchore Engine setup")
@@ -672,24 +1344,95 @@ class Scanner:
             scan_type=scan_type,
             vulnerabilities=[],
             scan_duration=time.time() - start_time,
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            timestamp=_utc_timestamp(),
             metadata={"status": "placeholder", "note": "Anchore integration pending"},
         )
 
     # Utility Methods
     async def _run_command(
-        self, cmd: List[str], cwd: Optional[str] = None
+        self,
+        cmd: List[str],
+        cwd: Optional[str] = None,
+        item_prefix: Optional[str] = None,
+        item_parser: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run command asynchronously, waiting for a free job slot if limited.
+
+        Args:
+            cmd: Command and arguments
+            cwd: Working directory for the command
+            item_prefix: ijson prefix of the JSON items to stream from stdout
+            item_parser: Converts each streamed item as it arrives
+
+        Returns:
+            Dictionary with returncode, stdout and stderr; when the output was
+            streamed, stdout is empty and the parsed items are under "items"
+        """
+        semaphore = self._get_command_semaphore()
+        if semaphore is None:
+            return await self._execute_command(cmd, cwd, item_prefix, item_parser)
+
+        async with semaphore:
+            return await self._execute_command(cmd, cwd, item_prefix, item_parser)
+
+    def _get_command_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """Get the semaphore limiting concurrent subprocesses for this loop"""
+        if not self.max_jobs:
+            return None
+
+        # Semaphores are bound to one event loop; recreate it for a new one
+        loop = asyncio.get_running_loop()
+        if self._command_semaphore_loop is not loop:
+            self._command_semaphore = asyncio.Semaphore(self.max_jobs)
+            self._command_semaphore_loop = loop
+
+        return self._command_semaphore
+
+    async def _execute_command(
+        self,
+        cmd: List[str],
+        cwd: Optional[str] = None,
+        item_prefix: Optional[str] = None,
+        item_parser: Optional[Callable[[Dict[str, Any]], Any]] = None,
     ) -> Dict[str, Any]:
-        """Run command asynchronously"""
+        """Spawn a command and collect its output"""
+        cmd = self._resolve_command(cmd)
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
-            )
+            if item_prefix is not None and ijson is not None:
+                try:
+                    # Cancelling the stream kills the tool on the way out
+                    return await asyncio.wait_for(
+                        self._execute_streaming_command(
+                            cmd, cwd, item_prefix, item_parser
+                        ),
+                        self.timeout,
+                    )
+                except asyncio.TimeoutError:
+                    raise self._timeout_error(cmd) from None
+
+            # Reports can run to hundreds of megabytes; the tool writes stdout
+            # straight to a temp file instead of through the event loop, and
+            # it is read back in one piece once the tool exits
+            with tempfile.TemporaryFile() as stdout_file:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=stdout_file,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd,
+                    start_new_session=True,
+                )
 
-            stdout, stderr = await process.communicate()
+                try:
+                    _, stderr = await asyncio.wait_for(
+                        process.communicate(), self.timeout
+                    )
+                except asyncio.TimeoutError:
+                    await self._stop_process(process)
+                    raise self._timeout_error(cmd) from None
+
+                stdout_file.seek(0)
+                stdout = stdout_file.read()
 
             return {
                 "returncode": process.returncode,
@@ -697,96 +1440,301 @@ class Scanner:
                 "stderr": stderr.decode() if stderr else "",
             }
 
+        except ScanTimeoutError:
+            raise
         except Exception as e:
             self.logger.error(f"Command execution failed: {' '.join(cmd)}: {str(e)}")
             return {"returncode": -1, "stdout": "", "stderr": str(e)}
 
+    def _timeout_error(self, cmd: List[str]) -> ScanTimeoutError:
+        """Log and build the error for a command that ran out of time"""
+        self.logger.error("%s timed out after %ss", cmd[0], self.timeout)
+        return ScanTimeoutError(f"{cmd[0]} timed out after {self.timeout}s")
+
+    @classmethod
+    async def _stop_process(cls, process: asyncio.subprocess.Process):
+        """Ask a tool to terminate, killing it if it doesn't exit in time"""
+        cls._signal_process_group(process, kill=False)
+        try:
+            await asyncio.wait_for(process.wait(), TERMINATE_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            cls._signal_process_group(process, kill=True)
+            await process.wait()
+
+    @staticmethod
+    def _signal_process_group(process: asyncio.subprocess.Process, kill: bool):
+        """Terminate or kill a tool along with every process it started
+
+        Tools run in a session of their own, so a wrapper script's children
+        go too instead of holding the output pipes open after it exits.
+        """
+        if not hasattr(os, "killpg"):
+            # No process groups on Windows; only the tool itself is stopped
+            try:
+                if kill:
+                    process.kill()
+                else:
+                    process.terminate()
+            except ProcessLookupError:
+                pass
+            return
+
+        try:
+            os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def _resolve_command(self, cmd: List[str]) -> List[str]:
+        """Replace the tool name with its absolute path, resolved once per tool"""
+        tool = cmd[0]
+        if tool not in self._tool_paths:
+            self._tool_paths[tool] = shutil.which(tool)
+
+        # Unresolved tools are left as-is so the spawn error is reported
+        tool_path = self._tool_paths[tool]
+        return [tool_path, *cmd[1:]] if tool_path else cmd
+
+    async def _execute_streaming_command(
+        self,
+        cmd: List[str],
+        cwd: Optional[str],
+        item_prefix: str,
+        item_parser: Optional[Callable[[Dict[str, Any]], Any]],
+    ) -> Dict[str, Any]:
+        """Spawn a command and collect the JSON items parsed from its stdout"""
+        status = {}
+        items = [
+            item
+            async for item in self._stream_command_items(
+                cmd, cwd, item_prefix, item_parser, status
+            )
+        ]
+
+        return {
+            "returncode": status["returncode"],
+            "stdout": "",
+            "stderr": status["error"],
+            "items": items,
+        }
+
+    async def _stream_command_items(
+        self,
+        cmd: List[str],
+        cwd: Optional[str],
+        item_prefix: str,
+        item_parser: Optional[Callable[[Dict[str, Any]], Any]],
+        status: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """Spawn a command and yield JSON items from stdout as they arrive"""
+        if status is None:
+            status = {}
+
+        # stderr is discarded so an unread pipe can never stall the tool
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=cwd,
+            start_new_session=True,
+        )
+
+        status["error"] = ""
+        try:
+            try:
+                async for item in ijson.items_async(
+                    process.stdout, item_prefix, use_float=True
+                ):
+                    yield item_parser(item) if item_parser else item
+            except ijson.JSONError as e:
+                status["error"] = str(e)
+                self.logger.error("Failed to parse %s output: %s", cmd[0], e)
+
+            # Drain the rest so the tool can exit
+            await process.stdout.read()
+        finally:
+            # A consumer that stops early must not leave the tool running
+            if not process.stdout.at_eof():
+                self._signal_process_group(process, kill=True)
+            status["returncode"] = await process.wait()
+
+    async def _collect_vulnerabilities(
+        self, result: Dict[str, Any], parse_output: Callable[[str], List[Vulnerability]]
+    ) -> List[Vulnerability]:
+        """Get vulnerabilities streamed by _run_command or parse its stdout"""
+        if "items" in result:
+            return _dedupe_vulnerabilities(result["items"])
+
+        output = result.get("stdout", "")
+        if len(output) < PARSE_OFFLOAD_MIN_CHARS:
+            return parse_output(output)
+
+        # Building many thousands of findings would stall every other scan
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, parse_output, output)
+
+    async def _shard_paths(
+        self, target_path: str, max_shards: int, pattern: str = "*"
+    ) -> List[List[str]]:
+        """
+        Split the files under a directory into shards for parallel scanning.
+
+        Args:
+            target_path: Directory to enumerate
+            max_shards: Upper bound on the number of shards
+            pattern: Glob pattern file names must match
+
+        Returns:
+            Lists of file paths, at most max_shards of them and none smaller
+            than SHARD_MIN_FILES unless there is only one; empty if
+            target_path is not a directory
+        """
+        files = await self._find_files(target_path, pattern)
+        return self._split_shards(files, max_shards)
+
+    async def _find_files(self, target_path: str, pattern: str = "*") -> List[str]:
+        """Get the non-excluded files under target_path whose names match pattern"""
+        inventories = _file_inventories.get()
+        loop = asyncio.get_running_loop()
+
+        if inventories is None:
+            files = await loop.run_in_executor(None, self._list_files, target_path)
+        else:
+            # Concurrent scans await the same walk instead of starting their own
+            if target_path not in inventories:
+                inventories[target_path] = loop.run_in_executor(
+                    None, self._list_files, target_path
+                )
+            files = await inventories[target_path]
+
+        if pattern == "*":
+            return list(files)
+        return [f for f in files if fnmatch.fnmatch(os.path.basename(f), pattern)]
+
+    def _list_files(self, target_path: str) -> List[str]:
+        """Walk a directory once, pruning config.exclude_paths"""
+        if not os.path.isdir(target_path):
+            return []
+
+        exclude_patterns = self.config.exclude_paths
+        files = []
+        for root, dirs, filenames in os.walk(target_path):
+            # Prune excluded directories so their contents are never walked
+            dirs[:] = [
+                d
+                for d in dirs
+                if not any(fnmatch.fnmatch(d, p) for p in exclude_patterns)
+            ]
+            files.extend(
+                os.path.join(root, name)
+                for name in filenames
+                if not any(fnmatch.fnmatch(name, p) for p in exclude_patterns)
+            )
+
+        return files
+
+    @staticmethod
+    def _split_shards(files: List[str], max_shards: int) -> List[List[str]]:
+        """Deal files round-robin into shards of at least SHARD_MIN_FILES"""
+        if not files:
+            return []
+
+        shard_count = max(1, min(max_shards, len(files) // SHARD_MIN_FILES))
+        return [files[i::shard_count] for i in range(shard_count)]
+
     def _create_error_result(
-        self, tool: str, target: str, scan_type: str, error: str, start_time: float
+        self,
+        tool: str,
+        target: str,
+        scan_type: str,
+        error: Union[str, Exception],
+        start_time: float,
     ) -> ScanResult:
         """Create error scan result"""
-        import time
-
+        status = "timeout" if isinstance(error, ScanTimeoutError) else "failed"
         return ScanResult(
             tool=tool,
             target=target,
             scan_type=scan_type,
             vulnerabilities=[],
             scan_duration=time.time() - start_time,
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            metadata={"error": error, "status": "failed"},
+            timestamp=_utc_timestamp(),
+            metadata={"error": str(error), "status": status},
         )
 
     def _create_empty_result(
         self, tool: str, target: str, scan_type: str, start_time: float
     ) -> ScanResult:
         """Create empty scan result"""
-        import time
-
         return ScanResult(
             tool=tool,
             target=target,
             scan_type=scan_type,
             vulnerabilities=[],
             scan_duration=time.time() - start_time,
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            timestamp=_utc_timestamp(),
             metadata={"status": "no_issues_found"},
         )
 
     # Parser methods (simplified implementations)
     def _parse_semgrep_output(self, output: str) -> List[Vulnerability]:
         """Parse Semgrep JSON output"""
-        vulnerabilities = []
         try:
             if not output.strip():
-                return vulnerabilities
+                return []
 
-            data = json.loads(output)
-            for result in data.get("results", []):
-                vuln = Vulnerability(
-                    id=result.get("check_id", "unknown"),
-                    title=result.get("message", "Security issue detected"),
-                    description=result.get("extra", {}).get("message", ""),
-                    severity=self._map_severity(
-                        result.get("extra", {}).get("severity", "INFO")
-                    ),
-                    file_path=result.get("path"),
-                    line_number=result.get("start", {}).get("line"),
-                    tool="semgrep",
-                    rule_id=result.get("check_id"),
-                    references=result.get("extra", {}).get("references", []),
-                )
-                vulnerabilities.append(vuln)
+            data = _json_loads(output)
+            return _dedupe_vulnerabilities(
+                self._semgrep_result_to_vulnerability(result)
+                for result in data.get("results", [])
+            )
         except json.JSONDecodeError:
             self.logger.error("Failed to parse Semgrep output")
-
-        return vulnerabilities
+            return []
+
+    def _semgrep_result_to_vulnerability(self, result: Dict[str, Any]) -> Vulnerability:
+        """Convert one Semgrep result to a Vulnerability"""
+        return Vulnerability(
+            id=result.get("check_id", "unknown"),
+            title=result.get("message", "Security issue detected"),
+            description=result.get("extra", {}).get("message", ""),
+            severity=self._map_severity(
+                result.get("extra", {}).get("severity", "INFO")
+            ),
+            file_path=result.get("path"),
+            line_number=result.get("start", {}).get("line"),
+            tool="semgrep",
+            rule_id=result.get("check_id"),
+            references=result.get("extra", {}).get("references", []),
+        )
 
     def _parse_bandit_output(self, output: str) -> List[Vulnerability]:
         """Parse Bandit JSON output"""
-        vulnerabilities = []
         try:
             if not output.strip():
-                return vulnerabilities
+                return []
 
-            data = json.loads(output)
-            for result in data.get("results", []):
-                vuln = Vulnerability(
-                    id=f"bandit-{result.get('test_id', 'unknown')}",
-                    title=result.get("test_name", "Security issue"),
-                    description=result.get("issue_text", ""),
-                    severity=self._map_severity(result.get("issue_severity", "LOW")),
-                    file_path=result.get("filename"),
-                    line_number=result.get("line_number"),
-                    tool="bandit",
-                    rule_id=result.get("test_id"),
-                    recommendation=result.get("more_info"),
-                )
-                vulnerabilities.append(vuln)
+            data = _json_loads(output)
+            return _dedupe_vulnerabilities(
+                self._bandit_result_to_vulnerability(result)
+                for result in data.get("results", [])
+            )
         except json.JSONDecodeError:
             self.logger.error("Failed to parse Bandit output")
-
-        return vulnerabilities
+            return []
+
+    def _bandit_result_to_vulnerability(self, result: Dict[str, Any]) -> Vulnerability:
+        """Convert one Bandit issue (CLI JSON or Issue.as_dict) to a Vulnerability"""
+        return Vulnerability(
+            id=f"bandit-{result.get('test_id', 'unknown')}",
+            title=result.get("test_name", "Security issue"),
+            description=result.get("issue_text", ""),
+            severity=self._map_severity(result.get("issue_severity", "LOW")),
+            file_path=result.get("filename"),
+            line_number=result.get("line_number"),
+            tool="bandit",
+            rule_id=result.get("test_id"),
+            recommendation=result.get("more_info"),
+        )
 
     def _parse_safety_output(self, output: str) -> List[Vulnerability]:
         """Parse Safety JSON output"""
@@ -797,7 +1745,7 @@ class Scanner:
 
             # Safety output can be a list of vulnerabilities
             data = (
-                json.loads(output) if output.startswith("[") else [json.loads(output)]
+                _json_loads(output) if output.startswith("[") else [_json_loads(output)]
             )
 
             for result in data:
@@ -835,8 +1783,41 @@ class Scanner:
         return []
 
     def _parse_detect_secrets_output(self, output: str) -> List[Vulnerability]:
-        """Parse detect-secrets output - placeholder"""
-        return []
+        """Parse detect-secrets JSON baseline output"""
+        try:
+            if not output.strip():
+                return []
+
+            data = _json_loads(output)
+            return self._detect_secrets_results_to_vulnerabilities(
+                data.get("results", {})
+            )
+        except json.JSONDecodeError:
+            self.logger.error("Failed to parse detect-secrets output")
+            return []
+
+    def _detect_secrets_results_to_vulnerabilities(
+        self, results: Dict[str, List[Dict[str, Any]]]
+    ) -> List[Vulnerability]:
+        """Convert detect-secrets findings keyed by file to Vulnerabilities"""
+        vulnerabilities = []
+        for filename, secrets in results.items():
+            for secret in secrets:
+                secret_type = secret.get("type", "Secret")
+                vulnerabilities.append(
+                    Vulnerability(
+                        id=f"detect-secrets-{secret.get('hashed_secret', 'unknown')[:12]}",
+                        title=f"Potential secret: {secret_type}",
+                        description=f"{secret_type} detected in {filename}",
+                        severity=Severity.HIGH,
+                        file_path=filename,
+                        line_number=secret.get("line_number"),
+                        tool="detect-secrets",
+                        rule_id=secret_type,
+                        recommendation="Remove the secret from the code and rotate it",
+                    )
+                )
+        return _dedupe_vulnerabilities(vulnerabilities)
 
     def _parse_checkov_output(self, output: str) -> List[Vulnerability]:
         """Parse Checkov output - placeholder"""
@@ -856,14 +1837,7 @@ class Scanner:
 
     def _map_severity(self, severity_str: str) -> Severity:
         """Map string severity to Severity enum"""
-        severity_map = {
-            "CRITICAL": Severity.CRITICAL,
-            "HIGH": Severity.HIGH,
-            "MEDIUM": Severity.MEDIUM,
-            "LOW": Severity.LOW,
-            "INFO": Severity.INFO,
-            "WARNING": Severity.MEDIUM,
-            "ERROR": Severity.HIGH,
-        }
-
-        return severity_map.get(severity_str.upper(), Severity.INFO)
+        # Tools report in a handful of spellings; only odd ones pay for upper()
+        return _SEVERITY_MAP.get(severity_str) or _SEVERITY_MAP.get(
+            severity_str.upper(), Severity.INFO
+        )
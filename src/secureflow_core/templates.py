@@ -2,37 +2,261 @@
 Azure DevOps pipeline templates for SecureFlow
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional, TextIO, Union
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 import yaml
 
 from .utils import Logger
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml, use the pure-Python emitter
+    from yaml import SafeDumper as _Dumper
+
+
+# Steps shared by most jobs; the same objects are reused in every template,
+# so the dumper below must not turn the repeats into YAML aliases
+_USE_PYTHON_311 = MappingProxyType(
+    {"task": "UsePythonVersion@0", "inputs": {"versionSpec": "3.11"}}
+)
+_INSTALL_SECUREFLOW = MappingProxyType(
+    {"script": "pip install secureflow-core", "displayName": "Install SecureFlow"}
+)
+
+
+def _publish_artifacts(path: str, artifact_name: str) -> Dict[str, Any]:
+    """Step publishing a file as a build artifact"""
+    return {
+        "task": "PublishBuildArtifacts@1",
+        "inputs": {"pathToPublish": path, "artifactName": artifact_name},
+    }
+
+
+class _TemplateDumper(_Dumper):
+    """Safe dumper that writes repeated objects out in full"""
+
+    # Azure Pipelines YAML doesn't reliably support anchors and aliases
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+_TemplateDumper.add_representer(
+    MappingProxyType, lambda dumper, data: dumper.represent_dict(data)
+)
+
+
+def _dump_static(
+    document: Dict[str, Any], default_flow_style: Optional[bool] = False
+) -> bytes:
+    """Render a supporting template file that never changes"""
+    return yaml.dump(
+        document, Dumper=_TemplateDumper, default_flow_style=default_flow_style
+    ).encode()
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    """Write content to path unless the file already holds exactly it"""
+    try:
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(content)
+    return True
+
+
+# Supporting templates are static, so they are rendered once at import and
+# written out as bytes. The variable files are flat scalar mappings, so they
+# use compact flow style for the leaf mappings
+_VARIABLE_TEMPLATE_FILES = {
+    "security-vars.yml": _dump_static(
+        {
+            "variables": {
+                "SECUREFLOW_LOG_LEVEL": "INFO",
+                "SECUREFLOW_OUTPUT_FORMAT": "json",
+                "SECUREFLOW_FAIL_ON_HIGH": "true",
+                "SECUREFLOW_CACHE_ENABLED": "true",
+                "PYTHON_VERSION": "3.11",
+            }
+        },
+        default_flow_style=None,
+    ),
+    "compliance-vars.yml": _dump_static(
+        {
+            "variables": {
+                "COMPLIANCE_FRAMEWORKS": "SOC2,PCI_DSS",
+                "COMPLIANCE_REPORT_FORMAT": "json",
+                "COMPLIANCE_OUTPUT_DIR": "$(Agent.TempDirectory)/compliance",
+            }
+        },
+        default_flow_style=None,
+    ),
+}
+
+# Security scan stage template
+_SECURITY_STAGE = {
+    "parameters": [
+        {
+            "name": "scanTypes",
+            "type": "object",
+            "default": ["sast", "sca", "secrets"],
+        },
+        {"name": "failOnHigh", "type": "boolean", "default": True},
+    ],
+    "stages": [
+        {
+            "stage": "SecurityScan",
+            "displayName": "Security Scanning",
+            "jobs": [
+                {
+                    "job": "RunSecurityScans",
+                    "displayName": "Run Security Scans",
+                    "steps": [
+                        {
+                            "task": "UsePythonVersion@0",
+                            "inputs": {"versionSpec": "$(PYTHON_VERSION)"},
+                        },
+                        _INSTALL_SECUREFLOW,
+                        {
+                            "script": "secureflow scan --types ${{ join(',', parameters.scanTypes) }} ${{ parameters.failOnHigh and '--fail-on high' or '' }}",
+                            "displayName": "Run Security Scans",
+                        },
+                    ],
+                }
+            ],
+        }
+    ],
+}
+
+_PIPELINE_TEMPLATE_FILES = {
+    "security-scan-stage.yml": _dump_static(_SECURITY_STAGE),
+}
+
+# Python run by pipeline steps on the downloaded artifacts. The scripts are
+# inlined into the steps so a pushed pipeline doesn't depend on files that
+# only save_all_templates writes; each takes the download directory as argv[1]
+_COMBINE_RESULTS_SCRIPT = """\
+import glob
+import json
+import os
+import sys
+
+# Combine all scan results
+results = {}
+for result_file in glob.glob(os.path.join(sys.argv[1], "*-results", "*.json")):
+    scan_type = os.path.basename(result_file).replace("-results.json", "")
+    with open(result_file, "r") as f:
+        results[scan_type] = json.load(f)
+
+# Save combined results
+with open("combined-results.json", "w") as f:
+    json.dump(results, f, indent=2)
+"""
+
+_PROCESS_COMPLIANCE_SCRIPT = """\
+import glob
+import json
+import os
+import sys
+
+# Combine compliance results
+compliance_results = {}
+for result_file in glob.glob(os.path.join(sys.argv[1], "*-compliance", "*.json")):
+    framework = os.path.basename(os.path.dirname(result_file)).split("-compliance")[0]
+    with open(result_file, "r") as f:
+        compliance_results[framework] = json.load(f)
+
+# Generate comprehensive compliance report
+# This would use the SecureFlow compliance reporting functionality
+print("Compliance results processed")
+"""
+
+
+def _python_step(script: str, display_name: str) -> Dict[str, Any]:
+    """Step running a Python script fed through a quoted heredoc"""
+    return {
+        "script": f"python - $(Agent.TempDirectory) <<'EOF'\n{script}EOF\n",
+        "displayName": display_name,
+    }
+
+
+# Threads writing template files at once in save_all_templates
+TEMPLATE_WRITE_WORKERS = 4
+
+# Method building each built-in pipeline template
+_TEMPLATE_BUILDERS = {
+    "basic": "_get_basic_template",
+    "comprehensive": "_get_comprehensive_template",
+    "compliance": "_get_compliance_template",
+}
+
+# Valid template types, checked before any template is built
+_TEMPLATE_NAMES = frozenset(_TEMPLATE_BUILDERS)
+
+# Rendered YAML by template type, shared by every manager in the process;
+# the templates are a pure function of this module's code. This is kept in
+# memory only. Rendering all three templates takes a few milliseconds, about
+# what reading them back from disk would cost. A cache in the shared temp
+# directory would also let anyone who can write there plant YAML that ends
+# up in CI pipeline definitions
+_rendered_pipelines: Dict[str, str] = {}
+
 
 class PipelineTemplateManager:
     """Manages Azure DevOps pipeline templates"""
 
     def __init__(self):
-        self.logger = Logger(__name__)
-        self.templates = self._initialize_templates()
+        self.logger = Logger.get(__name__)
+        # Templates are built on first use; most callers only need one
+        self._templates: Dict[str, Mapping[str, Any]] = {}
 
-    def _initialize_templates(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize built-in pipeline templates"""
-        return {
-            "basic": self._get_basic_template(),
-            "comprehensive": self._get_comprehensive_template(),
-            "compliance": self._get_compliance_template(),
-        }
+    @property
+    def templates(self) -> Dict[str, Mapping[str, Any]]:
+        """
+        All built-in pipeline templates by type.
+
+        Each template is a single shared instance behind a read-only view;
+        callers must not modify the nested lists and dicts either.
+        """
+        return {name: self._get_template(name) for name in _TEMPLATE_BUILDERS}
+
+    def _get_template(self, template_type: str) -> Mapping[str, Any]:
+        """Get one built-in template, building it on first use"""
+        if template_type not in self._templates:
+            builder = getattr(self, _TEMPLATE_BUILDERS[template_type])
+            self._templates[template_type] = MappingProxyType(builder())
+        return self._templates[template_type]
 
-    def generate_pipeline(self, template_type: str, **kwargs) -> str:
-        """Generate pipeline YAML for specified template type"""
-        if template_type not in self.templates:
+    def generate_pipeline(
+        self, template_type: str, *, stream: Optional[TextIO] = None, **kwargs
+    ) -> Optional[str]:
+        """
+        Generate pipeline YAML for specified template type.
+
+        Args:
+            template_type: Built-in template to render
+            stream: Text stream to write the YAML to instead of returning it
+
+        Returns:
+            The pipeline YAML, or None when it was written to stream
+        """
+        if template_type not in _TEMPLATE_NAMES:
             raise ValueError(f"Unknown template type: {template_type}")
 
-        template = self.templates[template_type]
+        if template_type not in _rendered_pipelines:
+            _rendered_pipelines[template_type] = yaml.dump(
+                self._get_template(template_type),
+                Dumper=_TemplateDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
 
-        # Convert to YAML
-        return yaml.dump(template, default_flow_style=False, sort_keys=False)
+        if stream is not None:
+            stream.write(_rendered_pipelines[template_type])
+            return None
+        return _rendered_pipelines[template_type]
 
     def _get_basic_template(self) -> Dict[str, Any]:
         """Basic security pipeline template"""
@@ -49,14 +273,8 @@ class PipelineTemplateManager:
                             "job": "SAST",
                             "displayName": "Static Analysis",
                             "steps": [
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
                                 {
                                     "script": "secureflow scan --types sast --output sast-results.json --format json",
                                     "displayName": "Run SAST Scan",
@@ -96,14 +314,8 @@ class PipelineTemplateManager:
                             "job": "PreFlightCheck",
                             "displayName": "Pre-flight Security Check",
                             "steps": [
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
                                 {
                                     "script": "secureflow scan --types secrets --fail-on high",
                                     "displayName": "Secret Scan (Fail Fast)",
@@ -122,75 +334,48 @@ class PipelineTemplateManager:
                             "job": "StaticAnalysis",
                             "displayName": "Static Application Security Testing",
                             "steps": [
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
                                 {
                                     "script": "secureflow scan --types sast --output $(Agent.TempDirectory)/sast-results.json --format json",
                                     "displayName": "Run SAST Scan",
                                 },
-                                {
-                                    "task": "PublishBuildArtifacts@1",
-                                    "inputs": {
-                                        "pathToPublish": "$(Agent.TempDirectory)/sast-results.json",
-                                        "artifactName": "sast-results",
-                                    },
-                                },
+                                _publish_artifacts(
+                                    "$(Agent.TempDirectory)/sast-results.json",
+                                    "sast-results",
+                                ),
                             ],
                         },
                         {
                             "job": "DependencyAnalysis",
                             "displayName": "Software Composition Analysis",
                             "steps": [
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
                                 {
                                     "script": "secureflow scan --types sca --output $(Agent.TempDirectory)/sca-results.json --format json",
                                     "displayName": "Run SCA Scan",
                                 },
-                                {
-                                    "task": "PublishBuildArtifacts@1",
-                                    "inputs": {
-                                        "pathToPublish": "$(Agent.TempDirectory)/sca-results.json",
-                                        "artifactName": "sca-results",
-                                    },
-                                },
+                                _publish_artifacts(
+                                    "$(Agent.TempDirectory)/sca-results.json",
+                                    "sca-results",
+                                ),
                             ],
                         },
                         {
                             "job": "InfrastructureAnalysis",
                             "displayName": "Infrastructure as Code Security",
                             "steps": [
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
                                 {
                                     "script": "secureflow scan --types iac --output $(Agent.TempDirectory)/iac-results.json --format json",
                                     "displayName": "Run IaC Scan",
                                 },
-                                {
-                                    "task": "PublishBuildArtifacts@1",
-                                    "inputs": {
-                                        "pathToPublish": "$(Agent.TempDirectory)/iac-results.json",
-                                        "artifactName": "iac-results",
-                                    },
-                                },
+                                _publish_artifacts(
+                                    "$(Agent.TempDirectory)/iac-results.json",
+                                    "iac-results",
+                                ),
                             ],
                         },
                         {
@@ -207,25 +392,16 @@ class PipelineTemplateManager:
                                         "tags": "$(Build.Repository.Name):$(Build.BuildId)",
                                     },
                                 },
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
                                 {
                                     "script": "secureflow scan --types container --target $(Build.Repository.Name):$(Build.BuildId) --output $(Agent.TempDirectory)/container-results.json --format json",
                                     "displayName": "Run Container Scan",
                                 },
-                                {
-                                    "task": "PublishBuildArtifacts@1",
-                                    "inputs": {
-                                        "pathToPublish": "$(Agent.TempDirectory)/container-results.json",
-                                        "artifactName": "container-results",
-                                    },
-                                },
+                                _publish_artifacts(
+                                    "$(Agent.TempDirectory)/container-results.json",
+                                    "container-results",
+                                ),
                             ],
                         },
                     ],
@@ -247,46 +423,18 @@ class PipelineTemplateManager:
                                         "downloadPath": "$(Agent.TempDirectory)",
                                     },
                                 },
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
-                                {
-                                    "script": """
-python -c "
-import json
-import glob
-import os
-
-# Combine all scan results
-results = {}
-for result_file in glob.glob('$(Agent.TempDirectory)/*-results/*.json'):
-    scan_type = os.path.basename(result_file).replace('-results.json', '')
-    with open(result_file, 'r') as f:
-        results[scan_type] = json.load(f)
-
-# Save combined results
-with open('combined-results.json', 'w') as f:
-    json.dump(results, f, indent=2)
-"
-                                    """,
-                                    "displayName": "Combine Scan Results",
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
+                                _python_step(
+                                    _COMBINE_RESULTS_SCRIPT, "Combine Scan Results"
+                                ),
                                 {
                                     "script": "secureflow report --scan-results combined-results.json --output security-report.html --format html",
                                     "displayName": "Generate HTML Report",
                                 },
-                                {
-                                    "task": "PublishBuildArtifacts@1",
-                                    "inputs": {
-                                        "pathToPublish": "security-report.html",
-                                        "artifactName": "security-report",
-                                    },
-                                },
+                                _publish_artifacts(
+                                    "security-report.html", "security-report"
+                                ),
                                 {
                                     "task": "PublishTestResults@2",
                                     "inputs": {
@@ -310,14 +458,8 @@ with open('combined-results.json', 'w') as f:
                             "job": "QualityGateCheck",
                             "displayName": "Security Quality Gate",
                             "steps": [
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
                                 {
                                     "script": "secureflow scan --all --fail-on high",
                                     "displayName": "Security Quality Gate Check",
@@ -353,50 +495,30 @@ with open('combined-results.json', 'w') as f:
                             "job": "SOC2Compliance",
                             "displayName": "SOC 2 Compliance Check",
                             "steps": [
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
                                 {
                                     "script": "secureflow compliance --framework SOC2 --output soc2-compliance.json --format json",
                                     "displayName": "Run SOC 2 Compliance Check",
                                 },
-                                {
-                                    "task": "PublishBuildArtifacts@1",
-                                    "inputs": {
-                                        "pathToPublish": "soc2-compliance.json",
-                                        "artifactName": "soc2-compliance",
-                                    },
-                                },
+                                _publish_artifacts(
+                                    "soc2-compliance.json", "soc2-compliance"
+                                ),
                             ],
                         },
                         {
                             "job": "PCIDSSCompliance",
                             "displayName": "PCI DSS Compliance Check",
                             "steps": [
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
                                 {
                                     "script": "secureflow compliance --framework PCI_DSS --output pci-compliance.json --format json",
                                     "displayName": "Run PCI DSS Compliance Check",
                                 },
-                                {
-                                    "task": "PublishBuildArtifacts@1",
-                                    "inputs": {
-                                        "pathToPublish": "pci-compliance.json",
-                                        "artifactName": "pci-compliance",
-                                    },
-                                },
+                                _publish_artifacts(
+                                    "pci-compliance.json", "pci-compliance"
+                                ),
                             ],
                         },
                     ],
@@ -418,41 +540,15 @@ with open('combined-results.json', 'w') as f:
                                         "downloadPath": "$(Agent.TempDirectory)",
                                     },
                                 },
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "3.11"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
-                                {
-                                    "script": """
-python -c "
-import json
-import glob
-
-# Combine compliance results
-compliance_results = {}
-for result_file in glob.glob('$(Agent.TempDirectory)/*-compliance/*.json'):
-    framework = result_file.split('-compliance')[0].split('/')[-1]
-    with open(result_file, 'r') as f:
-        compliance_results[framework] = json.load(f)
-
-# Generate comprehensive compliance report
-# This would use the SecureFlow compliance reporting functionality
-print('Compliance results processed')
-"
-                                    """,
-                                    "displayName": "Process Compliance Results",
-                                },
-                                {
-                                    "task": "PublishBuildArtifacts@1",
-                                    "inputs": {
-                                        "pathToPublish": "compliance-report.html",
-                                        "artifactName": "compliance-report",
-                                    },
-                                },
+                                _USE_PYTHON_311,
+                                _INSTALL_SECUREFLOW,
+                                _python_step(
+                                    _PROCESS_COMPLIANCE_SCRIPT,
+                                    "Process Compliance Results",
+                                ),
+                                _publish_artifacts(
+                                    "compliance-report.html", "compliance-report"
+                                ),
                             ],
                         }
                     ],
@@ -460,104 +556,55 @@ print('Compliance results processed')
             ],
         }
 
-    def create_variable_templates(self, output_dir: str):
+    def create_variable_templates(self, output_dir: Union[str, Path]):
         """Create variable template files"""
-        output_path = Path(output_dir)
-        variables_dir = output_path / "variables"
+        variables_dir = Path(output_dir) / "variables"
         variables_dir.mkdir(parents=True, exist_ok=True)
 
-        # Security variables
-        security_vars = {
-            "variables": {
-                "SECUREFLOW_LOG_LEVEL": "INFO",
-                "SECUREFLOW_OUTPUT_FORMAT": "json",
-                "SECUREFLOW_FAIL_ON_HIGH": "true",
-                "SECUREFLOW_CACHE_ENABLED": "true",
-                "PYTHON_VERSION": "3.11",
-            }
-        }
-
-        with open(variables_dir / "security-vars.yml", "w") as f:
-            yaml.dump(security_vars, f, default_flow_style=False)
-
-        # Compliance variables
-        compliance_vars = {
-            "variables": {
-                "COMPLIANCE_FRAMEWORKS": "SOC2,PCI_DSS",
-                "COMPLIANCE_REPORT_FORMAT": "json",
-                "COMPLIANCE_OUTPUT_DIR": "$(Agent.TempDirectory)/compliance",
-            }
-        }
-
-        with open(variables_dir / "compliance-vars.yml", "w") as f:
-            yaml.dump(compliance_vars, f, default_flow_style=False)
+        for filename, content in _VARIABLE_TEMPLATE_FILES.items():
+            _write_if_changed(variables_dir / filename, content)
 
         self.logger.info(f"Created variable templates in {variables_dir}")
 
-    def create_pipeline_templates(self, output_dir: str):
+    def create_pipeline_templates(self, output_dir: Union[str, Path]):
         """Create pipeline template files"""
-        output_path = Path(output_dir)
-        templates_dir = output_path / "templates"
+        templates_dir = Path(output_dir) / "templates"
         templates_dir.mkdir(parents=True, exist_ok=True)
 
-        # Security scan stage template
-        security_stage = {
-            "parameters": [
-                {
-                    "name": "scanTypes",
-                    "type": "object",
-                    "default": ["sast", "sca", "secrets"],
-                },
-                {"name": "failOnHigh", "type": "boolean", "default": True},
-            ],
-            "stages": [
-                {
-                    "stage": "SecurityScan",
-                    "displayName": "Security Scanning",
-                    "jobs": [
-                        {
-                            "job": "RunSecurityScans",
-                            "displayName": "Run Security Scans",
-                            "steps": [
-                                {
-                                    "task": "UsePythonVersion@0",
-                                    "inputs": {"versionSpec": "$(PYTHON_VERSION)"},
-                                },
-                                {
-                                    "script": "pip install secureflow-core",
-                                    "displayName": "Install SecureFlow",
-                                },
-                                {
-                                    "script": "secureflow scan --types ${{ join(',', parameters.scanTypes) }} ${{ parameters.failOnHigh and '--fail-on high' or '' }}",
-                                    "displayName": "Run Security Scans",
-                                },
-                            ],
-                        }
-                    ],
-                }
-            ],
-        }
-
-        with open(templates_dir / "security-scan-stage.yml", "w") as f:
-            yaml.dump(security_stage, f, default_flow_style=False)
+        for filename, content in _PIPELINE_TEMPLATE_FILES.items():
+            _write_if_changed(templates_dir / filename, content)
 
         self.logger.info(f"Created pipeline templates in {templates_dir}")
 
-    def save_all_templates(self, output_dir: str):
+    def save_all_templates(self, output_dir: Union[str, Path]):
         """Save all templates to directory"""
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        # Save main pipeline templates
-        for template_name, template_content in self.templates.items():
-            filename = f"azure-pipelines-{template_name}.yml"
-            with open(output_path / filename, "w") as f:
-                yaml.dump(
-                    template_content, f, default_flow_style=False, sort_keys=False
-                )
-
-        # Create supporting templates
-        self.create_variable_templates(str(output_path))
-        self.create_pipeline_templates(str(output_path))
+        variables_dir = output_path / "variables"
+        templates_dir = output_path / "templates"
+        for directory in (variables_dir, templates_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        # Main pipeline templates, then the supporting templates
+        files = [
+            (
+                output_path / f"azure-pipelines-{template_name}.yml",
+                self.generate_pipeline(template_name).encode(),
+            )
+            for template_name in _TEMPLATE_BUILDERS
+        ]
+        files.extend(
+            (variables_dir / filename, content)
+            for filename, content in _VARIABLE_TEMPLATE_FILES.items()
+        )
+        files.extend(
+            (templates_dir / filename, content)
+            for filename, content in _PIPELINE_TEMPLATE_FILES.items()
+        )
+
+        # The files are independent, so overlap the writes; this matters on
+        # network filesystems where each write waits on a round trip. Files
+        # already up to date are left alone, keeping their mtimes
+        with ThreadPoolExecutor(max_workers=TEMPLATE_WRITE_WORKERS) as pool:
+            list(pool.map(lambda item: _write_if_changed(*item), files))
 
         self.logger.info(f"Saved all templates to {output_path}")
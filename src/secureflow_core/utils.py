@@ -2,13 +2,50 @@
 Utility modules for SecureFlow
 """
 
+import hashlib
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
 import sys
-from typing import Dict, Any, Optional
+import threading
+import time
+from collections import ChainMap, Counter
+from collections.abc import Mapping as MappingABC
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 import json
 
+try:
+    from blake3 import blake3
+except ImportError:  # Optional speedup, fall back to hashlib.blake2b
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json module
+    orjson = None
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Log records buffered before they are written to the log file
+LOG_BUFFER_CAPACITY = 256
+
 
 class Logger:
     """Enhanced logger for SecureFlow"""
@@ -17,6 +54,21 @@ class Logger:
         self.logger = logging.getLogger(name)
         self._setup_logger()
 
+        # Log straight through the underlying logger, without a wrapper frame
+        self.debug = self.logger.debug
+        self.info = self.logger.info
+        self.warning = self.logger.warning
+        self.error = self.logger.error
+        self.critical = self.logger.critical
+
+    @classmethod
+    def get(cls, name: str) -> "Logger":
+        """Get the shared logger for name, creating it on first use"""
+        logger = _LOGGERS.get(name)
+        if logger is None:
+            logger = _LOGGERS.setdefault(name, cls(name))
+        return logger
+
     def _setup_logger(self):
         """Set up logger with appropriate handlers and formatting"""
         if not self.logger.handlers:
@@ -29,17 +81,22 @@ class Logger:
 
             # File handler (optional)
             log_dir = Path(".secureflow-logs")
-            if not log_dir.exists():
-                log_dir.mkdir(exist_ok=True)
+            log_dir.mkdir(exist_ok=True)
 
-            file_handler = logging.FileHandler(log_dir / "secureflow.log")
+            # Opened on the first record, not for loggers that never write
+            file_handler = logging.FileHandler(log_dir / "secureflow.log", delay=True)
             file_formatter = logging.Formatter(
                 "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
             )
             file_handler.setFormatter(file_formatter)
 
+            # Batch file writes; errors and logging.shutdown() at exit flush
+            buffered_handler = logging.handlers.MemoryHandler(
+                LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+            )
+
             self.logger.addHandler(console_handler)
-            self.logger.addHandler(file_handler)
+            self.logger.addHandler(buffered_handler)
             self.logger.setLevel(logging.INFO)
 
     def set_level(self, level: str):
@@ -53,123 +110,184 @@ class Logger:
         }
         self.logger.setLevel(level_map.get(level.upper(), logging.INFO))
 
-    def debug(self, message: str):
-        """Log debug message"""
-        self.logger.debug(message)
 
-    def info(self, message: str):
-        """Log info message"""
-        self.logger.info(message)
+# Loggers handed out by Logger.get, by name
+_LOGGERS: Dict[str, Logger] = {}
+
+
+# Severities counted by SecurityMetrics, most severe first
+_SEVERITY_LEVELS = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO")
+_KNOWN_SEVERITIES = frozenset(_SEVERITY_LEVELS)
+
+# Recorded counters exposed by SecurityMetrics.metrics, in display order
+_METRIC_COUNTERS = (
+    "scans_completed",
+    "vulnerabilities_found",
+    "vulnerabilities_by_severity",
+    "scan_types",
+    "tools_used",
+    "scan_duration_sum",
+    "scan_duration_count",
+    "compliance_checks",
+    "compliance_failures",
+)
+_METRIC_COUNTER_NAMES = frozenset(_METRIC_COUNTERS)
+
 
-    def warning(self, message: str):
-        """Log warning message"""
-        self.logger.warning(message)
+class _MetricCounters(MappingABC):
+    """Live, read-only mapping over a SecurityMetrics object's counters"""
 
-    def error(self, message: str):
-        """Log error message"""
-        self.logger.error(message)
+    __slots__ = ("_owner",)
 
-    def critical(self, message: str):
-        """Log critical message"""
-        self.logger.critical(message)
+    def __init__(self, owner: "SecurityMetrics"):
+        self._owner = owner
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _METRIC_COUNTER_NAMES:
+            raise KeyError(key)
+        return getattr(self._owner, key)
+
+    def __iter__(self):
+        return iter(_METRIC_COUNTERS)
+
+    def __len__(self) -> int:
+        return len(_METRIC_COUNTERS)
 
 
 class SecurityMetrics:
     """Security metrics collection and analysis"""
 
+    # Counters are plain attributes, assembled into dicts only when read
+    __slots__ = (
+        "scans_completed",
+        "vulnerabilities_found",
+        "vulnerabilities_by_severity",
+        "scan_types",
+        "tools_used",
+        "scan_duration_sum",
+        "scan_duration_count",
+        "compliance_checks",
+        "compliance_failures",
+        "_last_updated",
+        "logger",
+    )
+
     def __init__(self):
-        self.metrics = {
-            "scans_completed": 0,
-            "vulnerabilities_found": 0,
-            "vulnerabilities_by_severity": {
-                "CRITICAL": 0,
-                "HIGH": 0,
-                "MEDIUM": 0,
-                "LOW": 0,
-                "INFO": 0,
-            },
-            "scan_types": {"sast": 0, "sca": 0, "secrets": 0, "iac": 0, "container": 0},
-            "tools_used": {},
-            "scan_durations": [],
-            "compliance_checks": 0,
-            "compliance_failures": 0,
-            "last_updated": None,
-        }
-        self.logger = Logger(__name__)
+        self.scans_completed = 0
+        self.vulnerabilities_found = 0
+        self.vulnerabilities_by_severity = Counter(dict.fromkeys(_SEVERITY_LEVELS, 0))
+        self.scan_types = {"sast": 0, "sca": 0, "secrets": 0, "iac": 0, "container": 0}
+        self.tools_used = Counter()
+        self.scan_duration_sum = 0.0
+        self.scan_duration_count = 0
+        self.compliance_checks = 0
+        self.compliance_failures = 0
+        # Wall-clock time of the last recording, formatted only when read
+        self._last_updated: Optional[float] = None
+        self.logger = Logger.get(__name__)
+
+    @property
+    def metrics(self) -> Mapping[str, Any]:
+        """
+        Live, read-only view of the recorded counters, without the derived
+        metrics. Assigning through it raises TypeError; record through the
+        record_* methods instead.
+        """
+        return _MetricCounters(self)
 
     def record_scan_completion(self, scan_results: Dict[str, Any]):
         """Record completion of security scans"""
-        self.metrics["scans_completed"] += 1
-        self.metrics["last_updated"] = datetime.now().isoformat()
+        self.scans_completed += 1
+        self._last_updated = time.time()
 
         for scan_type, result in scan_results.items():
             # Update scan type count
-            if scan_type in self.metrics["scan_types"]:
-                self.metrics["scan_types"][scan_type] += 1
+            if scan_type in self.scan_types:
+                self.scan_types[scan_type] += 1
 
             # Process scan result
             if isinstance(result, dict):
                 # Update tool usage
-                tool = result.get("tool", "unknown")
-                self.metrics["tools_used"][tool] = (
-                    self.metrics["tools_used"].get(tool, 0) + 1
-                )
+                self.tools_used[result.get("tool", "unknown")] += 1
 
-                # Update vulnerability counts
-                vulnerabilities = result.get("vulnerabilities", [])
-                self.metrics["vulnerabilities_found"] += len(vulnerabilities)
+                # Update vulnerability counts, only for known severities
+                vulnerabilities = result.get("vulnerabilities")
+                if vulnerabilities:
+                    self.vulnerabilities_found += len(vulnerabilities)
 
-                for vuln in vulnerabilities:
-                    severity = vuln.get("severity", "INFO")
-                    if severity in self.metrics["vulnerabilities_by_severity"]:
-                        self.metrics["vulnerabilities_by_severity"][severity] += 1
+                    severity_counts = self.vulnerabilities_by_severity
+                    for severity, count in Counter(
+                        vuln.get("severity", "INFO") for vuln in vulnerabilities
+                    ).items():
+                        if severity in _KNOWN_SEVERITIES:
+                            severity_counts[severity] += count
 
                 # Record scan duration
                 duration = result.get("scan_duration", 0)
                 if duration > 0:
-                    self.metrics["scan_durations"].append(duration)
+                    self.scan_duration_sum += duration
+                    self.scan_duration_count += 1
 
-        self.logger.info(f"Recorded metrics for scan completion")
+        self.logger.info("Recorded metrics for scan completion")
 
     def record_compliance_check(self, results: Dict[str, Any]):
         """Record compliance check results"""
-        self.metrics["compliance_checks"] += 1
+        self.compliance_checks += 1
 
         for framework, result in results.items():
             if not result.get("compliant", True):
-                self.metrics["compliance_failures"] += 1
+                self.compliance_failures += 1
 
-        self.metrics["last_updated"] = datetime.now().isoformat()
-        self.logger.info(f"Recorded compliance check metrics")
+        self._last_updated = time.time()
+        self.logger.info("Recorded compliance check metrics")
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics"""
-        metrics = self.metrics.copy()
+        return {**self.metrics, **self._derived_metrics()}
+
+    def get_metrics_view(self) -> Mapping[str, Any]:
+        """
+        Get a read-only view of current metrics without copying them.
+
+        The recorded counters stay live in the view; the derived averages
+        and rates are computed when the view is taken. Nested counts are
+        shared with this object and must not be modified.
+        """
+        return MappingProxyType(ChainMap(self._derived_metrics(), self.metrics))
+
+    def _derived_metrics(self) -> Dict[str, Any]:
+        """Calculate the metrics derived from the recorded counters"""
+        metrics = {
+            "last_updated": (
+                datetime.fromtimestamp(self._last_updated).isoformat()
+                if self._last_updated is not None
+                else None
+            )
+        }
 
         # Calculate additional metrics
-        if self.metrics["scan_durations"]:
-            metrics["average_scan_duration"] = sum(
-                self.metrics["scan_durations"]
-            ) / len(self.metrics["scan_durations"])
-            metrics["total_scan_time"] = sum(self.metrics["scan_durations"])
+        if self.scan_duration_count:
+            metrics["average_scan_duration"] = (
+                self.scan_duration_sum / self.scan_duration_count
+            )
+            metrics["total_scan_time"] = self.scan_duration_sum
         else:
             metrics["average_scan_duration"] = 0
             metrics["total_scan_time"] = 0
 
         # Calculate compliance rate
-        if self.metrics["compliance_checks"] > 0:
+        if self.compliance_checks > 0:
             success_rate = (
-                self.metrics["compliance_checks"] - self.metrics["compliance_failures"]
-            ) / self.metrics["compliance_checks"]
+                self.compliance_checks - self.compliance_failures
+            ) / self.compliance_checks
             metrics["compliance_success_rate"] = round(success_rate * 100, 2)
         else:
             metrics["compliance_success_rate"] = 0
 
         # Calculate vulnerability density
-        if self.metrics["scans_completed"] > 0:
+        if self.scans_completed > 0:
             metrics["average_vulnerabilities_per_scan"] = round(
-                self.metrics["vulnerabilities_found"] / self.metrics["scans_completed"],
-                2,
+                self.vulnerabilities_found / self.scans_completed, 2
             )
         else:
             metrics["average_vulnerabilities_per_scan"] = 0
@@ -181,12 +299,11 @@ class SecurityMetrics:
         metrics = self.get_metrics()
 
         if format.lower() == "json":
-            with open(file_path, "w") as f:
-                json.dump(metrics, f, indent=2)
+            Path(file_path).write_bytes(_json_dumps(metrics, indent=True))
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
-        self.logger.info(f"Exported metrics to {file_path}")
+        self.logger.info("Exported metrics to %s", file_path)
 
     def reset_metrics(self):
         """Reset all metrics"""
@@ -194,6 +311,40 @@ class SecurityMetrics:
         self.logger.info("Reset all security metrics")
 
 
+# Prefix of CacheManager keys; bump it when the key scheme changes
+CACHE_KEY_VERSION = "sf1"
+
+# Cache writes queued before cache_result blocks, and how long the writer
+# thread waits for more before exiting
+CACHE_WRITE_QUEUE_SIZE = 1024
+CACHE_WRITER_IDLE_SECONDS = 0.5
+
+# Findings in a scan result above which it is streamed to its cache file
+CACHE_STREAM_MIN_FINDINGS = 1000
+
+
+def _write_json_streamed(path: Path, result: Dict[str, Any]):
+    """Write a result as JSON one list item at a time, then move it into place"""
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(b"{")
+        for index, (key, value) in enumerate(result.items()):
+            if index:
+                f.write(b",")
+            f.write(_json_dumps(str(key)) + b":")
+            if isinstance(value, list):
+                f.write(b"[")
+                for item_index, item in enumerate(value):
+                    if item_index:
+                        f.write(b",")
+                    f.write(_json_dumps(item))
+                f.write(b"]")
+            else:
+                f.write(_json_dumps(value))
+        f.write(b"}")
+    os.replace(tmp_path, path)
+
+
 class CacheManager:
     """Cache manager for scan results and other data"""
 
@@ -201,22 +352,35 @@ class CacheManager:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.ttl = ttl  # Time to live in seconds
-        self.logger = Logger(__name__)
+        self.logger = Logger.get(__name__)
+
+        # Results are written by a background thread; until then they are
+        # served from _pending so reads never see a stale file
+        self._pending: Dict[Path, bytes] = {}
+        self._pending_lock = threading.Lock()
+        # Held while writing a cache file, so a superseded result can't
+        # overwrite a newer one
+        self._file_lock = threading.Lock()
+        self._write_queue: "queue.Queue[Path]" = queue.Queue(
+            maxsize=CACHE_WRITE_QUEUE_SIZE
+        )
+        self._writer: Optional[threading.Thread] = None
 
     def get_cache_key(self, scan_type: str, target: str, tool: str) -> str:
         """Generate cache key for scan results"""
-        import hashlib
-
         key_string = f"{scan_type}:{target}:{tool}"
-        return hashlib.md5(key_string.encode()).hexdigest()
+        digest = hashlib.blake2b(key_string.encode(), digest_size=8).hexdigest()
+        # Versioned so files keyed by an older scheme are never read back
+        return f"{CACHE_KEY_VERSION}_{digest}"
 
     def is_cache_valid(self, cache_file: Path) -> bool:
         """Check if cache file is still valid based on TTL"""
-        if not cache_file.exists():
+        try:
+            mtime = cache_file.stat().st_mtime
+        except FileNotFoundError:
             return False
 
-        file_age = datetime.now().timestamp() - cache_file.stat().st_mtime
-        return file_age < self.ttl
+        return time.time() - mtime < self.ttl
 
     def get_cached_result(
         self, scan_type: str, target: str, tool: str
@@ -225,11 +389,16 @@ class CacheManager:
         cache_key = self.get_cache_key(scan_type, target, tool)
         cache_file = self.cache_dir / f"{cache_key}.json"
 
+        with self._pending_lock:
+            pending = self._pending.get(cache_file)
+        if pending is not None:
+            return _json_loads(pending)
+
         if self.is_cache_valid(cache_file):
             try:
-                with open(cache_file, "r") as f:
-                    result = json.load(f)
-                self.logger.debug(f"Retrieved cached result for {scan_type}:{tool}")
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                result = _json_loads(cache_file.read_bytes())
+                self.logger.debug("Retrieved cached result for %s:%s", scan_type, tool)
                 return result
             except (json.JSONDecodeError, IOError) as e:
                 self.logger.warning(f"Failed to read cache file {cache_file}: {str(e)}")
@@ -244,104 +413,372 @@ class CacheManager:
         """Cache scan result"""
         cache_key = self.get_cache_key(scan_type, target, tool)
         cache_file = self.cache_dir / f"{cache_key}.json"
+        self._tag(scan_type, target, cache_key)
+
+        # Large results are streamed straight to disk rather than held in
+        # memory as one serialized buffer
+        if len(result.get("vulnerabilities", ())) >= CACHE_STREAM_MIN_FINDINGS:
+            with self._pending_lock:
+                # Supersede any older result still waiting to be written
+                self._pending.pop(cache_file, None)
+            try:
+                with self._file_lock:
+                    _write_json_streamed(cache_file, result)
+                self.logger.debug("Cached result for %s:%s", scan_type, tool)
+            except OSError as e:
+                self.logger.warning(f"Failed to cache result: {str(e)}")
+            return
+
+        # Cache files are only read back by us, so skip the indentation
+        with self._pending_lock:
+            self._pending[cache_file] = _json_dumps(result)
+
+        # Blocks only when the writer has fallen a full queue behind
+        self._write_queue.put(cache_file)
+        with self._pending_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_pending, name="secureflow-cache-writer"
+                )
+                self._writer.start()
 
+        self.logger.debug("Cached result for %s:%s", scan_type, tool)
+
+    def _write_pending(self):
+        """Write queued results to disk, in batches, until the queue stays empty"""
+        while True:
+            try:
+                batch = [self._write_queue.get(timeout=CACHE_WRITER_IDLE_SECONDS)]
+            except queue.Empty:
+                with self._pending_lock:
+                    if self._write_queue.empty():
+                        self._writer = None
+                        return
+                continue
+
+            while True:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for cache_file in batch:
+                with self._file_lock:
+                    with self._pending_lock:
+                        data = self._pending.get(cache_file)
+
+                    # A file queued twice is written once, with the newest result
+                    if data is not None:
+                        try:
+                            cache_file.write_bytes(data)
+                        except OSError as e:
+                            self.logger.warning(f"Failed to cache result: {str(e)}")
+                        with self._pending_lock:
+                            if self._pending.get(cache_file) is data:
+                                del self._pending[cache_file]
+
+                self._write_queue.task_done()
+
+    def flush(self):
+        """Wait until every cached result has been written to disk"""
+        self._write_queue.join()
+
+    def _tag_dir(self, scan_type: str, target: str) -> Path:
+        """Get the directory of tags for one scan type and target"""
+        target_digest = hashlib.blake2b(target.encode(), digest_size=8).hexdigest()
+        return self.cache_dir / "tags" / scan_type / target_digest
+
+    def _tag(self, scan_type: str, target: str, cache_key: str):
+        """Record which scan type and target a cache entry belongs to"""
+        tag_dir = self._tag_dir(scan_type, target)
         try:
-            with open(cache_file, "w") as f:
-                json.dump(result, f, indent=2)
-            self.logger.debug(f"Cached result for {scan_type}:{tool}")
-        except IOError as e:
-            self.logger.warning(f"Failed to cache result: {str(e)}")
-
-    def clear_cache(self):
-        """Clear all cached results"""
-        for cache_file in self.cache_dir.glob("*.json"):
+            tag_dir.mkdir(parents=True, exist_ok=True)
+            (tag_dir / cache_key).touch()
+        except OSError as e:
+            self.logger.warning(f"Failed to tag cache entry {cache_key}: {str(e)}")
+
+    def clear_cache(
+        self, scan_type: Optional[str] = None, target: Optional[str] = None
+    ):
+        """
+        Clear cached results.
+
+        Args:
+            scan_type: Only clear results of this scan type
+            target: Only clear results for this target
+        """
+        self.flush()
+
+        if scan_type is None and target is None:
+            cache_files = list(self.cache_dir.glob("*.json"))
+            shutil.rmtree(self.cache_dir / "tags", ignore_errors=True)
+        else:
+            # Tags name the entries to drop, so only those files are touched
+            if target is not None:
+                pattern = self._tag_dir(scan_type or "*", target)
+            else:
+                pattern = self.cache_dir / "tags" / scan_type / "*"
+            cache_files = []
+            for tag_dir in self.cache_dir.glob(
+                str(pattern.relative_to(self.cache_dir))
+            ):
+                cache_files.extend(
+                    self.cache_dir / f"{tag.name}.json" for tag in tag_dir.iterdir()
+                )
+                shutil.rmtree(tag_dir, ignore_errors=True)
+
+        for cache_file in cache_files:
             try:
-                cache_file.unlink()
+                cache_file.unlink(missing_ok=True)
             except OSError as e:
                 self.logger.warning(
                     f"Failed to delete cache file {cache_file}: {str(e)}"
                 )
 
-        self.logger.info("Cleared all cached results")
+        if scan_type is None and target is None:
+            self.logger.info("Cleared all cached results")
+        else:
+            self.logger.info(
+                "Cleared cached results for scan type %s, target %s",
+                scan_type or "any",
+                target or "any",
+            )
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        cache_files = list(self.cache_dir.glob("*.json"))
-        valid_files = [f for f in cache_files if self.is_cache_valid(f)]
-
-        total_size = sum(f.stat().st_size for f in cache_files)
+        self.flush()
+
+        # One stat per entry gives both its size and its age
+        now = time.time()
+        total_files = valid_files = total_size = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                total_files += 1
+                total_size += stat.st_size
+                if now - stat.st_mtime < self.ttl:
+                    valid_files += 1
 
         return {
-            "total_files": len(cache_files),
-            "valid_files": len(valid_files),
-            "expired_files": len(cache_files) - len(valid_files),
+            "total_files": total_files,
+            "valid_files": valid_files,
+            "expired_files": total_files - valid_files,
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "cache_directory": str(self.cache_dir),
         }
 
 
+# Bytes hashed at a time by ScanCache.file_digest
+FILE_DIGEST_CHUNK_SIZE = 64 * 1024
+
+
+class ScanCache:
+    """Content-addressed cache of per-file scanner findings"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(
+            cache_dir or Path.home() / ".cache" / "secureflow"
+        ).expanduser()
+        self.logger = Logger.get(__name__)
+
+    @staticmethod
+    def file_digest(file_path: str) -> str:
+        """Hash file contents with BLAKE3, or BLAKE2b if blake3 is missing"""
+        hasher = blake3() if blake3 is not None else hashlib.blake2b(digest_size=32)
+        # Feed the hash in chunks so large files are never held in memory whole
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(FILE_DIGEST_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _entry_path(self, tool: str, rule_version: str, digest: str) -> Path:
+        """Get the cache file for one file digest"""
+        return self.cache_dir / tool / rule_version / digest[:2] / f"{digest}.json"
+
+    def lookup(
+        self, tool: str, rule_version: str, file_paths: Iterable[str]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
+        """
+        Split files into cache hits and misses.
+
+        Args:
+            tool: Scanner name
+            rule_version: Identifies the rule set; changing it invalidates entries
+            file_paths: Files about to be scanned
+
+        Returns:
+            Cached findings by file path, and the digest of each missed file
+            by file path to pass to store() after scanning it
+        """
+        hits = {}
+        misses = {}
+
+        for file_path in file_paths:
+            try:
+                digest = self.file_digest(file_path)
+            except OSError:
+                continue
+
+            entry = self._entry_path(tool, rule_version, digest)
+            try:
+                findings = _json_loads(entry.read_bytes())
+            except (OSError, json.JSONDecodeError):
+                misses[file_path] = digest
+                continue
+
+            # Identical content may live at another path than when cached
+            for finding in findings:
+                finding["file_path"] = file_path
+            hits[file_path] = findings
+
+        return hits, misses
+
+    def store(
+        self,
+        tool: str,
+        rule_version: str,
+        digest: str,
+        findings: List[Dict[str, Any]],
+    ):
+        """Cache the findings for one file digest"""
+        entry = self._entry_path(tool, rule_version, digest)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry.with_suffix(".tmp")
+            tmp_path.write_bytes(_json_dumps(findings))
+            os.replace(tmp_path, entry)
+        except OSError as e:
+            self.logger.warning("Failed to cache %s findings: %s", tool, e)
+
+
+# Top-level files marking a project type in FileUtils.get_project_type
+_PYTHON_MARKERS = frozenset({"requirements.txt", "setup.py", "pyproject.toml"})
+_JAVA_MARKERS = frozenset({"pom.xml", "build.gradle"})
+_DOTNET_SUFFIXES = (".csproj", ".sln")
+
+# Types decided by top-level markers alone. The others depend on nested
+# .NET and Terraform files, which the directory's mtime doesn't track
+_TOP_LEVEL_PROJECT_TYPES = frozenset({"python", "node", "java"})
+
+# Detected top-level project types by (resolved directory, mtime), oldest first
+PROJECT_TYPE_CACHE_SIZE = 256
+_PROJECT_TYPE_CACHE: Dict[Tuple[str, int], Optional[str]] = {}
+
+
 class FileUtils:
     """File and directory utilities"""
 
     @staticmethod
     def find_files_by_extension(directory: str, extensions: list) -> list:
         """Find files with specific extensions in directory"""
-        directory_path = Path(directory)
+        # Normalize extensions (ensure they start with .)
+        suffixes = tuple(
+            ext if ext.startswith(".") else f".{ext}" for ext in extensions
+        )
+        if not suffixes:
+            return []
+
+        # One walk of the tree, however many extensions are asked for
         files = []
+        for root, _, filenames in os.walk(directory):
+            files.extend(
+                os.path.join(root, name)
+                for name in filenames
+                if name.endswith(suffixes)
+            )
 
-        for ext in extensions:
-            # Normalize extension (ensure it starts with .)
-            if not ext.startswith("."):
-                ext = f".{ext}"
+        return files
+
+    @staticmethod
+    def get_project_type(directory: str) -> Optional[str]:
+        """
+        Detect project type based on files present.
+
+        Types found from top-level markers are cached per directory until its
+        modification time changes, which happens when top-level entries are
+        added, removed or renamed. Detection that had to look at nested files
+        isn't cached, since changes inside subdirectories don't touch it.
+        """
+        directory_path = Path(directory).resolve()
+        try:
+            key = (str(directory_path), directory_path.stat().st_mtime_ns)
+        except OSError:  # Missing or unreadable
+            return None
+        if key in _PROJECT_TYPE_CACHE:
+            return _PROJECT_TYPE_CACHE[key]
 
-            files.extend(directory_path.rglob(f"*{ext}"))
+        project_type = FileUtils._detect_project_type(directory_path)
 
-        return [str(f) for f in files]
+        if project_type in _TOP_LEVEL_PROJECT_TYPES:
+            if len(_PROJECT_TYPE_CACHE) >= PROJECT_TYPE_CACHE_SIZE:
+                # Evict the oldest entry
+                del _PROJECT_TYPE_CACHE[next(iter(_PROJECT_TYPE_CACHE))]
+            _PROJECT_TYPE_CACHE[key] = project_type
+        return project_type
 
     @staticmethod
-    def get_project_type(directory: str) -> Optional[str]:
-        """Detect project type based on files present"""
-        directory_path = Path(directory)
+    def _detect_project_type(directory: Path) -> Optional[str]:
+        """Detect project type without consulting the cache"""
+        # One listing answers every top-level marker check
+        try:
+            with os.scandir(directory) as it:
+                entries = {entry.name for entry in it}
+        except OSError:  # Missing, unreadable or not a directory
+            return None
 
         # Python
-        if (
-            (directory_path / "requirements.txt").exists()
-            or (directory_path / "setup.py").exists()
-            or (directory_path / "pyproject.toml").exists()
-        ):
+        if not entries.isdisjoint(_PYTHON_MARKERS):
             return "python"
 
         # Node.js
-        if (directory_path / "package.json").exists():
+        if "package.json" in entries:
             return "node"
 
         # Java
-        if (directory_path / "pom.xml").exists() or (
-            directory_path / "build.gradle"
-        ).exists():
+        if not entries.isdisjoint(_JAVA_MARKERS):
             return "java"
 
+        # .NET and Terraform files may be nested, so look for both in a
+        # single walk of the tree
+        has_dotnet, has_terraform = FileUtils._find_nested_markers(directory)
+
         # .NET
-        if list(directory_path.rglob("*.csproj")) or list(
-            directory_path.rglob("*.sln")
-        ):
+        if has_dotnet:
             return "dotnet"
 
         # Go
-        if (directory_path / "go.mod").exists():
+        if "go.mod" in entries:
             return "go"
 
         # Terraform
-        if list(directory_path.rglob("*.tf")):
+        if has_terraform:
             return "terraform"
 
         # Docker
-        if (directory_path / "Dockerfile").exists():
+        if "Dockerfile" in entries:
             return "docker"
 
         return None
 
+    @staticmethod
+    def _find_nested_markers(directory: str) -> Tuple[bool, bool]:
+        """Check a tree for .NET project and Terraform files"""
+        has_dotnet = has_terraform = False
+
+        for _, _, filenames in os.walk(directory):
+            for name in filenames:
+                if name.endswith(_DOTNET_SUFFIXES):
+                    has_dotnet = True
+                elif name.endswith(".tf"):
+                    has_terraform = True
+            if has_dotnet and has_terraform:
+                break
+
+        return has_dotnet, has_terraform
+
     @staticmethod
     def create_backup(file_path: str) -> str:
         """Create backup of file"""
@@ -363,6 +800,21 @@ class FileUtils:
         Path(directory_path).mkdir(parents=True, exist_ok=True)
 
 
+# Display name and supported tools for each scanning config *_tool field
+_VALID_SCAN_TOOLS = MappingProxyType(
+    {
+        "sast": ("SAST", frozenset({"semgrep", "bandit", "sonarqube"})),
+        "sca": ("SCA", frozenset({"safety", "pip-audit", "npm-audit"})),
+        "secrets": (
+            "secrets",
+            frozenset({"trufflehog", "gitleaks", "detect-secrets", "semgrep"}),
+        ),
+        "iac": ("IaC", frozenset({"checkov", "tfsec", "terrascan", "semgrep"})),
+        "container": ("container", frozenset({"trivy", "clair", "anchore"})),
+    }
+)
+
+
 class ConfigValidator:
     """Configuration validation utilities"""
 
@@ -386,20 +838,9 @@ class ConfigValidator:
         """Validate scanning configuration"""
         errors = []
 
-        valid_tools = {
-            "sast": ["semgrep", "bandit", "sonarqube"],
-            "sca": ["safety", "pip-audit", "npm-audit"],
-            "secrets": ["trufflehog", "gitleaks", "detect-secrets"],
-            "iac": ["checkov", "tfsec", "terrascan"],
-            "container": ["trivy", "clair", "anchore"],
-        }
-
-        if scanning_config.sast_tool not in valid_tools["sast"]:
-            errors.append(f"Invalid SAST tool: {scanning_config.sast_tool}")
-
-        if scanning_config.sca_tool not in valid_tools["sca"]:
-            errors.append(f"Invalid SCA tool: {scanning_config.sca_tool}")
-
-        # Add more validation as needed
+        for scan_type, (label, valid_tools) in _VALID_SCAN_TOOLS.items():
+            tool = getattr(scanning_config, f"{scan_type}_tool")
+            if tool not in valid_tools:
+                errors.append(f"Invalid {label} tool: {tool}")
 
         return errors
@@ -0,0 +1,22 @@
+"""
+Shared fixtures for the SecureFlow tests
+"""
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Click test runner shared by every CLI test"""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli_help_output(cli_runner):
+    """Top-level CLI help text, rendered once for every test that checks it"""
+    from secureflow_core.cli import cli
+
+    result = cli_runner.invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    return result.output
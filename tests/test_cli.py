@@ -2,57 +2,51 @@
 Test CLI functionality for SecureFlow
 """
 
-import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
-import tempfile
-import os
 from pathlib import Path
 
 from secureflow_core.cli import cli
 
+_PROJECT_TYPES = ("python", "node", "java", "dotnet", "go")
+
 
 class TestCLI:
     """Test the CLI interface"""
 
-    def setup_method(self):
-        """Set up test environment"""
-        self.runner = CliRunner()
-
-    def test_cli_version(self):
+    def test_cli_version(self, cli_runner):
         """Test CLI version command"""
-        result = self.runner.invoke(cli, ['--version'])
+        result = cli_runner.invoke(cli, ['--version'])
         assert result.exit_code == 0
         assert "1.0.0" in result.output
 
-    def test_cli_help(self):
+    def test_cli_help(self, cli_help_output):
         """Test CLI help command"""
-        result = self.runner.invoke(cli, ['--help'])
-        assert result.exit_code == 0
-        assert "SecureFlow" in result.output
-        assert "Shared DevSecOps Library CLI" in result.output
+        assert "SecureFlow" in cli_help_output
+        assert "Shared DevSecOps Library CLI" in cli_help_output
+        assert "--verbose" in cli_help_output
+        assert "--config" in cli_help_output
 
     def test_cli_verbose_flag(self):
         """Test CLI verbose flag"""
-        result = self.runner.invoke(cli, ['--verbose', '--help'])
-        assert result.exit_code == 0
+        ctx = cli.make_context('cli', ['--verbose'])
+        assert ctx.params['verbose'] is True
 
-    def test_init_command(self):
+    def test_init_command(self, cli_runner, tmp_path, monkeypatch):
         """Test init command"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = self.runner.invoke(cli, ['init', '--project-type', 'python'], 
-                                      catch_exceptions=False)
-            # Note: May fail if not implemented, but tests the command structure
-            assert result.exit_code in [0, 1]  # Allow for not implemented
+        monkeypatch.chdir(tmp_path)
+        result = cli_runner.invoke(cli, ['init', '--project-type', 'python'], 
+                                  catch_exceptions=False)
+        # Note: May fail if not implemented, but tests the command structure
+        assert result.exit_code in [0, 1]  # Allow for not implemented
 
-    def test_scan_command_help(self):
+    def test_scan_command_help(self, cli_runner):
         """Test scan command help"""
-        result = self.runner.invoke(cli, ['scan', '--help'])
+        result = cli_runner.invoke(cli, ['scan', '--help'])
         # Command may not be fully implemented yet
         assert result.exit_code in [0, 2]  # 0 for success, 2 for command not found
 
     @patch('secureflow_core.cli.SecureFlow')
-    def test_scan_command_mock(self, mock_secureflow):
+    def test_scan_command_mock(self, mock_secureflow, cli_runner, tmp_path):
         """Test scan command with mocked SecureFlow"""
         mock_instance = MagicMock()
         mock_secureflow.return_value = mock_instance
@@ -62,34 +56,36 @@ class TestCLI:
             'secrets': {'vulnerabilities': []}
         }
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Test basic scan command structure
-            result = self.runner.invoke(cli, ['scan', temp_dir], catch_exceptions=False)
-            # May fail if scan command not fully implemented
-            assert result.exit_code in [0, 1, 2]
+        # Test basic scan command structure
+        result = cli_runner.invoke(cli, ['scan', str(tmp_path)], catch_exceptions=False)
+        # May fail if scan command not fully implemented
+        assert result.exit_code in [0, 1, 2]
 
-    def test_config_option(self):
+    def test_config_option(self, tmp_path):
         """Test config file option"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("project:\n  name: test\n")
-            config_path = f.name
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("project:\n  name: test\n")
 
-        try:
-            result = self.runner.invoke(cli, ['--config', config_path, '--help'])
-            assert result.exit_code == 0
-        finally:
-            os.unlink(config_path)
+        ctx = cli.make_context('cli', ['--config', str(config_path)])
+        assert ctx.params['config'] == str(config_path)
 
     def test_invalid_config_path(self):
         """Test handling of invalid config path"""
-        result = self.runner.invoke(cli, ['--config', '/nonexistent/path.yaml', '--help'])
-        # Should still show help even with invalid config
-        assert result.exit_code == 0
-
-    @pytest.mark.parametrize("project_type", ["python", "node", "java", "dotnet", "go"])
-    def test_init_project_types(self, project_type):
-        """Test init command with different project types"""
-        result = self.runner.invoke(cli, ['init', '--project-type', project_type], 
+        # The path isn't checked while parsing, only when a command loads it
+        ctx = cli.make_context('cli', ['--config', '/nonexistent/path.yaml'])
+        assert ctx.params['config'] == '/nonexistent/path.yaml'
+
+    def test_init_project_types(self):
+        """Test that init accepts every project type"""
+        init = cli.get_command(None, 'init')
+        for project_type in _PROJECT_TYPES:
+            ctx = init.make_context('init', ['--project-type', project_type])
+            assert ctx.params['project_type'] == project_type
+
+    def test_init_project_type_end_to_end(self, cli_runner, tmp_path, monkeypatch):
+        """Test running init with a project type"""
+        monkeypatch.chdir(tmp_path)
+        result = cli_runner.invoke(cli, ['init', '--project-type', 'python'], 
                                   catch_exceptions=False)
         # May not be implemented yet, but tests parameter validation
         assert result.exit_code in [0, 1, 2]
@@ -97,25 +93,21 @@ class TestCLI:
 class TestCLIIntegration:
     """Integration tests for CLI"""
 
-    def setup_method(self):
-        """Set up test environment"""
-        self.runner = CliRunner()
-
     def test_cli_imports(self):
         """Test that CLI can be imported without errors"""
         from secureflow_core.cli import cli
         assert cli is not None
 
-    def test_cli_context_passing(self):
+    def test_cli_context_passing(self, cli_runner):
         """Test that CLI context is properly passed"""
-        result = self.runner.invoke(cli, ['--verbose'], obj={})
+        result = cli_runner.invoke(cli, ['--verbose'], obj={})
         # Just test that the command structure works
         assert result.exit_code in [0, 2]  # 0 for success, 2 for missing subcommand
 
     @patch('secureflow_core.cli.console')
-    def test_cli_console_output(self, mock_console):
+    def test_cli_console_output(self, mock_console, cli_runner):
         """Test CLI console output functionality"""
-        result = self.runner.invoke(cli, ['--help'])
+        result = cli_runner.invoke(cli, ['--help'])
         assert result.exit_code == 0
         # Console should have been used for rich output
         # Note: May not be called if using click's built-in help
@@ -123,26 +115,22 @@ class TestCLIIntegration:
 class TestCLIErrorHandling:
     """Test CLI error handling"""
 
-    def setup_method(self):
-        """Set up test environment"""
-        self.runner = CliRunner()
-
-    def test_invalid_command(self):
+    def test_invalid_command(self, cli_runner):
         """Test handling of invalid commands"""
-        result = self.runner.invoke(cli, ['invalid-command'])
+        result = cli_runner.invoke(cli, ['invalid-command'])
         assert result.exit_code == 2  # Click's error code for unknown command
         assert "No such command" in result.output
 
-    def test_invalid_option(self):
+    def test_invalid_option(self, cli_runner):
         """Test handling of invalid options"""
-        result = self.runner.invoke(cli, ['--invalid-option'])
+        result = cli_runner.invoke(cli, ['--invalid-option'])
         assert result.exit_code == 2
         assert "No such option" in result.output
 
-    def test_missing_required_arguments(self):
+    def test_missing_required_arguments(self, cli_runner):
         """Test handling of missing required arguments"""
         # This will depend on the actual CLI implementation
         # For now, just test that the CLI structure handles it gracefully
-        result = self.runner.invoke(cli, [])
+        result = cli_runner.invoke(cli, [])
         # Should show help or usage when no command is provided
         assert result.exit_code in [0, 2]
@@ -0,0 +1,307 @@
+"""
+Test the plugin system for SecureFlow
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from secureflow_core.plugins import (
+    PluginManager,
+    ReportPlugin,
+    ScannerPlugin,
+    _gather_bounded,
+)
+from secureflow_core.scanner import ScanResult
+
+
+class DummyScannerPlugin(ScannerPlugin):
+    """Minimal scanner plugin used by the tests"""
+
+    name = "dummy-scanner"
+    scan_type = "sast"
+
+    async def initialize(self, config):
+        return True
+
+    async def execute(self, *args, **kwargs):
+        return await self.scan(*args, **kwargs)
+
+    async def scan(self, target):
+        return None
+
+
+class SlowScannerPlugin(DummyScannerPlugin):
+    """Scanner plugin that tracks how many scans run at once"""
+
+    running = 0
+    peak = 0
+
+    def __init__(self, name: str):
+        self.name = name
+        super().__init__()
+
+    async def scan(self, target):
+        cls = type(self)
+        cls.running += 1
+        cls.peak = max(cls.peak, cls.running)
+        await asyncio.sleep(0.01)
+        cls.running -= 1
+        return ScanResult(self.name, target, self.scan_type, [], 0.01, "")
+
+
+class HangingScannerPlugin(DummyScannerPlugin):
+    """Scanner plugin that never finishes"""
+
+    name = "hanging-scanner"
+
+    async def scan(self, target):
+        await asyncio.Event().wait()
+
+
+class FailingScannerPlugin(DummyScannerPlugin):
+    """Scanner plugin whose initialization raises"""
+
+    name = "failing-scanner"
+
+    async def initialize(self, config):
+        raise RuntimeError("cannot connect")
+
+
+class DummyReportPlugin(ReportPlugin):
+    """Minimal report plugin used by the tests"""
+
+    name = "dummy-report"
+
+    async def initialize(self, config):
+        return True
+
+    async def execute(self, *args, **kwargs):
+        return await self.generate_report(*args, **kwargs)
+
+    async def generate_report(self, data, output_path):
+        return output_path
+
+
+class TestPluginManager:
+    """Test plugin registration and lookup"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.manager = PluginManager()
+
+    def test_list_plugins(self):
+        """Test listing registered plugins"""
+        self.manager.register_plugin(DummyScannerPlugin())
+        self.manager.register_plugin(DummyReportPlugin())
+
+        plugins = self.manager.list_plugins()
+        assert set(plugins) == {"dummy-scanner", "dummy-report"}
+        assert plugins["dummy-scanner"]["version"] == "1.0.0"
+
+        # Mutating the returned dict must not affect the manager
+        plugins.pop("dummy-report")
+        assert "dummy-report" in self.manager.list_plugins()
+
+    def test_list_plugins_reflects_info_changes(self):
+        """Test that plugin info changed after registration is listed"""
+        plugin = DummyScannerPlugin()
+        self.manager.register_plugin(plugin)
+
+        plugin.version = "2.0.0"
+
+        assert self.manager.list_plugins()["dummy-scanner"]["version"] == "2.0.0"
+
+    def test_register_replaces_existing_plugin(self):
+        """Test that re-registering a plugin replaces the previous instance"""
+        self.manager.register_plugin(DummyScannerPlugin())
+        replacement = DummyScannerPlugin()
+        self.manager.register_plugin(replacement)
+
+        assert self.manager.get_plugins_by_type("scanner") == [replacement]
+        assert len(self.manager.list_plugins()) == 1
+
+    @pytest.mark.asyncio
+    async def test_unregister_plugin(self):
+        """Test unregistering a plugin"""
+        self.manager.register_plugin(DummyScannerPlugin())
+
+        assert self.manager.unregister_plugin("dummy-scanner") is True
+        assert self.manager.list_plugins() == {}
+        assert self.manager.get_plugins_by_type("scanner") == []
+        assert self.manager.unregister_plugin("dummy-scanner") is False
+
+    @pytest.mark.asyncio
+    async def test_initialize_all_plugins(self):
+        """Test that initialization failures are counted per plugin"""
+        self.manager.register_plugin(DummyScannerPlugin())
+        self.manager.register_plugin(DummyReportPlugin())
+        self.manager.register_plugin(FailingScannerPlugin())
+
+        initialized = await self.manager.initialize_all_plugins({"plugins": {}})
+
+        assert initialized == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_scanner_plugins_bounded(self):
+        """Test that scanner plugins never exceed the worker limit"""
+        manager = PluginManager(max_workers=2)
+        for i in range(5):
+            manager.register_plugin(SlowScannerPlugin(f"slow-{i}"))
+
+        results = await manager.execute_scanner_plugins("target")
+
+        assert len(results) == 5
+        assert SlowScannerPlugin.peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_iter_scanner_plugins_skips_timed_out_plugin(self):
+        """Test that a hung plugin times out without blocking other results"""
+        manager = PluginManager(plugin_timeout=0.05)
+        manager.register_plugin(HangingScannerPlugin())
+        manager.register_plugin(SlowScannerPlugin("slow"))
+
+        results = [r async for r in manager.iter_scanner_plugins("target")]
+
+        assert [r.tool for r in results] == ["slow"]
+
+
+PLUGIN_SOURCE = """
+from secureflow_core.plugins import ScannerPlugin
+
+
+class FilePlugin(ScannerPlugin):
+    name = "file-plugin"
+
+    async def initialize(self, config):
+        return True
+
+    async def execute(self, *args, **kwargs):
+        return None
+
+    async def scan(self, target):
+        return None
+"""
+
+
+class TestPluginLoading:
+    """Test loading plugins from a directory"""
+
+    @pytest.mark.asyncio
+    async def test_load_plugins_from_directory(self, tmp_path):
+        """Test plugin discovery with and without a __plugins__ manifest"""
+        (tmp_path / "scanned.py").write_text(PLUGIN_SOURCE)
+        (tmp_path / "manifest.py").write_text(
+            PLUGIN_SOURCE.replace("file-plugin", "manifest-plugin")
+            + '\n__plugins__ = ["FilePlugin"]\n'
+        )
+
+        manager = PluginManager(manifest_cache_path=str(tmp_path / "cache.json"))
+        loaded = await manager.load_plugins_from_directory(str(tmp_path))
+
+        assert loaded == 2
+        assert set(manager.list_plugins()) == {"file-plugin", "manifest-plugin"}
+
+    @pytest.mark.asyncio
+    async def test_manifest_cache_reused(self, tmp_path):
+        """Test that unchanged plugin files are loaded from the manifest cache"""
+        plugins_dir = tmp_path / "plugins"
+        plugins_dir.mkdir()
+        (plugins_dir / "scanned.py").write_text(PLUGIN_SOURCE)
+        cache_path = tmp_path / "cache.json"
+
+        manager = PluginManager(manifest_cache_path=str(cache_path))
+        assert await manager.load_plugins_from_directory(str(plugins_dir)) == 1
+
+        manifest = json.loads(cache_path.read_text())
+        entry = manifest[str((plugins_dir / "scanned.py").resolve())]
+        assert "FilePlugin" in entry["classes"]
+
+        with patch("secureflow_core.plugins.inspect.getmembers") as mock_getmembers:
+            manager = PluginManager(manifest_cache_path=str(cache_path))
+            assert await manager.load_plugins_from_directory(str(plugins_dir)) == 1
+            mock_getmembers.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_manifest_cache_reload(self, tmp_path):
+        """Test loading the same directory twice with the cache on"""
+        plugins_dir = tmp_path / "plugins"
+        plugins_dir.mkdir()
+        (plugins_dir / "json.py").write_text(PLUGIN_SOURCE)
+        cache_path = tmp_path / "cache.json"
+        cache_key = str((plugins_dir / "json.py").resolve())
+
+        for _ in range(2):
+            manager = PluginManager(manifest_cache_path=str(cache_path))
+            assert await manager.load_plugins_from_directory(str(plugins_dir)) == 1
+
+        # A cached load that fails is retried eagerly and the entry refreshed
+        with patch(
+            "secureflow_core.plugins.importlib.util.LazyLoader",
+            side_effect=ImportError("lazy load failed"),
+        ):
+            manager = PluginManager(manifest_cache_path=str(cache_path))
+            assert await manager.load_plugins_from_directory(str(plugins_dir)) == 1
+
+        manifest = json.loads(cache_path.read_text())
+        assert "FilePlugin" in manifest[cache_key]["classes"]
+
+    @pytest.mark.asyncio
+    async def test_manifest_cache_opt_in(self, tmp_path, monkeypatch):
+        """Test that discovery isn't cached unless a cache path is given"""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        (tmp_path / "scanned.py").write_text(PLUGIN_SOURCE)
+
+        manager = PluginManager()
+        assert await manager.load_plugins_from_directory(str(tmp_path)) == 1
+
+        assert manager.manifest_cache_path is None
+        assert not (tmp_path / "home").exists()
+
+    @pytest.mark.asyncio
+    async def test_load_plugin_named_like_stdlib_module(self, tmp_path):
+        """Test that a plugin file named like an imported module loads lazily"""
+        (tmp_path / "json.py").write_text(
+            PLUGIN_SOURCE + '\n__plugins__ = ["FilePlugin"]\n'
+        )
+
+        manager = PluginManager()
+        assert await manager.load_plugins_from_directory(str(tmp_path)) == 1
+        assert "file-plugin" in manager.list_plugins()
+
+    def test_read_plugin_manifest(self, tmp_path):
+        """Test reading __plugins__ without executing the module"""
+        plugin_file = tmp_path / "plugin.py"
+        plugin_file.write_text('raise RuntimeError\n__plugins__ = ("A", "B")\n')
+        assert PluginManager._read_plugin_manifest(plugin_file) == ["A", "B"]
+
+        plugin_file.write_text(PLUGIN_SOURCE)
+        assert PluginManager._read_plugin_manifest(plugin_file) is None
+
+
+class TestGatherBounded:
+    """Test the bounded gather helper"""
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_limits_concurrency(self):
+        """Test that no more than the limit run at once and errors are returned"""
+        running = 0
+        peak = 0
+
+        async def job(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            if i == 3:
+                raise ValueError("boom")
+            return i
+
+        results = await _gather_bounded((job(i) for i in range(10)), 3)
+
+        assert peak <= 3
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], ValueError)
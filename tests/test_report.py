@@ -0,0 +1,262 @@
+"""
+Test report generation for SecureFlow
+"""
+
+import json
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from secureflow_core import Config
+from secureflow_core.report import ReportGenerator
+
+SCAN_RESULTS = {
+    "sast": {
+        "tool": "semgrep",
+        "target": ".",
+        "scan_duration": 1.5,
+        "vulnerabilities": [
+            {
+                "id": "rule-1",
+                "title": "SQL injection",
+                "description": "User input reaches <query>",
+                "severity": "HIGH",
+                "file_path": "app.py",
+                "line_number": 10,
+            },
+            {
+                "id": "rule-2",
+                "title": "Weak hash",
+                "description": "MD5 used",
+                "severity": "LOW",
+            },
+        ],
+    },
+    "sca": {
+        "tool": "safety",
+        "target": ".",
+        "scan_duration": 0.25,
+        "vulnerabilities": [],
+    },
+}
+
+
+class TestReportGenerator:
+    """Test report generation in each supported format"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.generator = ReportGenerator(Config())
+
+    def test_template_environment_shared(self):
+        """Test that generators share one compiled template environment"""
+        other = ReportGenerator(Config())
+
+        assert other.template_env is self.generator.template_env
+        assert other._html_template is self.generator._html_template
+
+    def test_severity_filters(self):
+        """Test that severity styling filters normalize and fall back to INFO"""
+        filters = self.generator.template_env.filters
+
+        assert filters["severity_class"]("CRITICAL") == "critical"
+        assert filters["severity_class"]("WARNING") == "medium"
+        assert filters["severity_class"](None) == "info"
+        assert filters["severity_color"]("critical") == "#e74c3c"
+        assert filters["severity_color"]("bogus") == "#95a5a6"
+
+    def test_prepare_report_data(self):
+        """Test summary aggregation across scans"""
+        data = self.generator._prepare_report_data(SCAN_RESULTS)
+
+        assert data["summary"]["total_vulnerabilities"] == 2
+        assert data["summary"]["severity_counts"]["HIGH"] == 1
+        assert data["summary"]["severity_counts"]["LOW"] == 1
+        assert data["summary"]["scans_completed"] == 2
+        assert data["scan_summary"]["sca"].duration_display == "0.25"
+        assert data["scan_summary"]["sast"].severity_counts["HIGH"] == 1
+
+    def test_prepare_render_context(self):
+        """Test that templates get one combined entry per scan"""
+        data = self.generator._prepare_report_data(SCAN_RESULTS)
+        context = self.generator._prepare_render_context(data)
+
+        assert "scan_results" not in context
+        assert "scan_summary" not in context
+        scan_type, summary, vulnerabilities = context["scans"][0]
+        assert scan_type == "sast"
+        assert summary.tool == "semgrep"
+        assert vulnerabilities is SCAN_RESULTS["sast"]["vulnerabilities"]
+
+    def test_prepare_report_data_timestamp(self):
+        """Test that the report timestamp is taken once and preformatted"""
+        now = datetime(2024, 1, 2, 15, 4, 5)
+        data = self.generator._prepare_report_data(SCAN_RESULTS, now=now)
+
+        assert data["timestamp"] == "2024-01-02T15:04:05"
+        assert data["timestamp_display"] == "January 02, 2024 at 03:04 PM"
+
+    def test_format_datetime_filter(self):
+        """Test timestamp formatting and fallback for unparseable values"""
+        assert (
+            ReportGenerator._format_datetime_filter("2024-01-02T15:04:05Z")
+            == "January 02, 2024 at 03:04 PM"
+        )
+        assert ReportGenerator._format_datetime_filter("not a date") == "not a date"
+        assert ReportGenerator._format_datetime_filter("N/A") == "N/A"
+        assert ReportGenerator._format_datetime_filter(None) is None
+
+    def test_prepare_report_data_normalizes_severity(self):
+        """Test that scanner-specific or malformed severities are normalized"""
+        scan_results = {
+            "sast": {
+                "tool": "semgrep",
+                "scan_duration": 0,
+                "vulnerabilities": [
+                    {"severity": "high"},
+                    {"severity": "WARNING"},
+                    {"severity": "bogus"},
+                    {"severity": None},
+                    {},
+                ],
+            }
+        }
+
+        data = self.generator._prepare_report_data(scan_results)
+
+        assert data["summary"]["severity_counts"] == {
+            "CRITICAL": 0,
+            "HIGH": 1,
+            "MEDIUM": 1,
+            "LOW": 0,
+            "INFO": 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_generate_html_report(self, tmp_path):
+        """Test HTML report generation escapes scanner output"""
+        output = tmp_path / "report.html"
+        path = await self.generator.generate_comprehensive_report(
+            SCAN_RESULTS, str(output)
+        )
+
+        content = output.read_text(encoding="utf-8")
+        assert path == str(output)
+        assert "SQL injection" in content
+        assert "&lt;query&gt;" in content
+        assert "Duration: 1.50s" in content
+        assert 'class="vulnerability high"' in content
+
+    @pytest.mark.asyncio
+    async def test_html_report_styles_unnormalized_severities(self, tmp_path):
+        """Test that scanner-specific severities still get a styled class"""
+        scan_results = {
+            "sast": {
+                "tool": "semgrep",
+                "vulnerabilities": [
+                    {"title": "a", "severity": "high"},
+                    {"title": "b", "severity": "Medium"},
+                    {"title": "c", "severity": "WARNING"},
+                    {"title": "d", "severity": "bogus"},
+                ],
+            }
+        }
+        output = tmp_path / "report.html"
+        await self.generator.generate_comprehensive_report(scan_results, str(output))
+
+        content = output.read_text(encoding="utf-8")
+        assert 'class="vulnerability "' not in content
+        assert content.count('class="vulnerability high"') == 1
+        assert content.count('class="vulnerability medium"') == 2
+        assert content.count('class="vulnerability info"') == 1
+
+    @pytest.mark.asyncio
+    async def test_render_runs_off_event_loop(self, tmp_path):
+        """Test that templates are rendered in the executor, not the loop thread"""
+        render_threads = []
+
+        class Title:
+            def __str__(self):
+                render_threads.append(threading.current_thread())
+                return "Tracked"
+
+        scan_results = {
+            "sast": {
+                "tool": "semgrep",
+                "vulnerabilities": [{"title": Title(), "severity": "LOW"}],
+            }
+        }
+        await self.generator.generate_comprehensive_report(
+            scan_results, str(tmp_path / "report.html")
+        )
+
+        assert render_threads
+        assert threading.main_thread() not in render_threads
+
+    @pytest.mark.asyncio
+    async def test_generate_markdown_report(self, tmp_path):
+        """Test Markdown report generation"""
+        output = tmp_path / "report.md"
+        await self.generator.generate_comprehensive_report(SCAN_RESULTS, str(output))
+
+        content = output.read_text(encoding="utf-8")
+        assert "#### HIGH - SQL injection" in content
+        assert "`app.py`:10" in content
+        assert "User input reaches <query>" in content
+
+    @pytest.mark.asyncio
+    async def test_generate_json_report(self, tmp_path):
+        """Test JSON report generation"""
+        output = tmp_path / "report.json"
+        await self.generator.generate_comprehensive_report(SCAN_RESULTS, str(output))
+
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["summary"]["total_vulnerabilities"] == 2
+        assert data["scan_summary"]["sast"]["tool"] == "semgrep"
+
+    @pytest.mark.asyncio
+    async def test_generate_json_report_without_orjson(self, tmp_path):
+        """Test JSON report generation with the stdlib encoder"""
+        output = tmp_path / "report.json"
+        with patch("secureflow_core.report.orjson", None):
+            await self.generator.generate_comprehensive_report(
+                SCAN_RESULTS, str(output)
+            )
+
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["scan_results"]["sast"]["tool"] == "semgrep"
+        assert data["scan_summary"]["sca"]["duration_display"] == "0.25"
+
+    @pytest.mark.asyncio
+    async def test_generate_msgpack_report(self, tmp_path):
+        """Test MessagePack report generation"""
+        msgpack = pytest.importorskip("msgpack")
+        output = tmp_path / "report.msgpack"
+        await self.generator.generate_comprehensive_report(SCAN_RESULTS, str(output))
+
+        data = msgpack.unpackb(output.read_bytes(), raw=False)
+        assert data["summary"]["total_vulnerabilities"] == 2
+        assert data["scan_summary"]["sast"]["total_vulnerabilities"] == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_all(self, tmp_path):
+        """Test generating several formats from one call"""
+        base = str(tmp_path / "report")
+        paths = await self.generator.generate_all(SCAN_RESULTS, output_base=base)
+
+        assert paths == [f"{base}.html", f"{base}.md", f"{base}.json"]
+        for path in paths:
+            assert "SQL injection" in open(path, encoding="utf-8").read()
+
+        with pytest.raises(ValueError):
+            await self.generator.generate_all(SCAN_RESULTS, formats=("pdf",))
+
+    @pytest.mark.asyncio
+    async def test_unsupported_format(self, tmp_path):
+        """Test that unknown report formats are rejected"""
+        with pytest.raises(ValueError):
+            await self.generator.generate_comprehensive_report(
+                SCAN_RESULTS, str(tmp_path / "report.txt")
+            )
@@ -0,0 +1,154 @@
+"""
+Test the Azure DevOps pipeline templates
+"""
+
+import io
+import json
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from secureflow_core.templates import PipelineTemplateManager
+
+
+class TestPipelineTemplateManager:
+    """Test pipeline template generation"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.manager = PipelineTemplateManager()
+
+    @pytest.mark.parametrize("template_type", ["basic", "comprehensive", "compliance"])
+    def test_generate_pipeline_round_trips(self, template_type):
+        """Test that generated YAML loads back to the template definition"""
+        pipeline_yaml = self.manager.generate_pipeline(template_type)
+
+        assert yaml.safe_load(pipeline_yaml) == self.manager.templates[template_type]
+
+    def test_shared_steps_written_in_full(self):
+        """Test that steps shared between jobs aren't emitted as YAML aliases"""
+        pipeline_yaml = self.manager.generate_pipeline("comprehensive")
+
+        assert "&id" not in pipeline_yaml
+        assert "*id" not in pipeline_yaml
+        assert pipeline_yaml.count("pip install secureflow-core") > 1
+
+    def test_generate_pipeline_renders_once(self):
+        """Test that every manager reuses YAML rendered earlier in the process"""
+        first = self.manager.generate_pipeline("basic")
+
+        with patch("secureflow_core.templates.yaml.dump") as mock_dump:
+            assert self.manager.generate_pipeline("basic") is first
+            assert PipelineTemplateManager().generate_pipeline("basic") is first
+            mock_dump.assert_not_called()
+
+    def test_generate_pipeline_to_stream(self):
+        """Test writing pipeline YAML to a stream"""
+        stream = io.StringIO()
+
+        assert self.manager.generate_pipeline("compliance", stream=stream) is None
+        assert stream.getvalue() == self.manager.generate_pipeline("compliance")
+
+    def test_templates_built_on_demand(self):
+        """Test that generating one pipeline builds only that template"""
+        with patch.dict(
+            "secureflow_core.templates._rendered_pipelines", clear=True
+        ), patch.object(
+            self.manager,
+            "_get_compliance_template",
+            side_effect=AssertionError("built unused template"),
+        ):
+            self.manager.generate_pipeline("basic")
+
+        assert list(self.manager._templates) == ["basic"]
+
+    def test_managers_share_logger(self):
+        """Test that new managers reuse the module's logger"""
+        assert PipelineTemplateManager().logger is self.manager.logger
+
+    def test_templates_are_shared_read_only_views(self):
+        """Test that each template is built once and can't be modified"""
+        basic = self.manager.templates["basic"]
+
+        assert self.manager.templates["basic"] is basic
+        with pytest.raises(TypeError):
+            basic["pool"] = {"vmImage": "windows-latest"}
+
+    def test_generate_pipeline_unknown_type(self):
+        """Test that unknown template types are rejected"""
+        with pytest.raises(ValueError):
+            self.manager.generate_pipeline("missing")
+
+    def test_save_all_templates(self, tmp_path):
+        """Test writing every pipeline and supporting template"""
+        self.manager.save_all_templates(str(tmp_path))
+
+        written = sorted(
+            str(path.relative_to(tmp_path)) for path in tmp_path.rglob("*.yml")
+        )
+        assert written == [
+            "azure-pipelines-basic.yml",
+            "azure-pipelines-compliance.yml",
+            "azure-pipelines-comprehensive.yml",
+            "templates/security-scan-stage.yml",
+            "variables/compliance-vars.yml",
+            "variables/security-vars.yml",
+        ]
+
+        security_vars_yaml = (tmp_path / "variables" / "security-vars.yml").read_text()
+        assert security_vars_yaml.startswith("variables: {")
+        security_vars = yaml.safe_load(security_vars_yaml)
+        assert security_vars["variables"]["PYTHON_VERSION"] == "3.11"
+
+    def test_combine_results_step(self, tmp_path):
+        """Test that the pipeline's inline script combines downloaded results"""
+        step = next(
+            step
+            for stage in self.manager.templates["comprehensive"]["stages"]
+            for job in stage["jobs"]
+            for step in job["steps"]
+            if step.get("displayName") == "Combine Scan Results"
+        )
+        # The step must not depend on files outside the pipeline YAML
+        command, _, body = step["script"].partition("\n")
+        assert command == "python - $(Agent.TempDirectory) <<'EOF'"
+        assert body.endswith("\nEOF\n")
+
+        downloads = tmp_path / "downloads"
+        (downloads / "sast-results").mkdir(parents=True)
+        (downloads / "sast-results" / "sast-results.json").write_text('{"ok": 1}')
+        subprocess.run(
+            [sys.executable, "-", str(downloads)],
+            input=body[: -len("EOF\n")],
+            text=True,
+            cwd=tmp_path,
+            check=True,
+        )
+
+        combined = json.loads((tmp_path / "combined-results.json").read_text())
+        assert combined == {"sast": {"ok": 1}}
+
+    def test_save_all_templates_skips_unchanged_files(self, tmp_path):
+        """Test that saving again only rewrites files whose content differs"""
+        self.manager.save_all_templates(tmp_path)
+        basic = tmp_path / "azure-pipelines-basic.yml"
+        basic.write_text("stale")
+
+        with patch(
+            "secureflow_core.templates.Path.write_bytes", autospec=True
+        ) as mock_write:
+            self.manager.save_all_templates(tmp_path)
+
+        assert [call.args[0] for call in mock_write.call_args_list] == [basic]
+
+    def test_save_all_templates_reports_write_errors(self, tmp_path):
+        """Test that a failed template write isn't lost in the worker threads"""
+        with patch(
+            "secureflow_core.templates.Path.write_bytes",
+            side_effect=OSError("disk full"),
+        ):
+            with pytest.raises(OSError, match="disk full"):
+                self.manager.save_all_templates(tmp_path)
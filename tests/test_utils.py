@@ -0,0 +1,375 @@
+"""
+Test the SecureFlow utilities
+"""
+
+import hashlib
+import json
+import logging.handlers
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from secureflow_core.config import ScanningConfig
+from secureflow_core.utils import (
+    FILE_DIGEST_CHUNK_SIZE,
+    CacheManager,
+    ConfigValidator,
+    FileUtils,
+    Logger,
+    ScanCache,
+    SecurityMetrics,
+    _json_dumps,
+)
+
+
+class TestLogger:
+    """Test the SecureFlow logger wrapper"""
+
+    def test_get_shares_one_logger_per_name(self, tmp_path):
+        """Test that utility objects reuse one logger instead of making their own"""
+        assert Logger.get("secureflow_core.utils") is Logger.get(
+            "secureflow_core.utils"
+        )
+        assert CacheManager(cache_dir=str(tmp_path)).logger is SecurityMetrics().logger
+
+    def test_log_methods_call_the_logger_directly(self):
+        """Test that log calls go straight to the underlying logging.Logger"""
+        logger = Logger.get("secureflow_core.utils")
+
+        for level in ["debug", "info", "warning", "error", "critical"]:
+            assert getattr(logger, level) == getattr(logger.logger, level)
+
+    def test_log_file_written_in_batches(self, tmp_path, monkeypatch):
+        """Test that file logging opens lazily and buffers until flushed"""
+        monkeypatch.chdir(tmp_path)
+        logger = Logger("secureflow_core.tests.buffered")
+        log_file = tmp_path / ".secureflow-logs" / "secureflow.log"
+
+        logger.info("first")
+        assert not log_file.exists()
+
+        logger.error("second")
+        assert log_file.read_text().count("secureflow_core.tests.buffered") == 2
+
+        for handler in logger.logger.handlers:
+            if isinstance(handler, logging.handlers.MemoryHandler):
+                handler.target.close()
+            handler.close()
+        logger.logger.handlers.clear()
+
+
+class TestCacheManager:
+    """Test scan result caching"""
+
+    def test_cache_key_is_short_and_versioned(self, tmp_path):
+        """Test that cache keys are stable, versioned BLAKE2b digests"""
+        cache = CacheManager(cache_dir=str(tmp_path))
+
+        key = cache.get_cache_key("sast", "/src", "semgrep")
+
+        assert key == cache.get_cache_key("sast", "/src", "semgrep")
+        assert key != cache.get_cache_key("sca", "/src", "semgrep")
+        assert key.startswith("sf1_")
+        assert len(key) == len("sf1_") + 16
+
+    def test_cache_round_trip(self, tmp_path):
+        """Test that a cached result is read back until it is cleared"""
+        cache = CacheManager(cache_dir=str(tmp_path))
+        result = {"tool": "semgrep", "vulnerabilities": [{"id": "x"}]}
+
+        cache.cache_result("sast", "/src", "semgrep", result)
+
+        assert cache.get_cached_result("sast", "/src", "semgrep") == result
+        cache.clear_cache()
+        assert cache.get_cached_result("sast", "/src", "semgrep") is None
+
+    def test_clear_cache_by_scan_type_and_target(self, tmp_path):
+        """Test clearing only the results of one scan type or target"""
+        cache = CacheManager(cache_dir=str(tmp_path))
+        for scan_type, target in [
+            ("sast", "/app"),
+            ("sast", "/lib"),
+            ("sca", "/app"),
+            ("secrets", "/lib"),
+        ]:
+            cache.cache_result(scan_type, target, "tool", {"tool": "tool"})
+
+        cache.clear_cache(scan_type="sast", target="/app")
+        assert cache.get_cached_result("sast", "/app", "tool") is None
+        assert cache.get_cached_result("sast", "/lib", "tool") is not None
+
+        cache.clear_cache(target="/lib")
+        assert cache.get_cached_result("sast", "/lib", "tool") is None
+        assert cache.get_cached_result("secrets", "/lib", "tool") is None
+
+        cache.clear_cache(scan_type="sca")
+        assert cache.get_cache_stats()["total_files"] == 0
+
+    def test_cached_results_written_in_background(self, tmp_path):
+        """Test that queued results reach disk and survive a new manager"""
+        cache = CacheManager(cache_dir=str(tmp_path))
+        for tool in ["semgrep", "bandit"]:
+            cache.cache_result("sast", "/src", tool, {"tool": tool})
+
+        cache.flush()
+
+        assert cache.get_cache_stats()["valid_files"] == 2
+        reopened = CacheManager(cache_dir=str(tmp_path))
+        assert reopened.get_cached_result("sast", "/src", "bandit") == {
+            "tool": "bandit"
+        }
+
+    def test_large_result_streamed_to_disk(self, tmp_path):
+        """Test that results with many findings are written as they are cached"""
+        cache = CacheManager(cache_dir=str(tmp_path))
+        cache.cache_result("sast", "/src", "semgrep", {"tool": "semgrep"})
+        result = {
+            "tool": "semgrep",
+            "vulnerabilities": [{"id": str(i), "severity": "LOW"} for i in range(1000)],
+            "metadata": {"version": "1.0"},
+        }
+
+        with patch("secureflow_core.utils._json_dumps", wraps=_json_dumps) as dumps:
+            cache.cache_result("sast", "/src", "semgrep", result)
+        assert result not in [call.args[0] for call in dumps.call_args_list]
+
+        cache.flush()
+        key = cache.get_cache_key("sast", "/src", "semgrep")
+        assert json.loads((tmp_path / f"{key}.json").read_text()) == result
+        assert cache.get_cached_result("sast", "/src", "semgrep") == result
+
+    def test_cache_stats_count_expired_files(self, tmp_path):
+        """Test that stats split cache files by age and sum their sizes"""
+        cache = CacheManager(cache_dir=str(tmp_path), ttl=60)
+        (tmp_path / "fresh.json").write_text("{}")
+        expired = tmp_path / "expired.json"
+        expired.write_text("[]")
+        os.utime(expired, (0, 0))
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        stats = cache.get_cache_stats()
+
+        assert stats["total_files"] == 2
+        assert stats["valid_files"] == 1
+        assert stats["expired_files"] == 1
+        assert stats["total_size_bytes"] == 4
+        assert not cache.is_cache_valid(expired)
+
+    def test_corrupted_cache_file_is_removed(self, tmp_path):
+        """Test that an unreadable cache entry is a miss and gets deleted"""
+        cache = CacheManager(cache_dir=str(tmp_path))
+        key = cache.get_cache_key("sast", "/src", "semgrep")
+        cache_file = tmp_path / f"{key}.json"
+        cache_file.write_text("{not json")
+
+        assert cache.get_cached_result("sast", "/src", "semgrep") is None
+        assert not cache_file.exists()
+
+
+class TestScanCache:
+    """Test the per-file findings cache"""
+
+    def test_file_digest_spans_chunks(self, tmp_path):
+        """Test that hashing in chunks matches hashing the whole file"""
+        data = os.urandom(FILE_DIGEST_CHUNK_SIZE * 2 + 1)
+        path = tmp_path / "large.bin"
+        path.write_bytes(data)
+
+        with patch("secureflow_core.utils.blake3", None):
+            digest = ScanCache.file_digest(str(path))
+
+        assert digest == hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+class TestSecurityMetrics:
+    """Test security metrics collection"""
+
+    def test_scan_durations(self):
+        """Test that scan durations are summarized as they are recorded"""
+        metrics = SecurityMetrics()
+        metrics.record_scan_completion(
+            {
+                "sast": {"tool": "semgrep", "scan_duration": 2.0},
+                "sca": {"tool": "safety", "scan_duration": 4.0},
+                "secrets": {"tool": "gitleaks", "scan_duration": 0},
+            }
+        )
+
+        summary = metrics.get_metrics()
+        assert summary["average_scan_duration"] == 3.0
+        assert summary["total_scan_time"] == 6.0
+        assert "scan_durations" not in summary
+
+    def test_vulnerability_and_tool_counts(self):
+        """Test tallying findings by known severity and scans by tool"""
+        metrics = SecurityMetrics()
+        metrics.record_scan_completion(
+            {
+                "sast": {
+                    "tool": "semgrep",
+                    "vulnerabilities": [
+                        {"severity": "HIGH"},
+                        {"severity": "HIGH"},
+                        {"severity": "BOGUS"},
+                        {},
+                    ],
+                },
+                "secrets": {"tool": "semgrep", "vulnerabilities": []},
+            }
+        )
+
+        summary = metrics.get_metrics()
+        assert summary["vulnerabilities_found"] == 4
+        assert summary["vulnerabilities_by_severity"] == {
+            "CRITICAL": 0,
+            "HIGH": 2,
+            "MEDIUM": 0,
+            "LOW": 0,
+            "INFO": 1,
+        }
+        assert summary["tools_used"] == {"semgrep": 2}
+        assert metrics.vulnerabilities_found == 4
+        assert not hasattr(metrics, "__dict__")
+
+    def test_last_updated(self):
+        """Test that the last recording time is reported in ISO format"""
+        metrics = SecurityMetrics()
+        assert metrics.get_metrics()["last_updated"] is None
+
+        before = datetime.now().replace(microsecond=0)
+        metrics.record_compliance_check({})
+
+        last_updated = datetime.fromisoformat(metrics.get_metrics()["last_updated"])
+        assert before <= last_updated <= datetime.now()
+
+    def test_metrics_view(self):
+        """Test that the metrics view is read-only and includes derived metrics"""
+        metrics = SecurityMetrics()
+        metrics.record_compliance_check({"SOC2": {"compliant": True}})
+
+        view = metrics.get_metrics_view()
+
+        assert view["compliance_checks"] == 1
+        assert view["compliance_success_rate"] == 100.0
+        assert dict(view) == metrics.get_metrics()
+        with pytest.raises(TypeError):
+            view["compliance_checks"] = 0
+
+        # Counters are read live, not copied when the view is taken
+        metrics.record_compliance_check({})
+        assert view["compliance_checks"] == 2
+
+    def test_metrics_read_only(self):
+        """Test that writes through the metrics mapping fail loudly"""
+        metrics = SecurityMetrics()
+
+        assert dict(metrics.metrics)["scans_completed"] == 0
+        with pytest.raises(TypeError):
+            metrics.metrics["scans_completed"] = 1
+
+    def test_export_metrics(self, tmp_path):
+        """Test exporting metrics as indented JSON"""
+        metrics = SecurityMetrics()
+        metrics.record_compliance_check({"SOC2": {"compliant": False}})
+        export_file = tmp_path / "metrics.json"
+
+        metrics.export_metrics(str(export_file))
+
+        exported = json.loads(export_file.read_text())
+        assert exported["compliance_failures"] == 1
+        assert exported["compliance_success_rate"] == 0
+        assert '\n  "' in export_file.read_text()
+
+
+class TestFileUtils:
+    """Test file and directory utilities"""
+
+    def test_find_files_by_extension(self, tmp_path):
+        """Test finding files for several extensions in nested directories"""
+        (tmp_path / "pkg").mkdir()
+        for name in ["main.py", "pkg/util.py", "pkg/app.js", "README.md"]:
+            (tmp_path / name).touch()
+
+        found = FileUtils.find_files_by_extension(str(tmp_path), ["py", ".js"])
+
+        assert sorted(found) == [
+            str(tmp_path / "main.py"),
+            str(tmp_path / "pkg" / "app.js"),
+            str(tmp_path / "pkg" / "util.py"),
+        ]
+
+    @pytest.mark.parametrize(
+        "files, project_type",
+        [
+            (["setup.py", "Dockerfile"], "python"),
+            (["package.json"], "node"),
+            (["build.gradle"], "java"),
+            (["go.mod", "src/App/App.csproj"], "dotnet"),
+            (["go.mod", "infra/main.tf"], "go"),
+            (["infra/main.tf", "Dockerfile"], "terraform"),
+            (["Dockerfile"], "docker"),
+            (["README.md"], None),
+        ],
+    )
+    def test_get_project_type(self, tmp_path, files, project_type):
+        """Test project type detection and its precedence"""
+        for name in files:
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).touch()
+
+        assert FileUtils.get_project_type(str(tmp_path)) == project_type
+
+    def test_get_project_type_cached_until_directory_changes(self, tmp_path):
+        """Test that detection reruns only after the directory is modified"""
+        (tmp_path / "package.json").touch()
+        os.utime(tmp_path, ns=(1_000_000_000, 1_000_000_000))
+        assert FileUtils.get_project_type(str(tmp_path)) == "node"
+
+        with patch.object(FileUtils, "_detect_project_type") as mock_detect:
+            assert FileUtils.get_project_type(str(tmp_path)) == "node"
+            mock_detect.assert_not_called()
+
+        (tmp_path / "setup.py").touch()
+        os.utime(tmp_path, ns=(2_000_000_000, 2_000_000_000))
+        assert FileUtils.get_project_type(str(tmp_path)) == "python"
+
+    def test_get_project_type_sees_nested_changes(self, tmp_path):
+        """Test that adding a nested marker isn't hidden by the cache"""
+        (tmp_path / "go.mod").touch()
+        (tmp_path / "src").mkdir()
+        os.utime(tmp_path, ns=(1_000_000_000, 1_000_000_000))
+        assert FileUtils.get_project_type(str(tmp_path)) == "go"
+
+        (tmp_path / "src" / "App.csproj").touch()
+        os.utime(tmp_path, ns=(1_000_000_000, 1_000_000_000))
+        assert FileUtils.get_project_type(str(tmp_path)) == "dotnet"
+
+    def test_get_project_type_missing_directory(self, tmp_path):
+        """Test that a missing directory has no project type"""
+        assert FileUtils.get_project_type(str(tmp_path / "missing")) is None
+
+    def test_detect_project_type_not_a_directory(self, tmp_path):
+        """Test that a missing directory or a file path has no project type"""
+        (tmp_path / "setup.py").touch()
+
+        assert FileUtils._detect_project_type(tmp_path / "missing") is None
+        assert FileUtils._detect_project_type(tmp_path / "setup.py") is None
+
+
+class TestConfigValidator:
+    """Test configuration validation"""
+
+    def test_default_scanning_config_is_valid(self):
+        """Test that the default tools pass validation"""
+        assert ConfigValidator.validate_scanning_config(ScanningConfig()) == []
+
+    def test_invalid_scanning_tools(self):
+        """Test that every unsupported tool is reported"""
+        config = ScanningConfig(sast_tool="pylint", iac_tool="kics")
+
+        assert ConfigValidator.validate_scanning_config(config) == [
+            "Invalid SAST tool: pylint",
+            "Invalid IaC tool: kics",
+        ]
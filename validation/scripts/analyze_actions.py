@@ -3,32 +3,84 @@
 Extract and analyze all GitHub Actions used in workflow files
 """
 
-import yaml
-import re
 import os
 
+import yaml
+
+from workflow_yaml import REPO_WORKFLOW_FILES, workflow_events
+
+# Actions, as name@major-version, that have been deprecated and must be updated
+DEPRECATED_ACTIONS = frozenset({
+    'actions/upload-artifact@v3',
+    'actions/download-artifact@v3',
+})
+CURRENT_VERSIONS = frozenset({'v4', 'v5'})
+
+# Parser events that open and close a collection, and those that carry a value
+_START_EVENTS = (yaml.MappingStartEvent, yaml.SequenceStartEvent)
+_END_EVENTS = (yaml.MappingEndEvent, yaml.SequenceEndEvent)
+_VALUE_EVENTS = (yaml.ScalarEvent, yaml.AliasEvent)
+
+
+def classify_action(action):
+    """Classify an action reference as 'deprecated', 'current' or 'other'"""
+    name, _, version = action.partition('@')
+    major = version.split('.', 1)[0]
+    if f"{name}@{major}" in DEPRECATED_ACTIONS:
+        return 'deprecated'
+    if major in CURRENT_VERSIONS:
+        return 'current'
+    return 'other'
+
 def extract_actions_from_workflow(file_path):
     """Extract all GitHub Actions used in a workflow file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Parse YAML
-        yaml_content = yaml.safe_load(content)
-        
         actions = []
         
-        # Extract actions from jobs
-        if 'jobs' in yaml_content:
-            for job_name, job_config in yaml_content['jobs'].items():
-                if 'steps' in job_config:
-                    for step in job_config['steps']:
-                        if isinstance(step, dict) and 'uses' in step:
-                            actions.append({
-                                'job': job_name,
-                                'action': step['uses'],
-                                'step_name': step.get('name', 'Unnamed step')
-                            })
+        # Walk the parser events, tracking the mapping keys down to the current
+        # node; '-' stands for a sequence item, so a step sits at
+        # jobs/<job>/steps/-
+        path = []
+        # One [is_mapping, key] entry per open collection; key is None while a
+        # mapping is waiting for its next key
+        open_nodes = []
+        step = None
+
+        for event in workflow_events(file_path):
+            if isinstance(event, _START_EVENTS):
+                if open_nodes:
+                    parent = open_nodes[-1]
+                    path.append(parent[1] if parent[0] else '-')
+                is_mapping = isinstance(event, yaml.MappingStartEvent)
+                open_nodes.append([is_mapping, None])
+                if (is_mapping and len(path) == 4 and path[0] == 'jobs'
+                        and path[2] == 'steps'):
+                    step = {}
+            elif isinstance(event, _END_EVENTS):
+                open_nodes.pop()
+                if step is not None and len(path) == 4:
+                    if 'uses' in step:
+                        actions.append({
+                            'job': path[1],
+                            'action': step['uses'],
+                            'step_name': step.get('name', 'Unnamed step')
+                        })
+                    step = None
+                if path:
+                    path.pop()
+                if open_nodes:
+                    open_nodes[-1][1] = None
+            elif isinstance(event, _VALUE_EVENTS) and open_nodes:
+                node = open_nodes[-1]
+                if node[0] and node[1] is None:
+                    node[1] = getattr(event, 'value', None)
+                    continue
+                if (step is not None and len(path) == 4
+                        and node[1] in ('uses', 'name')
+                        and isinstance(event, yaml.ScalarEvent)):
+                    step[node[1]] = event.value
+                if node[0]:
+                    node[1] = None
         
         return actions
     except Exception as e:
@@ -37,32 +89,31 @@ def extract_actions_from_workflow(file_path):
 
 def main():
     """Main function to analyze all workflow files"""
-    workflow_files = [
-        '.github/workflows/security-comprehensive.yml',
-        '.github/workflows/security-basic.yml', 
-        '.github/workflows/security-compatible.yml'
-    ]
-    
     print("Analyzing GitHub Actions in workflow files...")
     print("=" * 70)
     
     all_actions = {}
     
-    for file_path in workflow_files:
+    for file_path in REPO_WORKFLOW_FILES:
         if os.path.exists(file_path):
             print(f"\n📄 File: {file_path}")
             actions = extract_actions_from_workflow(file_path)
             
             for action_info in actions:
                 action = action_info['action']
-                if action not in all_actions:
-                    all_actions[action] = []
-                all_actions[action].append(f"{file_path} ({action_info['job']})")
+                entry = all_actions.get(action)
+                if entry is None:
+                    entry = all_actions[action] = {
+                        'locations': [],
+                        'status': classify_action(action),
+                    }
+                entry['locations'].append(
+                    f"{file_path} ({action_info['job']})")
                 
                 # Check for deprecated versions
-                if '@v3' in action and 'upload-artifact' in action:
+                if entry['status'] == 'deprecated':
                     print(f"  ⚠️  DEPRECATED: {action} in {action_info['step_name']}")
-                elif '@v4' in action or '@v5' in action:
+                elif entry['status'] == 'current':
                     print(f"  ✅ CURRENT: {action}")
                 else:
                     print(f"  ℹ️  {action}")
@@ -71,12 +122,12 @@ def main():
     print("Summary of all actions used:")
     
     deprecated_found = False
-    for action, locations in sorted(all_actions.items()):
+    for action, entry in sorted(all_actions.items()):
         print(f"\n🔧 {action}")
-        for location in locations:
+        for location in entry['locations']:
             print(f"   └─ {location}")
         
-        if '@v3' in action and 'upload-artifact' in action:
+        if entry['status'] == 'deprecated':
             print("   ⚠️  DEPRECATED - NEEDS UPDATE!")
             deprecated_found = True
     
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Shared file and line counting for the workspace analysis scripts
+Walks each directory once with os.scandir and remembers the count for the
+process
+"""
+
+import os
+from functools import lru_cache
+
+
+def count_files(root):
+    """Count every entry under root, like len(list(Path(root).rglob("*")))"""
+    return _count_files(os.path.abspath(root))
+
+
+@lru_cache(maxsize=None)
+def _count_files(root):
+    count = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                count += 1
+                # d_type from the directory listing answers this without a
+                # stat; like rglob, don't descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return count
+
+
+def count_lines(path, chunk_size=1 << 16):
+    """Count lines like len(text.split('\\n')), reading the file in
+    fixed-size chunks
+    """
+    newlines = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            newlines += chunk.count(b'\n')
+    return newlines + 1
@@ -7,40 +7,37 @@ Runs all validation scripts and provides comprehensive status report
 import os
 import sys
 import subprocess
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Keeps lines streamed from scripts running side by side from interleaving
+_print_lock = threading.Lock()
+
+
 def run_script(script_path, script_name):
-    """Run a script and capture its output"""
-    print(f"\nRunning {script_name}...")
-    print("=" * 50)
-    
+    """Run a script from its own directory, printing its output as it
+    arrives
+    """
     try:
-        # Change to the script's directory
-        script_dir = os.path.dirname(script_path)
-        original_dir = os.getcwd()
-        
-        if script_dir:
-            os.chdir(script_dir)
-        
-        # Run the script
-        result = subprocess.run([sys.executable, os.path.basename(script_path)], 
-                              capture_output=True, text=True)
-        
-        # Print output
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-            
-        # Restore directory
-        os.chdir(original_dir)
-        
-        return result.returncode == 0
+        # -u so the script's prints reach us as they happen, not when its
+        # buffer fills
+        argv = [sys.executable, '-u', os.path.basename(script_path)]
+        with subprocess.Popen(argv,
+                              cwd=os.path.dirname(script_path) or None,
+                              stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              bufsize=1, text=True) as proc:
+            for line in proc.stdout:
+                line = line.rstrip('\n')
+                with _print_lock:
+                    print(f"[{script_name}] {line}")
+            return proc.wait() == 0
     except Exception as e:
-        print(f"❌ Error running {script_name}: {e}")
+        with _print_lock:
+            print(f"❌ Error running {script_name}: {e}")
         return False
 
+
 def main():
     """Run all validation scripts"""
     print("SecureFlow-Core Complete Validation Suite")
@@ -68,22 +65,32 @@ def main():
             'description': 'Tests matrix generation logic'
         },
         {
-            'path': project_root / 'validation' / 'tests' / 'test_echo_json.py',
-            'name': 'Echo JSON Test',
-            'description': 'Tests echo-based JSON generation'
-        },
-        {
-            'path': project_root / 'validation' / 'tests' / 'test_json_generation.py',
-            'name': 'JSON Generation Test',
+            'path': (project_root / 'validation' / 'tests'
+                     / 'test_json_workflow.py'),
+            'name': 'JSON Workflow Test',
             'description': 'Tests JSON generation from workflow logic'
         }
     ]
     
-    # Run all scripts
+    # The scripts are independent, so run them all at once; each one mostly
+    # waits on its subprocess, so threads are enough. Output lines are
+    # prefixed with the script's name since they arrive interleaved.
+    found = [script for script in validation_scripts
+             if script['path'].exists()]
+    print(f"\nRunning {', '.join(script['name'] for script in found)}...")
+    print("=" * 50)
+    with ThreadPoolExecutor(max_workers=max(len(found), 1)) as executor:
+        outcomes = dict(zip(
+            (script['name'] for script in found),
+            executor.map(run_script,
+                         (str(script['path']) for script in found),
+                         (script['name'] for script in found))
+        ))
+
     results = {}
     for script in validation_scripts:
-        if script['path'].exists():
-            success = run_script(str(script['path']), script['name'])
+        if script['name'] in outcomes:
+            success = outcomes[script['name']]
             results[script['name']] = {
                 'success': success,
                 'description': script['description']
@@ -3,12 +3,22 @@
 SecureFlow-Core Workspace Analysis - Simple Version
 """
 
-import os
-import sys
-from pathlib import Path
+import argparse
+import stat
 
-def main():
+from file_counts import count_files
+from workspace_layout import (CORE_MODULE_PATHS, CORE_MODULES, TEMPLATE_PATHS,
+                              TEMPLATES, scan_paths)
+
+
+def main(argv=None):
     """Main analysis function"""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--counts", action="store_true",
+                        help="also count the files under each directory "
+                             "(walks the whole tree)")
+    args = parser.parse_args(argv)
+
     print("🛡️ SECUREFLOW-CORE WORKSPACE ANALYSIS")
     print("=" * 50)
     
@@ -25,10 +35,12 @@ def main():
         ("validation/", "Validation Tools")
     ]
     
+    path_stats = scan_paths(tuple(path for path, _ in key_paths))
     for path, description in key_paths:
-        if os.path.exists(path):
-            if os.path.isdir(path):
-                file_count = len(list(Path(path).rglob("*")))
+        st = path_stats[path]
+        if st is not None:
+            if args.counts and stat.S_ISDIR(st.st_mode):
+                file_count = count_files(path)
                 print(f"  ✅ {description}: {path} ({file_count} files)")
             else:
                 print(f"  ✅ {description}: {path}")
@@ -37,29 +49,18 @@ def main():
     
     # Core modules check
     print("\n📦 CORE MODULES:")
-    core_modules = [
-        "core.py", "scanner.py", "azure.py", "compliance.py", 
-        "plugins.py", "cli.py", "config.py", "utils.py"
-    ]
-    
-    for module in core_modules:
-        module_path = f"src/secureflow_core/{module}"
-        if os.path.exists(module_path):
+    module_stats = scan_paths(CORE_MODULE_PATHS)
+    for module, module_path in zip(CORE_MODULES, CORE_MODULE_PATHS):
+        if module_stats[module_path] is not None:
             print(f"  ✅ {module}")
         else:
             print(f"  ❌ {module}")
     
     # Templates check
     print("\n📋 TEMPLATES:")
-    templates = [
-        "basic-security.yml", "java-maven-security.yml",
-        "nodejs-security.yml", "python-security.yml",
-        "container-security.yml"
-    ]
-    
-    for template in templates:
-        template_path = f"github-actions-templates/{template}"
-        if os.path.exists(template_path):
+    template_stats = scan_paths(TEMPLATE_PATHS)
+    for template, template_path in zip(TEMPLATES, TEMPLATE_PATHS):
+        if template_stats[template_path] is not None:
             print(f"  ✅ {template}")
         else:
             print(f"  ❌ {template}")
@@ -8,21 +8,57 @@ import yaml
 import os
 import sys
 import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
 
-def check_github_actions_expressions(content, file_path):
+from workflow_yaml import WORKFLOW_FILES, load_workflow
+
+_HASHFILES_RE = re.compile(r"hashFiles\s*\([^)]*\)")
+_WRAPPED_HASHFILES_RE = re.compile(r'\$\{\{.*hashFiles.*\}\}')
+_SIMPLE_IF_RE = re.compile(r'\s*if:\s*[^$]*$')
+_NEWLINE_RE = re.compile('\n')
+
+# Deprecated action versions and their replacements
+DEPRECATED_ACTIONS = {
+    'actions/upload-artifact@v3': 'actions/upload-artifact@v4',
+    'actions/download-artifact@v3': 'actions/download-artifact@v4',
+    'actions/setup-python@v4': 'actions/setup-python@v5',
+    'github/codeql-action@v2': 'github/codeql-action@v3'
+}
+_DEPRECATED_RE = re.compile(
+    '|'.join(re.escape(action) for action in DEPRECATED_ACTIONS))
+
+# Everything check_transitive_dependencies looks for besides 'uses:' and 'run:'
+_TRANSITIVE_MARKERS_RE = re.compile(
+    r'your-org/|local/|\.github/workflows/|upload-artifact')
+
+
+def newline_offsets(content):
+    """Offsets of every newline in content, for line lookups by bisection"""
+    return [match.start() for match in _NEWLINE_RE.finditer(content)]
+
+
+def line_number(newlines, offset):
+    """1-based line number of offset, given the content's newline_offsets"""
+    return bisect_left(newlines, offset) + 1
+
+
+def check_github_actions_expressions(content, file_path, newlines=None):
     """Check for common GitHub Actions expression issues"""
     issues = []
     
     # Check for hashFiles usage
-    hashfiles_pattern = r"hashFiles\s*\([^)]*\)"
-    matches = re.finditer(hashfiles_pattern, content)
-    
-    for match in matches:
-        line_num = content[:match.start()].count('\n') + 1
+    for match in _HASHFILES_RE.finditer(content):
+        if newlines is None:
+            newlines = newline_offsets(content)
+        line_index = bisect_left(newlines, match.start())
+        line_num = line_index + 1
         matched_text = match.group()
         
         # Check if it's in an if condition and properly formatted
-        line_start = content.rfind('\n', 0, match.start()) + 1
+        line_start = newlines[line_index - 1] + 1 if line_index else 0
         line_end = content.find('\n', match.end())
         if line_end == -1:
             line_end = len(content)
@@ -32,53 +68,63 @@ def check_github_actions_expressions(content, file_path):
             # Check for proper syntax
             if '${{' in line_content and '}}' in line_content:
                 # If wrapped in ${{}}, check if it's correctly formatted
-                if not re.search(r'\$\{\{.*hashFiles.*\}\}', line_content):
+                if not _WRAPPED_HASHFILES_RE.search(line_content):
                     issues.append(f"Line {line_num}: Potentially malformed expression: {line_content}")
             # If not wrapped, check if it follows the simple pattern
-            elif not re.match(r'\s*if:\s*[^$]*$', line_content):
+            elif not _SIMPLE_IF_RE.match(line_content):
                 pass  # This might be OK for simple expressions
         
         print(f"Found hashFiles at line {line_num}: {matched_text}")
     
     return issues
 
-def check_action_versions(content, file_path):
+
+def check_action_versions(content, file_path, newlines=None):
     """Check for deprecated action versions"""
     issues = []
     
-    # Check for deprecated action versions
-    deprecated_actions = {
-        'actions/upload-artifact@v3': 'actions/upload-artifact@v4',
-        'actions/download-artifact@v3': 'actions/download-artifact@v4',
-        'actions/setup-python@v4': 'actions/setup-python@v5',
-        'github/codeql-action@v2': 'github/codeql-action@v3'
-    }
-    
-    for deprecated, recommended in deprecated_actions.items():
-        if deprecated in content:
-            line_num = content[:content.find(deprecated)].count('\n') + 1
+    # Find the first use of each deprecated action in one pass over the file
+    first_seen = {}
+    for match in _DEPRECATED_RE.finditer(content):
+        first_seen.setdefault(match.group(), match.start())
+    
+    for deprecated, recommended in DEPRECATED_ACTIONS.items():
+        if deprecated in first_seen:
+            if newlines is None:
+                newlines = newline_offsets(content)
+            line_num = line_number(newlines, first_seen[deprecated])
             issues.append(f"Line {line_num}: Deprecated action '{deprecated}' should use '{recommended}'")
     
     return issues
 
-def check_matrix_syntax(content, file_path):
+
+def check_matrix_syntax(content, file_path, newlines=None):
     """Check for matrix syntax issues"""
     issues = []
     
     # Look for matrix configurations
     if 'matrix:' in content:
         # Check for any jq usage that could cause issues
-        if 'jq -c .' in content:
-            line_num = content[:content.find('jq -c .')].count('\n') + 1
+        pos = content.find('jq -c .')
+        if pos != -1:
+            if newlines is None:
+                newlines = newline_offsets(content)
+            line_num = line_number(newlines, pos)
             issues.append(f"Line {line_num}: Using 'jq -c .' for JSON compaction - consider removing if JSON is already valid")
         
-        if 'jq -R . | jq -s .' in content:
-            line_num = content[:content.find('jq -R . | jq -s .')].count('\n') + 1
+        pos = content.find('jq -R . | jq -s .')
+        if pos != -1:
+            if newlines is None:
+                newlines = newline_offsets(content)
+            line_num = line_number(newlines, pos)
             issues.append(f"Line {line_num}: Complex jq pipeline - consider manual JSON generation for better reliability")
         
         # Check for potentially problematic printf patterns
-        if 'printf \'"%s"\\n\'' in content:
-            line_num = content[:content.find('printf \'"%s"\\n\'')].count('\n') + 1
+        pos = content.find('printf \'"%s"\\n\'')
+        if pos != -1:
+            if newlines is None:
+                newlines = newline_offsets(content)
+            line_num = line_number(newlines, pos)
             issues.append(f"Line {line_num}: Potentially malformed JSON in matrix generation - double quotes issue")
     
     return issues
@@ -88,16 +134,22 @@ def check_transitive_dependencies(content, file_path):
     issues = []
     warnings = []
     
+    has_uses = 'uses:' in content
+    has_run = 'run:' in content
+    if not (has_uses or has_run):
+        return issues, warnings
+    markers = set(_TRANSITIVE_MARKERS_RE.findall(content))
+
     # Check for custom actions that might use deprecated versions
-    if 'uses:' in content and ('your-org/' in content or 'local/' in content):
+    if has_uses and ('your-org/' in markers or 'local/' in markers):
         warnings.append("Custom actions detected - ensure they don't use deprecated action versions")
     
     # Check for workflow_call or reusable workflows
-    if 'uses:' in content and '.github/workflows/' in content:
+    if has_uses and '.github/workflows/' in markers:
         warnings.append("Reusable workflow detected - verify it doesn't use deprecated actions")
     
     # Check for any embedded YAML or dynamic action generation
-    if 'run:' in content and ('upload-artifact' in content):
+    if has_run and 'upload-artifact' in markers:
         warnings.append("Script contains upload-artifact reference - check for dynamic action usage")
     
     return issues, warnings
@@ -111,11 +163,8 @@ def validate_workflow_file(file_path):
         return False
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Parse YAML
-        yaml_content = yaml.safe_load(content)
+        # Read and parse YAML
+        content, yaml_content = load_workflow(file_path)
         
         # Basic structure validation
         if not isinstance(yaml_content, dict):
@@ -123,11 +172,14 @@ def validate_workflow_file(file_path):
             return False
         
         # Check for GitHub Actions specific issues
-        issues = check_github_actions_expressions(content, file_path)
-        issues += check_action_versions(content, file_path)
-        issues += check_matrix_syntax(content, file_path)
-        issues, warnings = check_transitive_dependencies(content, file_path)
-        issues += issues  # Add any issues from transitive dependency checks
+        # Find the newlines once for every check's line numbers
+        newlines = newline_offsets(content)
+        issues = check_github_actions_expressions(content, file_path, newlines)
+        issues += check_action_versions(content, file_path, newlines)
+        issues += check_matrix_syntax(content, file_path, newlines)
+        transitive_issues, warnings = check_transitive_dependencies(
+            content, file_path)
+        issues += transitive_issues
         
         if issues:
             print(f"Potential issues in {file_path}:")
@@ -162,32 +214,41 @@ def validate_workflow_file(file_path):
         print(f"Error reading {file_path}: {e}")
         return False
 
+
+def validate_workflow_file_captured(file_path):
+    """Validate a workflow file, returning (valid, printed output)"""
+    output = StringIO()
+    with redirect_stdout(output):
+        valid = validate_workflow_file(file_path)
+    return valid, output.getvalue()
+
+
 def main():
     """Main validation function"""
     # Get the project root directory (two levels up from this script)
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(os.path.dirname(script_dir))
     
-    workflow_files = [
-        '.github/workflows/security-comprehensive.yml',
-        '.github/workflows/security-basic.yml', 
-        '.github/workflows/security-compatible.yml',
-        'github-actions-templates/container-security.yml',
-        'github-actions-templates/basic-security.yml',
-        'github-actions-templates/python-security.yml'
-    ]
-    
-    # Convert to absolute paths
-    workflow_files = [os.path.join(project_root, f) for f in workflow_files]
+    workflow_files = [os.path.join(project_root, f) for f in WORKFLOW_FILES]
     
     print("Validating GitHub Actions workflow files...")
     print("=" * 50)
     
+    # Files are independent, so validate them in parallel and print each
+    # file's report in order once it is done
+    workers = min(len(workflow_files), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(validate_workflow_file_captured,
+                                        workflow_files))
+    else:
+        results = map(validate_workflow_file_captured, workflow_files)
+
     all_valid = True
-    for file_path in workflow_files:
-        if not validate_workflow_file(file_path):
+    for valid, output in results:
+        print(output)
+        if not valid:
             all_valid = False
-        print()
     
     print("=" * 50)
     if all_valid:
@@ -197,5 +258,6 @@ def main():
         print("Some workflow files have issues")
         return 1
 
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -4,7 +4,6 @@ Verify the project structure organization
 """
 
 import os
-import glob
 
 def check_folder_structure():
     """Check if the folder structure is organized correctly"""
@@ -17,7 +16,7 @@ def check_folder_structure():
     # Expected folder structure
     expected_structure = {
         "validation/scripts": ["validate_workflows.py", "analyze_actions.py"],
-        "validation/tests": ["test_matrix_logic.py", "test_echo_json.py", "test_json_generation.py"],
+        "validation/tests": ["test_matrix_logic.py", "test_json_workflow.py"],
         "docs/analysis": ["COMPATIBILITY_ANALYSIS.md", "COMPREHENSIVE_ANALYSIS.md"],
         "docs/summaries": ["PROJECT_SUMMARY.md", "BACKWARD_COMPATIBILITY_SUMMARY.md"],
         "docs/validation": ["WORKFLOW_VALIDATION_SUMMARY.md", "JSON_FIX_COMPLETE.md"]
@@ -61,6 +60,18 @@ def check_folder_structure():
     
     return all_good
 
+
+# Icons for the file types show_new_structure lists; other files are left out
+_EXT_ICON = {
+    '.py': "🐍",
+    '.md': "📄",
+    '.yml': "⚙️",
+    '.yaml': "⚙️",
+    '.toml': "🔧",
+}
+# Directories show_new_structure doesn't descend into
+_SKIP_DIRS = frozenset({'__pycache__', '.git', 'node_modules'})
+
 def show_new_structure():
     """Show the new organized structure"""
     
@@ -69,30 +80,36 @@ def show_new_structure():
     
     base_path = "c:\\Users\\2121659\\Shared-libs"
     
-    # Show organized folders
-    for root, dirs, files in os.walk(base_path):
-        level = root.replace(base_path, '').count(os.sep)
+    # Show organized folders, listing each directory once and never stat-ing
+    # entries; the directory listing already says which ones are directories
+    stack = [(base_path, 0)]
+    while stack:
+        path, level = stack.pop()
         indent = ' ' * 2 * level
-        folder_name = os.path.basename(root)
         if level == 0:
             print(f"{indent}📁 SecureFlow-Core/")
         else:
-            print(f"{indent}📁 {folder_name}/")
+            print(f"{indent}📁 {os.path.basename(path)}/")
+
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            continue
         
+        subdirs = []
         subindent = ' ' * 2 * (level + 1)
-        for file in files:
-            if file.endswith(('.py', '.md', '.yml', '.yaml', '.toml')):
-                if file.endswith('.py'):
-                    icon = "🐍"
-                elif file.endswith('.md'):
-                    icon = "📄"
-                elif file.endswith(('.yml', '.yaml')):
-                    icon = "⚙️"
-                elif file.endswith('.toml'):
-                    icon = "🔧"
-                else:
-                    icon = "📄"
-                print(f"{subindent}{icon} {file}")
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS:
+                    subdirs.append(entry.path)
+                continue
+            icon = _EXT_ICON.get(os.path.splitext(entry.name)[1])
+            if icon is not None:
+                print(f"{subindent}{icon} {entry.name}")
+
+        # Visit subdirectories in listing order, like os.walk
+        stack.extend((subdir, level + 1) for subdir in reversed(subdirs))
 
 if __name__ == "__main__":
     check_folder_structure()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Shared loader for GitHub Actions workflow files
+Parses each workflow once per process and reuses the result until the file
+changes; across runs, parsed workflows are kept as JSON in
+validation/.yaml_cache keyed by a hash of their content
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml, use the pure-Python parser
+    from yaml import SafeLoader as _Loader
+
+# Workflow files checked by the validation scripts, relative to the project
+# root
+REPO_WORKFLOW_FILES = (
+    '.github/workflows/security-comprehensive.yml',
+    '.github/workflows/security-basic.yml',
+    '.github/workflows/security-compatible.yml',
+)
+TEMPLATE_WORKFLOW_FILES = (
+    'github-actions-templates/container-security.yml',
+    'github-actions-templates/basic-security.yml',
+    'github-actions-templates/python-security.yml',
+)
+WORKFLOW_FILES = REPO_WORKFLOW_FILES + TEMPLATE_WORKFLOW_FILES
+
+# Parsed workflows by path, with the (mtime, size) they were parsed at
+_yaml_cache = {}
+
+# On-disk cache of parsed workflows, shared by every run of the validation
+# scripts
+YAML_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.yaml_cache')
+YAML_CACHE_VERSION = 'v1'
+
+# JSON object keys must be strings, but YAML 1.1 reads a workflow's 'on:' key
+# as True; mappings with any non-string key are stored as a list of pairs under
+# this key
+_PAIRS_KEY = '__yaml_pairs__'
+
+
+def _to_json(node):
+    """Convert parsed YAML to something JSON can hold without losing key
+    types
+    """
+    if isinstance(node, dict):
+        if (_PAIRS_KEY not in node
+                and all(isinstance(key, str) for key in node)):
+            return {key: _to_json(value) for key, value in node.items()}
+        return {_PAIRS_KEY: [[_to_json(key), _to_json(value)]
+                             for key, value in node.items()]}
+    if isinstance(node, list):
+        return [_to_json(item) for item in node]
+    return node
+
+
+def _from_json_object(obj):
+    if len(obj) == 1 and _PAIRS_KEY in obj:
+        return {key: value for key, value in obj[_PAIRS_KEY]}
+    return obj
+
+
+def _cache_path(file_path, content):
+    digest = hashlib.blake2b(content.encode('utf-8'),
+                             digest_size=16).hexdigest()
+    name = os.path.basename(file_path)
+    return os.path.join(YAML_CACHE_DIR,
+                        f"{name}.{YAML_CACHE_VERSION}.{digest}.json")
+
+
+def _read_cached(cache_path):
+    """Return the cached parse of a workflow, or None if there isn't a usable
+    one
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f, object_hook=_from_json_object)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached(cache_path, yaml_content):
+    """Store a parsed workflow for later runs; failing to do so isn't an
+    error
+    """
+    try:
+        data = json.dumps(_to_json(yaml_content), separators=(',', ':'))
+    except (TypeError, ValueError):
+        # Dates and other values JSON can't represent; parse this file every
+        # run
+        return
+
+    try:
+        if not os.path.isdir(YAML_CACHE_DIR):
+            os.makedirs(YAML_CACHE_DIR, exist_ok=True)
+            with open(os.path.join(YAML_CACHE_DIR, '.gitignore'), 'w') as f:
+                f.write('*\n')
+
+        # Drop entries for earlier versions of this file
+        prefix = cache_path.rsplit('.', 2)[0]
+        for stale in glob.glob(glob.escape(prefix) + '.*.json'):
+            if stale != cache_path:
+                os.remove(stale)
+
+        # Write then rename, so parallel validators never read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=YAML_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def load_workflow(file_path):
+    """Read and parse a workflow file, returning (content, parsed YAML)"""
+    stat = os.stat(file_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _yaml_cache.get(file_path)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    cache_path = _cache_path(file_path, content)
+    yaml_content = _read_cached(cache_path)
+    if yaml_content is None:
+        yaml_content = yaml.load(content, Loader=_Loader)
+        _write_cached(cache_path, yaml_content)
+
+    _yaml_cache[file_path] = (key, content, yaml_content)
+    return content, yaml_content
+
+
+def workflow_events(file_path):
+    """Stream the YAML parser events of a workflow file without building the
+    document
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        yield from yaml.parse(f, Loader=_Loader)
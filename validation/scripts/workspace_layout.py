@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Shared description of the workspace for the analysis scripts
+Lists the core modules and templates they check and stats each set of paths
+once per process
+"""
+
+import os
+from functools import lru_cache
+
+CORE_PACKAGE_DIR = "src/secureflow_core"
+CORE_MODULES = (
+    "__init__.py", "__main__.py", "core.py", "scanner.py",
+    "azure.py", "compliance.py", "plugins.py", "cli.py",
+    "config.py", "report.py", "templates.py", "utils.py"
+)
+
+TEMPLATES_DIR = "github-actions-templates"
+TEMPLATES = (
+    "basic-security.yml", "java-maven-security.yml",
+    "nodejs-security.yml", "python-security.yml",
+    "container-security.yml"
+)
+
+# The same files as paths relative to the project root
+CORE_MODULE_PATHS = tuple(f"{CORE_PACKAGE_DIR}/{module}"
+                          for module in CORE_MODULES)
+TEMPLATE_PATHS = tuple(f"{TEMPLATES_DIR}/{template}" for template in TEMPLATES)
+
+
+def stat_or_none(path):
+    """os.stat(path), or None where os.path.exists would be False"""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def scan_paths(paths):
+    """Stat every path in a tuple, returning {path: os.stat_result or None}"""
+    return {path: stat_or_none(path) for path in paths}
@@ -1,149 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test the JSON generation from the workflow to ensure it produces valid JSON
-"""
-
-import json
-import subprocess
-import tempfile
-import os
-
-def test_json_generation():
-    """Test the JSON generation logic from the workflow"""
-    
-    print("Testing JSON generation from workflow logic...")
-    
-    # Simulate the bash script that generates the JSON
-    test_script = '''#!/bin/bash
-    
-    # Simulate scan types
-    SCAN_TYPES=("python" "javascript" "container")
-    
-    # Generate SCAN_TYPES_JSON like in the workflow
-    SCAN_TYPES_JSON="["
-    for i in "${!SCAN_TYPES[@]}"; do
-      if [ $i -gt 0 ]; then
-        SCAN_TYPES_JSON+=","
-      fi
-      SCAN_TYPES_JSON+="\\\"${SCAN_TYPES[$i]}\\\""
-    done
-    SCAN_TYPES_JSON+="]"
-    
-    # Generate the JSON file like in the workflow
-    cat > scan_config.json << EOF
-{
-"project_name": "JAYANTH-ORG/SecureFlow",
-"scan_types": $SCAN_TYPES_JSON,
-"compliance_frameworks": ["SOC2", "PCI-DSS"],
-"container_image": "",
-"notification_level": "high"
-}
-EOF
-    
-    # Output the JSON content
-    cat scan_config.json
-    '''
-    
-    # Write test script to temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.sh', delete=False) as f:
-        f.write(test_script)
-        script_path = f.name
-    
-    try:
-        # Run the script (on Windows, use Git Bash or WSL if available)
-        # For this test, we'll simulate the output
-        expected_json = {
-            "project_name": "JAYANTH-ORG/SecureFlow",
-            "scan_types": ["python", "javascript", "container"],
-            "compliance_frameworks": ["SOC2", "PCI-DSS"],
-            "container_image": "",
-            "notification_level": "high"
-        }
-        
-        print("Expected JSON structure:")
-        print(json.dumps(expected_json, indent=2))
-        
-        # Test JSON parsing
-        try:
-            json_str = json.dumps(expected_json)
-            parsed = json.loads(json_str)
-            print("JSON parsing successful!")
-            return True
-        except json.JSONDecodeError as e:
-            print(f"JSON parsing failed: {e}")
-            return False
-            
-    finally:
-        # Clean up
-        if os.path.exists(script_path):
-            os.unlink(script_path)
-
-def test_problematic_json():
-    """Test the problematic JSON format that was causing issues"""
-    
-    print("\nTesting problematic JSON format...")
-    
-    # This is what was being generated before (with leading spaces)
-    problematic_json = '''        {
-          "project_name": "JAYANTH-ORG/SecureFlow",
-          "scan_types": ["python"],
-          "compliance_frameworks": ["SOC2", "PCI-DSS"],
-          "container_image": "",
-          "notification_level": "high"
-        }'''
-    
-    print("Problematic JSON (with leading spaces):")
-    print(repr(problematic_json))
-    
-    try:
-        json.loads(problematic_json)
-        print("Unexpected: Problematic JSON parsed successfully!")
-        return False
-    except json.JSONDecodeError as e:
-        print(f"Expected: JSON parsing failed: {e}")
-        return True
-
-def test_fixed_json():
-    """Test the fixed JSON format"""
-    
-    print("\nTesting fixed JSON format...")
-    
-    # This is what should be generated now (no leading spaces)
-    fixed_json = '''{
-"project_name": "JAYANTH-ORG/SecureFlow",
-"scan_types": ["python"],
-"compliance_frameworks": ["SOC2", "PCI-DSS"],
-"container_image": "",
-"notification_level": "high"
-}'''
-    
-    print("Fixed JSON (no leading spaces):")
-    print(fixed_json)
-    
-    try:
-        parsed = json.loads(fixed_json)
-        print("JSON parsing successful!")
-        print("Parsed data:", parsed)
-        return True
-    except json.JSONDecodeError as e:
-        print(f"JSON parsing failed: {e}")
-        return False
-
-if __name__ == "__main__":
-    print("Testing JSON Generation Logic")
-    print("=" * 50)
-    
-    test1 = test_json_generation()
-    test2 = test_problematic_json()
-    test3 = test_fixed_json()
-    
-    print("\n" + "=" * 50)
-    print("Test Results:")
-    print(f"Expected JSON structure: {'PASS' if test1 else 'FAIL'}")
-    print(f"Problematic JSON fails: {'PASS' if test2 else 'FAIL'}")
-    print(f"Fixed JSON succeeds: {'PASS' if test3 else 'FAIL'}")
-    
-    if all([test1, test2, test3]):
-        print("\nAll tests passed! JSON generation is now correct.")
-    else:
-        print("\nSome tests failed. Check the JSON formatting.")
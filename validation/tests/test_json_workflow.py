@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test the JSON the security workflow generates for its scan configuration
+"""
+
+import json
+import re
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+
+import pytest
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib codec
+    orjson = None
+
+# The scan configuration the workflow should write
+EXPECTED_CONFIG = {
+    "project_name": "JAYANTH-ORG/SecureFlow",
+    "scan_types": ["python", "javascript", "container"],
+    "compliance_frameworks": ["SOC2", "PCI-DSS"],
+    "container_image": "",
+    "notification_level": "high"
+}
+
+# What the heredoc was generating before (with leading spaces)
+PROBLEMATIC_JSON = '''        {
+          "project_name": "JAYANTH-ORG/SecureFlow",
+          "scan_types": ["python"],
+          "compliance_frameworks": ["SOC2", "PCI-DSS"],
+          "container_image": "",
+          "notification_level": "high"
+        }'''
+
+# What the heredoc should generate now (no leading spaces)
+FIXED_JSON = '''{
+"project_name": "JAYANTH-ORG/SecureFlow",
+"scan_types": ["python"],
+"compliance_frameworks": ["SOC2", "PCI-DSS"],
+"container_image": "",
+"notification_level": "high"
+}'''
+
+# The config as the workflow's echo commands write it, scan types fragment
+# spliced in
+ECHO_JSON = (
+    '{"project_name":"JAYANTH-ORG/SecureFlow",'
+    '"scan_types":["python","javascript","container"],'
+    '"compliance_frameworks":["SOC2","PCI-DSS"],'
+    '"container_image":"",'
+    '"notification_level":"high"}'
+)
+
+# Template with GitHub Actions variables, and what GitHub Actions would
+# substitute
+GHA_TEMPLATE = '''{
+"project_name": "${{ github.repository }}",
+"scan_types": ["python"],
+"compliance_frameworks": ["SOC2", "PCI-DSS"],
+"container_image": "${{ github.event.inputs.container_image }}",
+"notification_level": "${{ github.event.inputs.notification_level || 'high' }}"
+}'''
+GHA_VARIABLES = {
+    "${{ github.repository }}": "JAYANTH-ORG/SecureFlow",
+    "${{ github.event.inputs.container_image }}": "",
+    "${{ github.event.inputs.notification_level || 'high' }}": "high"
+}
+
+# A GitHub Actions expression such as ${{ github.repository }}
+_GHA_VAR_RE = re.compile(r"\$\{\{\s*[^}]+?\s*\}\}")
+
+
+def substitute(template, variables):
+    """Simulate GitHub Actions variable substitution, in one pass over the
+    template
+    """
+    return _GHA_VAR_RE.sub(
+        lambda match: variables.get(match.group(0), match.group(0)), template)
+
+
+SUBSTITUTED_JSON = substitute(GHA_TEMPLATE, GHA_VARIABLES)
+
+# The inputs are constants, so parse each one once however often the tests run;
+# failures aren't cached and raise again on every call
+parse_json = lru_cache(maxsize=None)(
+    orjson.loads if orjson is not None else json.loads)
+
+
+@pytest.mark.parametrize("payload", [
+    pytest.param(FIXED_JSON, id="fixed"),
+    # JSON parsers skip leading whitespace, so the format the workflow used to
+    # produce parses too; it stays as a record of that format
+    pytest.param(PROBLEMATIC_JSON, id="problematic"),
+    pytest.param(ECHO_JSON, id="echo"),
+    pytest.param(SUBSTITUTED_JSON, id="substituted"),
+])
+def test_parse(payload):
+    """Test that each of the workflow's JSON formats parses"""
+    assert parse_json(payload)["project_name"] == "JAYANTH-ORG/SecureFlow"
+
+
+def test_echo_json_generation():
+    """Test the echo-based JSON generation"""
+    assert parse_json(ECHO_JSON) == EXPECTED_CONFIG
+
+
+def test_variable_substitution():
+    """Test that GitHub Actions variable substitution won't break JSON"""
+    parsed = parse_json(SUBSTITUTED_JSON)
+    assert parsed["container_image"] == ""
+    assert parsed["notification_level"] == "high"
+
+
+@pytest.mark.skipif(shutil.which('bash') is None,
+                    reason="bash is not available")
+def test_json_generation():
+    """Test the JSON generation logic from the workflow"""
+
+    # Simulate the bash script that generates the JSON
+    test_script = '''#!/bin/bash
+
+    # Simulate scan types
+    SCAN_TYPES=("python" "javascript" "container")
+
+    # Generate SCAN_TYPES_JSON like in the workflow
+    SCAN_TYPES_JSON="["
+    for i in "${!SCAN_TYPES[@]}"; do
+      if [ $i -gt 0 ]; then
+        SCAN_TYPES_JSON+=","
+      fi
+      SCAN_TYPES_JSON+="\\\"${SCAN_TYPES[$i]}\\\""
+    done
+    SCAN_TYPES_JSON+="]"
+
+    # Generate the JSON like in the workflow, straight to stdout
+    cat << EOF
+{
+"project_name": "JAYANTH-ORG/SecureFlow",
+"scan_types": $SCAN_TYPES_JSON,
+"compliance_frameworks": ["SOC2", "PCI-DSS"],
+"container_image": "",
+"notification_level": "high"
+}
+EOF
+    '''
+
+    result = subprocess.run(['bash', '-c', test_script],
+                            capture_output=True, text=True, check=True)
+    assert parse_json(result.stdout) == EXPECTED_CONFIG
+
+
+if __name__ == "__main__":
+    # The project's addopts (coverage, plugins) are for the main suite
+    sys.exit(pytest.main(["-o", "addopts=", __file__] + sys.argv[1:]))
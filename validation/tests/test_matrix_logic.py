@@ -3,6 +3,13 @@
 Test script to simulate the exact matrix generation logic from the workflow
 """
 
+import json
+
+# Marker files that enable each scan type
+_PY_MARKERS = frozenset({"requirements.txt", "pyproject.toml"})
+_JS_MARKERS = frozenset({"package.json", "yarn.lock", "package-lock.json"})
+_CONTAINER_MARKERS = frozenset({"Dockerfile", "docker-compose.yml"})
+
 def simulate_matrix_generation():
     """Simulate the bash script logic for matrix generation"""
     
@@ -36,25 +43,24 @@ def simulate_matrix_generation():
         
         # Simulate the detection logic
         scan_types = []
+        files = frozenset(test['files'])
         
         # Check for Python
-        if any(f.endswith('.py') for f in test['files']) or 'requirements.txt' in test['files'] or 'pyproject.toml' in test['files']:
+        if (not files.isdisjoint(_PY_MARKERS)
+                or any(f.endswith('.py') for f in files)):
             scan_types.append("python")
         
         # Check for JavaScript
-        if 'package.json' in test['files'] or 'yarn.lock' in test['files'] or 'package-lock.json' in test['files']:
+        if not files.isdisjoint(_JS_MARKERS):
             scan_types.append("javascript")
         
         # Check for containers
-        if 'Dockerfile' in test['files'] or 'docker-compose.yml' in test['files']:
+        if not files.isdisjoint(_CONTAINER_MARKERS):
             scan_types.append("container")
         
         # Generate matrix JSON
-        if len(scan_types) == 0:
-            matrix_json = '{"scan_type":["general"]}'
-        else:
-            json_array = "[" + ",".join(f'"{scan_type}"' for scan_type in scan_types) + "]"
-            matrix_json = f'{{"scan_type":{json_array}}}'
+        matrix_json = json.dumps({"scan_type": scan_types or ["general"]},
+                                 separators=(",", ":"))
         
         print(f"Generated matrix: {matrix_json}")
         print(f"Expected scan types: {test['expected']}")